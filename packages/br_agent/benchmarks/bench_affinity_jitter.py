@@ -0,0 +1,62 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from br_agent.placement import Placement
+from br_sdk.metrics import format_latency
+
+LOAD = "while True: pass"
+
+# periodic 1 ms task standing in for a SYNC stream reader; records how late each wakeup is
+PERIODIC = """
+import json, sys, time
+from br_sdk.metrics import LatencyHistogram
+period_ns, end = 1_000_000, time.monotonic_ns() + int(float(sys.argv[1]) * 1e9)
+lateness = LatencyHistogram()
+deadline = time.monotonic_ns() + period_ns
+while deadline < end:
+    time.sleep(max(deadline - time.monotonic_ns(), 0) / 1e9)
+    lateness.record(max(time.monotonic_ns() - deadline, 0))
+    deadline += period_ns
+print(json.dumps(lateness.snapshot()))
+"""
+
+
+def measure(duration: float, load: int, placement: Placement | None) -> dict:
+    loads = [subprocess.Popen([sys.executable, "-c", LOAD]) for _ in range(load)]
+    try:
+        if placement:
+            for pid in (proc.pid for proc in loads):
+                for error in placement.apply(pid, slot=1):
+                    print(error, file=sys.stderr)
+        periodic = subprocess.Popen([sys.executable, "-c", PERIODIC, str(duration)], stdout=subprocess.PIPE)
+        if placement:
+            for error in placement.apply(periodic.pid, slot=0):
+                print(error, file=sys.stderr)
+        out, _ = periodic.communicate()
+        return json.loads(out)
+    finally:
+        for proc in loads:
+            proc.kill()
+            proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare wakeup jitter of a 1 ms periodic task, pinned and unpinned")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per measurement")
+    parser.add_argument("--load", type=int, default=os.cpu_count() or 2, help="Number of busy-looping processes")
+    parser.add_argument("--cpu", type=int, default=(os.cpu_count() or 2) - 1, help="CPU reserved for the task")
+    parser.add_argument("--nice", type=int, default=None, help="Nice value of the task when pinned")
+    args = parser.parse_args()
+
+    others = set(range(os.cpu_count() or 1)) - {args.cpu}
+    placement = Placement(slot_cpus=[{args.cpu}, others or {args.cpu}], nice=args.nice)
+    print(f"{args.load} busy processes, {args.duration:.1f} s per run")
+    print(format_latency("unpinned lateness", measure(args.duration, args.load, None)))
+    print(format_latency("pinned lateness", measure(args.duration, args.load, placement)))
+
+
+if __name__ == "__main__":
+    main()
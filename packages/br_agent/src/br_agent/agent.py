@@ -1,38 +1,131 @@
 import asyncio
 import os
+import re
+import sys
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import count
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+from br_sdk.events import EVENT_SOCKET_ENV
 
 from br_agent.env_manager import EnvManager
+from br_agent.journal import Journal, process_start_time, reap_orphan
+from br_agent.output import OutputCapture
+from br_agent.placement import Placement, placement_command
+from br_agent.process import start_child
+from br_agent.resources import ResourceScheduler
+from br_agent.sampler import ResourceUsage, read_sample
+from br_agent.worker_pool import WorkerPool, WorkerProcess
 
 
 class SeqStatus(str, Enum):
     PENDING = "PENDING"
+    PREPARING = "PREPARING"
     RUNNING = "RUNNING"
     COMPLETED = "COMPLETED"
     FAILED = "FAILED"
+    SKIPPED = "SKIPPED"
+    CANCELLED = "CANCELLED"
 
 
 @dataclass
 class SeqRuntime:
     name: str
     cfg_path: Path
+    id: str = ""
+    depends_on: list[str] = field(default_factory=list)
+    resources: list[str] = field(default_factory=list)
     status: SeqStatus = SeqStatus.PENDING
     pid: Optional[int] = None
     started_at: Optional[datetime] = None
     ended_at: Optional[datetime] = None
-    proc: Optional[asyncio.subprocess.Process] = field(default=None, repr=False)
+    lease_wait: Optional[float] = None
+    pid_start: Optional[int] = None
+    blocked_on: list[str] = field(default_factory=list)
+    proc: Optional[asyncio.subprocess.Process | WorkerProcess] = field(default=None, repr=False)
     out_task: Optional[asyncio.Task] = field(default=None, repr=False)
     err_task: Optional[asyncio.Task] = field(default=None, repr=False)
+    output: Optional[OutputCapture] = field(default=None, repr=False)
+    log_path: Optional[Path] = None
+    usage: Optional[ResourceUsage] = field(default=None, repr=False)
+    slot: Optional[int] = None
+    cancel_requested: bool = field(default=False, repr=False)
+
+    def __post_init__(self):
+        self.id = self.id or self.name
+
+
+def _usage_row(usage: Optional[ResourceUsage]) -> dict[str, str]:
+    if usage is None or not usage.samples:
+        return {"cpu_s": "", "cpu_pct": "", "rss_mb": "", "io_mb": ""}
+    mb = 1024 * 1024
+    io = ""
+    if usage.read_bytes is not None:
+        io = f"{usage.read_bytes / mb:.1f} / {usage.write_bytes / mb:.1f}"
+    return {
+        "cpu_s": f"{usage.cpu_seconds:.2f}",
+        "cpu_pct": f"{usage.cpu_avg:.0f} / {usage.cpu_peak:.0f}",
+        "rss_mb": f"{usage.rss_avg / mb:.1f} / {usage.rss_peak / mb:.1f}",
+        "io_mb": io,
+    }
+
+
+_BLOCKING = (SeqStatus.FAILED, SeqStatus.SKIPPED, SeqStatus.CANCELLED)
+
+
+def _safe_name(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", value)
+
+
+class SequenceHandle:
+    def __init__(self, agent: "Agent", runtime: SeqRuntime):
+        loop = asyncio.get_running_loop()
+        self.runtime = runtime
+        self.started: asyncio.Future = loop.create_future()
+        self.finished: asyncio.Future = loop.create_future()
+        self._agent = agent
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def id(self) -> str:
+        return self.runtime.id
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.runtime.pid
+
+    @property
+    def status(self) -> SeqStatus:
+        return self.runtime.status
+
+    def done(self) -> bool:
+        return self.finished.done()
+
+    def __await__(self):
+        return asyncio.shield(self.finished).__await__()
+
+    async def cancel(self, grace: float = 5.0) -> SeqStatus:
+        return await self._agent.cancel(self.id, grace)
+
+    def _finish(self):
+        if not self.started.done():
+            self.started.set_result(self.runtime.pid)
+        if not self.finished.done():
+            self.finished.set_result(self.runtime.status)
 
 
 @dataclass
 class TestSpec:
     name: str
     config_path: Path
+    id: Optional[str] = None
+    depends_on: list[str] = field(default_factory=list)
+    resources: list[str] = field(default_factory=list)
+
 
 class Agent:
     def __init__(
@@ -40,91 +133,437 @@ class Agent:
         tests: list[TestSpec],
         env_manager: EnvManager,
         required_packages: list[str],
+        max_parallel: int = 1,
+        resources: dict[str, int] | None = None,
+        env_concurrency: int = 2,
+        warm_workers: bool = False,
+        output_dir: Path | None = None,
+        journal: Journal | None = None,
+        sample_interval: float = 1.0,
+        placement: Placement | None = None,
     ):
+        if max_parallel < 1:
+            raise ValueError("max_parallel must be at least 1")
         self.env_mgr = env_manager
         self.required_packages = required_packages
+        self.max_parallel = max_parallel
+        self.output_dir = output_dir
+        self.journal = journal
+        self.sample_interval = sample_interval
+        self.placement = placement or Placement()
+        self._sampler: Optional[asyncio.Task] = None
+        self._listeners: list[Callable[[SeqRuntime], None]] = []
+        self.scheduler = ResourceScheduler(resources)
+        self._env_semaphore = asyncio.Semaphore(max(env_concurrency, 1))
+        self._env_tasks: dict[str, asyncio.Task] = {}
+        self.worker_pool = WorkerPool() if warm_workers and os.name == "posix" else None
         self.runtime: list[SeqRuntime] = []
+        self.handles: dict[str, SequenceHandle] = {}
+        self._index: dict[str, int] = {}
 
         for spec in tests:
             cfg = spec.config_path
             if not cfg.exists():
                 raise FileNotFoundError(f"Config file not found: {cfg}")
-            self.runtime.append(SeqRuntime(name=spec.name, cfg_path=cfg))
+            rt = SeqRuntime(
+                name=spec.name,
+                cfg_path=cfg,
+                id=spec.id or spec.name,
+                depends_on=list(spec.depends_on),
+                resources=list(spec.resources),
+            )
+            if rt.id in self._index:
+                raise ValueError(f"Duplicate test id '{rt.id}' in plan")
+            self._index[rt.id] = len(self.runtime)
+            self.runtime.append(rt)
+        self._validate_dependencies()
 
-    async def start_sequence(self, index: int):
-        allowed_idx = self.next_allowed()
-        if allowed_idx is None:
-            raise RuntimeError("All sequences completed")
-        if index != allowed_idx:
+    async def start_sequence(self, index: int) -> SequenceHandle:
+        handle = self.launch(index)
+        await asyncio.shield(handle.started)
+        return handle
+
+    def launch(self, index: int) -> SequenceHandle:
+        rt = self.runtime[index]
+        if rt.status != SeqStatus.PENDING:
+            raise RuntimeError(f"Cannot start '{rt.id}'. Status is {rt.status.value}")
+        if index not in self.ready():
             raise RuntimeError(
-                f"Cannot start '{self.runtime[index].name}'. "
-                f"Next allowed is '{self.runtime[allowed_idx].name}'"
+                f"Cannot start '{rt.id}'. Dependencies, resources or parallelism limit are not satisfied"
             )
-        if self.is_busy():
-            raise RuntimeError("A sequence is already running")
-        
-        rt = self.runtime[index]
-        py = self.env_mgr.ensure_env(
-            sequence_name=rt.name,
-            requirements=self.required_packages,
-        )
 
-        cmd = [str(py), "-m", "br_cli.main", "--sequence", rt.name, "--config", str(rt.cfg_path)]
-        rt.proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=os.environ.copy(),
-        )
+        # lease and status are taken before any await so the test cannot be launched twice
+        lease = self.scheduler.acquire(rt.id)
+        rt.lease_wait = lease.wait
+        rt.blocked_on = lease.blocked_on
+        rt.slot = self._free_slot()
+        self._set_status(rt, SeqStatus.PREPARING)
+        handle = SequenceHandle(self, rt)
+        handle._task = asyncio.create_task(self._run(rt, handle))
+        handle._task.add_done_callback(lambda task: self._on_run_cancelled(rt, handle, task))
+        self.handles[rt.id] = handle
+        return handle
+
+    async def _run(self, rt: SeqRuntime, handle: SequenceHandle):
+        try:
+            # the env task is shared with other tests of the same sequence and must survive a cancel
+            py = await asyncio.shield(self._env_task(rt.name))
+
+            args = ["--sequence", rt.name, "--config", str(rt.cfg_path)]
+            env = os.environ.copy()
+            env[EVENT_SOCKET_ENV] = str(self.event_socket(rt.id))
+            placement = self.placement.settings(rt.slot) if self.placement.enabled else None
+            spawn = asyncio.ensure_future(self._spawn(py, args, env, placement))
+            try:
+                rt.proc = await asyncio.shield(spawn)
+            except asyncio.CancelledError:
+                # the child may already be forked, it must not outlive the cancelled test
+                await self._discard_spawn(spawn)
+                raise
+        except Exception as exc:
+            self.scheduler.release(rt.id)
+            rt.ended_at = datetime.now()
+            self._set_status(rt, SeqStatus.FAILED)
+            print(f"Could not start '{rt.id}': {exc}", file=sys.stderr)
+            handle._finish()
+            return
         rt.pid = rt.proc.pid
+        rt.pid_start = process_start_time(rt.pid)
         rt.started_at = datetime.now()
-        rt.status = SeqStatus.RUNNING
+        rt.usage = ResourceUsage()
+        self._sample(rt)
+        self._start_sampler()
+        self._set_status(rt, SeqStatus.RUNNING)
+        handle.started.set_result(rt.pid)
+        if self.output_dir:
+            rt.log_path = self.output_dir / f"{_safe_name(rt.id)}.log"
+        rt.output = OutputCapture(rt.log_path, prefix=f"[{rt.id}] " if self.max_parallel > 1 else "")
+        rt.output.start()
         if rt.proc.stdout:
-            rt.out_task = asyncio.create_task(self._forward_stream(rt.proc.stdout, is_err=False))
+            rt.out_task = asyncio.create_task(rt.output.forward(rt.proc.stdout, is_err=False))
         if rt.proc.stderr:
-            rt.err_task = asyncio.create_task(self._forward_stream(rt.proc.stderr, is_err=True))
+            rt.err_task = asyncio.create_task(rt.output.forward(rt.proc.stderr, is_err=True))
+
+        try:
+            await self._wait_and_finalize(rt)
+        except Exception as exc:
+            self.scheduler.release(rt.id)
+            rt.ended_at = rt.ended_at or datetime.now()
+            print(f"Could not finalize '{rt.id}': {exc}", file=sys.stderr)
+            self._set_status(rt, SeqStatus.FAILED)
+        finally:
+            # the plan loop waits on the handle. A test cancelled while still running is
+            # finished by _on_run_cancelled.
+            if rt.status != SeqStatus.RUNNING:
+                handle._finish()
+
+    def _on_run_cancelled(self, rt: SeqRuntime, handle: SequenceHandle, task: asyncio.Task):
+        # also covers a task cancelled before it ever ran
+        if not task.cancelled() or handle.done():
+            return
+        self.scheduler.release(rt.id)
+        rt.ended_at = datetime.now()
+        self._set_status(rt, SeqStatus.CANCELLED)
+        handle._finish()
+
+    async def wait_any(self, timeout: Optional[float] = None) -> set[SequenceHandle]:
+        pending = {handle.finished: handle for handle in self.handles.values() if not handle.done()}
+        if not pending:
+            return set()
+        done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        return {pending[future] for future in done}
+
+    async def wait_all(self, timeout: Optional[float] = None) -> bool:
+        pending = [handle.finished for handle in self.handles.values() if not handle.done()]
+        if not pending:
+            return True
+        _, not_done = await asyncio.wait(pending, timeout=timeout)
+        return not not_done
+
+    async def cancel(self, test_id: str, grace: float = 5.0) -> SeqStatus:
+        rt = self._dependency(test_id)
+        handle = self.handles.get(test_id)
+        if handle is None:
+            if rt.status == SeqStatus.PENDING:
+                self.scheduler.cancel(rt.id)
+                self._set_status(rt, SeqStatus.CANCELLED)
+            return rt.status
+        if handle.done():
+            return rt.status
+
+        rt.cancel_requested = True
+        if rt.status == SeqStatus.PREPARING:
+            handle._task.cancel()
+        elif rt.proc and rt.proc.returncode is None:
+            rt.proc.terminate()
+            try:
+                await asyncio.wait_for(asyncio.shield(handle.finished), grace)
+            except asyncio.TimeoutError:
+                rt.proc.kill()
+        return await handle
+
+    async def cancel_all(self, grace: float = 5.0):
+        for rt in self.runtime:
+            if rt.status == SeqStatus.PENDING:
+                await self.cancel(rt.id)
+        await asyncio.gather(*(self.cancel(test_id, grace) for test_id in list(self.handles)))
+
+    def event_socket(self, test_id: str) -> Path:
+        # concurrent children must not share (and unlink) the same event socket
+        return Path(tempfile.gettempdir()) / f"benderr_events_{_safe_name(test_id)}.sock"
 
-        asyncio.create_task(self._wait_and_finalize(rt))
-        return rt.pid
+    async def _spawn(self, py: Path, args: list[str], env: dict[str, str], placement: Optional[dict] = None):
+        # placement is applied inside the child before it runs, so all of its threads inherit it
+        if self.worker_pool:
+            try:
+                return await self.worker_pool.spawn(py, "br_cli.main", args, env, placement=placement)
+            except (OSError, RuntimeError) as exc:
+                print(f"Warm worker unavailable, starting a new interpreter: {exc}", file=sys.stderr)
+        cmd = [str(py), "-m", "br_cli.main", *args]
+        if placement:
+            cmd = placement_command(placement, cmd)
+        if hasattr(os, "pidfd_open"):
+            # reaped by the agent itself, so the exit resource usage is known
+            return await start_child(cmd, env)
+        return await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
+
+    async def _discard_spawn(self, spawn: asyncio.Future, grace: float = 5.0):
+        try:
+            proc = await spawn
+        except Exception:
+            return
+        try:
+            proc.terminate()
+            await asyncio.wait_for(proc.wait(), grace)
+        except ProcessLookupError:
+            pass
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+
+    async def close(self):
+        if self._sampler:
+            self._sampler.cancel()
+            self._sampler = None
+        if self.worker_pool:
+            await self.worker_pool.close()
+
+    def prepare_envs(self):
+        # start building every distinct env now so installs overlap with earlier tests
+        for rt in self.runtime:
+            if rt.status == SeqStatus.PENDING:
+                self._env_task(rt.name)
+
+    def _env_task(self, sequence_name: str) -> asyncio.Task:
+        task = self._env_tasks.get(sequence_name)
+        if task is None:
+            task = asyncio.create_task(self._prepare_env(sequence_name))
+            # failures are reported when a sequence awaits the env, not by the loop
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._env_tasks[sequence_name] = task
+        return task
+
+    async def collect_envs(self, budget: int) -> list[str]:
+        # envs being built are not evictable yet, so only collect once all of them are prepared.
+        # asyncio.wait, unlike gather, leaves the env tasks running when this task is cancelled.
+        if self._env_tasks:
+            await asyncio.wait(list(self._env_tasks.values()))
+        # every env of the plan stays, also those of failed and cancelled tests
+        keep = {rt.name for rt in self.runtime} | set(self._env_tasks)
+        evict = asyncio.ensure_future(asyncio.to_thread(self.env_mgr.collect_garbage, budget, keep))
+        try:
+            return await asyncio.shield(evict)
+        except OSError as exc:
+            print(f"Environment cleanup failed: {exc}", file=sys.stderr)
+            return []
+        except asyncio.CancelledError:
+            # the eviction thread cannot be interrupted, do not return while it still deletes envs
+            await asyncio.wait([evict])
+            raise
+
+    async def _prepare_env(self, sequence_name: str) -> Path:
+        async with self._env_semaphore:
+            py = await asyncio.to_thread(
+                self.env_mgr.ensure_env,
+                sequence_name=sequence_name,
+                requirements=self.required_packages,
+            )
+        if self.worker_pool:
+            # warm the interpreter while earlier tests are still running
+            try:
+                await self.worker_pool.get(py)
+            except (OSError, RuntimeError) as exc:
+                print(f"Could not start warm worker for '{sequence_name}': {exc}", file=sys.stderr)
+        return py
+
+    def _free_slot(self) -> int:
+        used = {rt.slot for rt in self.runtime if rt.status in (SeqStatus.PREPARING, SeqStatus.RUNNING)}
+        return next(slot for slot in count() if slot not in used)
+
+    def _start_sampler(self):
+        if self.sample_interval <= 0 or not sys.platform.startswith("linux"):
+            return
+        if self._sampler is None or self._sampler.done():
+            self._sampler = asyncio.create_task(self._sample_running())
+
+    async def _sample_running(self):
+        # one timer for all children; it stops once nothing is running
+        while True:
+            await asyncio.sleep(self.sample_interval)
+            running = [rt for rt in self.runtime if rt.status == SeqStatus.RUNNING and rt.pid]
+            if not running:
+                return
+            for rt in running:
+                self._sample(rt)
+
+    def _sample(self, rt: SeqRuntime):
+        sample = read_sample(rt.pid) if rt.usage else None
+        if sample:
+            rt.usage.add(sample)
 
     async def _wait_and_finalize(self, rt: SeqRuntime):
         rc = await rt.proc.wait()
+        exit_usage = getattr(rt.proc, "exit_usage", None)
+        if rt.usage and exit_usage:
+            rt.usage.finish(exit_usage)
+        self.scheduler.release(rt.id)
         rt.ended_at = datetime.now()
-        rt.status = SeqStatus.COMPLETED if rc == 0 else SeqStatus.FAILED
+        if rt.cancel_requested:
+            self._set_status(rt, SeqStatus.CANCELLED)
+        else:
+            self._set_status(rt, SeqStatus.COMPLETED if rc == 0 else SeqStatus.FAILED)
         # let readers finish
         if rt.out_task:
             await rt.out_task
         if rt.err_task:
             await rt.err_task
+        await rt.output.close()
+
+    def add_listener(self, callback: Callable[[SeqRuntime], None]):
+        self._listeners.append(callback)
+
+    def index_of(self, test_id: str) -> Optional[int]:
+        return self._index.get(test_id)
+
+    def _set_status(self, rt: SeqRuntime, status: SeqStatus):
+        rt.status = status
+        if self.journal:
+            self.journal.record({
+                "id": rt.id, "status": status.value, "pid": rt.pid, "pid_start": rt.pid_start,
+                "started_at": rt.started_at.isoformat() if rt.started_at else None,
+                "ended_at": rt.ended_at.isoformat() if rt.ended_at else None,
+                "usage": rt.usage.summary() if rt.usage else None,
+            })
+        for callback in self._listeners:
+            callback(rt)
+
+    def restore(self, records: dict[str, dict]) -> list[str]:
+        # finished tests keep their result, anything interrupted runs again
+        restored = []
+        for rt in self.runtime:
+            record = records.get(rt.id)
+            if record is None:
+                continue
+            status = SeqStatus(record["status"])
+            if status in (SeqStatus.COMPLETED, SeqStatus.FAILED):
+                rt.status = status
+                rt.pid = record.get("pid")
+                rt.started_at = datetime.fromisoformat(record["started_at"]) if record.get("started_at") else None
+                rt.ended_at = datetime.fromisoformat(record["ended_at"]) if record.get("ended_at") else None
+                restored.append(rt.id)
+            elif status == SeqStatus.RUNNING and record.get("pid"):
+                # its output and exit code went with the old agent, so the result cannot be trusted
+                if reap_orphan(record["pid"], record.get("pid_start")):
+                    print(f"Terminated orphaned process {record['pid']} of '{rt.id}'", file=sys.stderr)
+        return restored
 
-    async def _forward_stream(self, stream: asyncio.StreamReader, is_err: bool):
-        while True:
-            line = await stream.readline()
-            if not line:
-                break
-            text = line.decode().rstrip()
-            if is_err:
-                print(text, file=os.sys.stderr)
-            else:
-                print(text)
-        
     def is_busy(self):
-        return any(rt.status == SeqStatus.RUNNING for rt in self.runtime)
+        return self.running_count() > 0
 
-    def next_allowed(self):
-        for i, rt in enumerate(self.runtime):
-            if rt.status == SeqStatus.PENDING:
-                return i
-        return None
+    def running_count(self) -> int:
+        return sum(1 for rt in self.runtime if rt.status in (SeqStatus.PREPARING, SeqStatus.RUNNING))
+
+    def is_done(self) -> bool:
+        self._skip_blocked()
+        active = (SeqStatus.PENDING, SeqStatus.PREPARING, SeqStatus.RUNNING)
+        return all(rt.status not in active for rt in self.runtime)
+
+    def ready(self) -> list[int]:
+        self._skip_blocked()
+        for rt in self.runtime:
+            if rt.status != SeqStatus.PENDING:
+                continue
+            if all(self._dependency(dep).status == SeqStatus.COMPLETED for dep in rt.depends_on):
+                self.scheduler.request(rt.id, rt.resources)
+        slots = self.max_parallel - self.running_count()
+        if slots <= 0:
+            return []
+        return [self._index[test_id] for test_id in self.scheduler.grantable(slots)]
+
+    def _dependency(self, test_id: str) -> SeqRuntime:
+        return self.runtime[self._index[test_id]]
+
+    def _skip_blocked(self):
+        # a test can never run once one of its dependencies failed or was skipped
+        changed = True
+        while changed:
+            changed = False
+            for rt in self.runtime:
+                if rt.status != SeqStatus.PENDING:
+                    continue
+                if any(self._dependency(dep).status in _BLOCKING for dep in rt.depends_on):
+                    self._set_status(rt, SeqStatus.SKIPPED)
+                    self.scheduler.cancel(rt.id)
+                    changed = True
+
+    def _validate_dependencies(self):
+        for rt in self.runtime:
+            for dep in rt.depends_on:
+                if dep not in self._index:
+                    raise ValueError(f"Test '{rt.id}' depends on unknown test '{dep}'")
+
+        visiting: list[str] = []
+        visited: set[str] = set()
+
+        def visit(test_id: str):
+            if test_id in visited:
+                return
+            if test_id in visiting:
+                cycle = visiting[visiting.index(test_id):] + [test_id]
+                raise ValueError(f"Dependency cycle in plan: {' -> '.join(cycle)}")
+            visiting.append(test_id)
+            for dep in self._dependency(test_id).depends_on:
+                visit(dep)
+            visiting.pop()
+            visited.add(test_id)
+
+        for rt in self.runtime:
+            visit(rt.id)
 
     def status_table(self) -> list[dict[str, str]]:
-        rows = []
+        return [self.status_row(rt) for rt in self.runtime]
+
+    def status_row(self, rt: SeqRuntime) -> dict[str, str]:
         time_format = "%Y-%m-%d %H:%M:%S.%f"
-        for rt in self.runtime:
-            rows.append({
-                "sequence": rt.name, "status": rt.status.value, "pid": str(rt.pid or ""),
-                "started_at": f"{rt.started_at.strftime(time_format)}" if rt.started_at else "",
-                "ended_at": f"{rt.ended_at.strftime(time_format)}" if rt.ended_at else "",
-            })
-        return rows
-    
+        return {
+            "id": rt.id, "sequence": rt.name, "status": rt.status.value, "pid": str(rt.pid or ""),
+            "started_at": f"{rt.started_at.strftime(time_format)}" if rt.started_at else "",
+            "ended_at": f"{rt.ended_at.strftime(time_format)}" if rt.ended_at else "",
+            "lease_wait": f"{rt.lease_wait:.3f}" if rt.lease_wait is not None else "",
+            "blocked_on": ", ".join(rt.blocked_on),
+            **_usage_row(rt.usage),
+        }
+
+    def resource_table(self) -> list[dict[str, str]]:
+        return [
+            {
+                "resource": name, "capacity": str(stats.capacity), "grants": str(stats.grants),
+                "total_wait": f"{stats.total_wait:.3f}",
+            }
+            for name, stats in sorted(self.scheduler.stats().items(), key=lambda item: -item[1].total_wait)
+        ]
@@ -0,0 +1,223 @@
+import asyncio
+import os
+import socket
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Iterator, Optional
+
+import grpc
+from br_sdk._grpc import control_pb2, control_pb2_grpc
+
+from br_agent.agent import Agent, SeqRuntime, SeqStatus
+
+DEFAULT_CONTROL_SOCKET = str(Path(tempfile.gettempdir()) / "benderr_agent.sock")
+# updates buffered for one watcher before it is disconnected
+WATCH_QUEUE_SIZE = 1024
+
+
+class WatchOverflow(RuntimeError):
+    pass
+
+
+@dataclass
+class StatusUpdate:
+    snapshot: bool
+    revision: int
+    tests: list[dict[str, str]]
+
+
+class AgentControl:
+    # In-process control API of a running agent. The gRPC service is a thin adapter over it,
+    # and tests can drive it directly. Must be used from the agent's event loop.
+
+    def __init__(self, agent: Agent, watch_queue_size: int = WATCH_QUEUE_SIZE):
+        self.agent = agent
+        self.revision = 0
+        self.watch_queue_size = watch_queue_size
+        self._watchers: list[asyncio.Queue[Optional[StatusUpdate]]] = []
+        agent.add_listener(self._on_change)
+
+    def list_tests(self) -> StatusUpdate:
+        return StatusUpdate(snapshot=True, revision=self.revision, tests=self.agent.status_table())
+
+    def start_test(self, test_id: str) -> tuple[bool, str]:
+        index = self.agent.index_of(test_id)
+        if index is None:
+            return False, f"Unknown test '{test_id}'"
+        if index not in self.agent.ready():
+            status = self.agent.runtime[index].status.value
+            return False, f"Cannot start '{test_id}' now. Status is {status}"
+        self.agent.launch(index)
+        return True, f"Started '{test_id}'"
+
+    async def cancel_test(self, test_id: str) -> tuple[bool, str]:
+        if self.agent.index_of(test_id) is None:
+            return False, f"Unknown test '{test_id}'"
+        status = await self.agent.cancel(test_id)
+        return status == SeqStatus.CANCELLED, f"'{test_id}' is {status.value}"
+
+    async def watch(self) -> AsyncIterator[StatusUpdate]:
+        pending: asyncio.Queue[Optional[StatusUpdate]] = asyncio.Queue(self.watch_queue_size)
+        self._watchers.append(pending)
+        try:
+            yield self.list_tests()
+            while (update := await pending.get()) is not None:
+                yield update
+            if pending not in self._watchers:
+                raise WatchOverflow(f"Watcher fell more than {self.watch_queue_size} updates behind")
+        finally:
+            if pending in self._watchers:
+                self._watchers.remove(pending)
+
+    def close(self):
+        for pending in self._watchers:
+            _end(pending)
+
+    def _on_change(self, rt: SeqRuntime):
+        self.revision += 1
+        # one delta object is shared by every watcher
+        update = StatusUpdate(snapshot=False, revision=self.revision, tests=[self.agent.status_row(rt)])
+        for pending in list(self._watchers):
+            if pending.full():
+                # a stalled client must not grow the agent's memory, it can reconnect for a new snapshot
+                self._watchers.remove(pending)
+                _end(pending)
+            else:
+                pending.put_nowait(update)
+
+
+def _end(pending: asyncio.Queue[Optional[StatusUpdate]]):
+    # the end marker replaces whatever the watcher has not read yet
+    if pending.full():
+        while not pending.empty():
+            pending.get_nowait()
+    pending.put_nowait(None)
+
+
+class _ControlService(control_pb2_grpc.AgentControlServicer):
+    def __init__(self, control: AgentControl):
+        self._control = control
+
+    async def ListTests(self, request, context):
+        update = self._control.list_tests()
+        tests = [_to_proto_status(row) for row in update.tests]
+        return control_pb2.ListTestsResponse(tests=tests, revision=update.revision)
+
+    async def StartTest(self, request, context):
+        ok, message = self._control.start_test(request.id)
+        return self._reply(request.id, ok, message)
+
+    async def CancelTest(self, request, context):
+        ok, message = await self._control.cancel_test(request.id)
+        return self._reply(request.id, ok, message)
+
+    async def WatchStatus(self, request, context):
+        try:
+            async for update in self._control.watch():
+                yield _to_proto_update(update)
+        except WatchOverflow as exc:
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(exc))
+
+    def _reply(self, test_id: str, ok: bool, message: str) -> control_pb2.TestReply:
+        index = self._control.agent.index_of(test_id)
+        reply = control_pb2.TestReply(ok=ok, message=message)
+        if index is not None:
+            reply.test.CopyFrom(_to_proto_status(self._control.agent.status_row(self._control.agent.runtime[index])))
+        return reply
+
+
+class ControlServer:
+    def __init__(self, control: AgentControl, socket_path: str = DEFAULT_CONTROL_SOCKET):
+        self.control = control
+        self.socket_path = socket_path
+        self._server: Optional[grpc.aio.Server] = None
+
+    @property
+    def address(self) -> str:
+        return f"unix://{self.socket_path}"
+
+    async def start(self):
+        if os.path.exists(self.socket_path):
+            # a stale socket of a dead agent is replaced, a live one belongs to another agent
+            if _answers(self.socket_path):
+                raise RuntimeError(f"Another agent serves the control API on {self.socket_path}")
+            os.remove(self.socket_path)
+        # an aio server keeps every watcher as a coroutine on the agent loop instead of a thread
+        self._server = grpc.aio.server()
+        control_pb2_grpc.add_AgentControlServicer_to_server(_ControlService(self.control), self._server)
+        self._server.add_insecure_port(self.address)
+        await self._server.start()
+
+    async def stop(self, grace: float = 0.5):
+        if self._server is None:
+            return
+        self.control.close()
+        await self._server.stop(grace)
+        self._server = None
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+def _answers(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+class ControlClient:
+    def __init__(self, address: str = f"unix://{DEFAULT_CONTROL_SOCKET}"):
+        self._channel = grpc.insecure_channel(address)
+        self._stub = control_pb2_grpc.AgentControlStub(self._channel)
+
+    def list_tests(self, timeout: Optional[float] = 5.0) -> list[dict[str, str]]:
+        response = self._stub.ListTests(control_pb2.ListTestsRequest(), timeout=timeout)
+        return [_from_proto_status(status) for status in response.tests]
+
+    def start_test(self, test_id: str, timeout: Optional[float] = 5.0) -> tuple[bool, str]:
+        reply = self._stub.StartTest(control_pb2.TestRequest(id=test_id), timeout=timeout)
+        return reply.ok, reply.message
+
+    def cancel_test(self, test_id: str, timeout: Optional[float] = 30.0) -> tuple[bool, str]:
+        reply = self._stub.CancelTest(control_pb2.TestRequest(id=test_id), timeout=timeout)
+        return reply.ok, reply.message
+
+    def watch(self) -> Iterator[StatusUpdate]:
+        call = self._stub.WatchStatus(control_pb2.WatchRequest())
+        try:
+            for update in call:
+                yield StatusUpdate(
+                    snapshot=update.snapshot,
+                    revision=update.revision,
+                    tests=[_from_proto_status(status) for status in update.tests],
+                )
+        finally:
+            call.cancel()
+
+    def close(self):
+        self._channel.close()
+
+
+_STATUS_FIELDS = (
+    "id", "sequence", "status", "pid", "started_at", "ended_at", "lease_wait", "blocked_on",
+    "cpu_s", "cpu_pct", "rss_mb", "io_mb",
+)
+
+
+def _to_proto_status(row: dict[str, str]) -> control_pb2.TestStatus:
+    return control_pb2.TestStatus(**{name: row.get(name, "") for name in _STATUS_FIELDS})
+
+
+def _from_proto_status(status: control_pb2.TestStatus) -> dict[str, str]:
+    return {name: getattr(status, name) for name in _STATUS_FIELDS}
+
+
+def _to_proto_update(update: StatusUpdate) -> control_pb2.StatusUpdate:
+    return control_pb2.StatusUpdate(
+        snapshot=update.snapshot,
+        revision=update.revision,
+        tests=[_to_proto_status(row) for row in update.tests],
+    )
@@ -1,8 +1,21 @@
+import hashlib
+import json
+import logging
 import os
 import shutil
 import subprocess
+import sys
+import threading
+import time
 import venv
 from pathlib import Path
+from typing import Iterable
+
+LOGGER = logging.getLogger(__name__)
+
+MANIFEST_NAME = "benderr_manifest.json"
+TEMPLATE_DIR = ".templates"
+INDEX_NAME = "benderr_envs.json"
 
 
 class EnvManager:
@@ -12,6 +25,7 @@ class EnvManager:
         find_links: Path | None = None,
         allow_online: bool = True,
         extra_index_urls: list[str] | None = None,
+        template_envs: bool = False,
     ):
         self.root = Path(root)
         self.root.mkdir(parents=True, exist_ok=True)
@@ -19,16 +33,103 @@ class EnvManager:
         self.allow_online = allow_online
         self.uv_exe = shutil.which("uv")
         self.extra_index_urls = extra_index_urls or []
+        self.template_envs = template_envs
+        self._hash_cache: dict[Path, tuple[tuple[int, int], str]] = {}
+        self._template_locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._index_lock = threading.Lock()
 
     def ensure_env(self, sequence_name: str, requirements: list[str]):
+        py = self._ensure_env(sequence_name, requirements)
+        self._touch(sequence_name)
+        return py
+
+    def _ensure_env(self, sequence_name: str, requirements: list[str]):
         env_dir = self.root / sequence_name
-        py = env_dir / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+        py = _python(env_dir)
+        if not requirements:
+            if not py.exists():
+                venv.create(env_dir, with_pip=self.uv_exe is None, clear=True)
+            return py
+
+        packages = self._resolve(requirements)
+        manifest_path = env_dir / MANIFEST_NAME
+        installed = self._read_manifest(manifest_path) if py.exists() else {}
+        if installed and all(installed.get(req) == digest for req, (_, digest) in packages.items()):
+            LOGGER.debug("Environment '%s' is up to date", sequence_name)
+            return py
+
+        if self.template_envs:
+            template = self._ensure_template(packages)
+            self._clone(template, env_dir)
+            self._touch(sequence_name, template=f"{TEMPLATE_DIR}/{template.name}")
+            LOGGER.info("Environment '%s' cloned from template %s", sequence_name, template.name)
+            return py
+
+        self._install(env_dir, packages, installed)
+        return py
+
+    def _install(self, env_dir: Path, packages: dict[str, tuple[str, str]], installed: dict[str, str]):
+        py = _python(env_dir)
         if not py.exists():
             venv.create(env_dir, with_pip=self.uv_exe is None, clear=True)
+        changed = [req for req, (_, digest) in packages.items() if installed.get(req) != digest]
+        # same wheel file name with new content would otherwise be treated as already installed
+        rebuilt = [req for req in changed if req in installed and packages[req][0].endswith(".whl")]
+        cmd = self._install_cmd(py)
+        if self.uv_exe:
+            for req in rebuilt:
+                cmd += ["--reinstall-package", _wheel_package(req)]
+        elif rebuilt:
+            # pip's --force-reinstall also reinstalls every dependency, so the rebuilt wheels go
+            # first without them; the install below then only adds dependencies that are missing
+            reinstall = ["--force-reinstall", "--no-deps"]
+            subprocess.run(cmd + reinstall + [packages[req][0] for req in rebuilt], check=True)
 
-        if not requirements:
-            return py
+        subprocess.run(cmd + [packages[req][0] for req in changed], check=True)
+        self._write_manifest(env_dir / MANIFEST_NAME, {req: digest for req, (_, digest) in packages.items()})
+
+    def _ensure_template(self, packages: dict[str, tuple[str, str]]) -> Path:
+        # One fully installed env per distinct package set, shared by every env that needs it.
+        # Keyed by the whole set rather than per wheel: installing wheels one by one would need
+        # our own dependency resolution, so a changed wheel means a new template.
+        key = json.dumps(
+            {"python": sys.implementation.cache_tag, "packages": {req: d for req, (_, d) in packages.items()}},
+            sort_keys=True,
+        )
+        template = self.root / TEMPLATE_DIR / hashlib.sha256(key.encode()).hexdigest()[:16]
+        with self._locks_guard:
+            lock = self._template_locks.setdefault(template.name, threading.Lock())
+        with lock:
+            # the manifest is written last, so a template without one is an interrupted build
+            if not (template / MANIFEST_NAME).exists():
+                shutil.rmtree(template, ignore_errors=True)
+                self._install(template, packages, {})
+                _make_read_only(_site_packages(template))
+        self._touch(f"{TEMPLATE_DIR}/{template.name}")
+        return template
+
+    def _clone(self, template: Path, env_dir: Path):
+        shutil.rmtree(env_dir, ignore_errors=True)
+        venv.create(env_dir, with_pip=False, clear=True)
+        shutil.copytree(
+            _site_packages(template), _site_packages(env_dir), copy_function=_link_or_copy, dirs_exist_ok=True
+        )
+        # console scripts carry the template interpreter in their shebang
+        template_bin, env_bin = _python(template).parent, _python(env_dir).parent
+        for script in template_bin.iterdir():
+            target = env_bin / script.name
+            if target.exists() or not script.is_file():
+                continue
+            data = script.read_bytes()
+            if data.startswith(b"#!"):
+                target.write_bytes(data.replace(str(template_bin).encode(), str(env_bin).encode()))
+                shutil.copymode(script, target)
+            else:
+                _link_or_copy(script, target)
+        shutil.copy2(template / MANIFEST_NAME, env_dir / MANIFEST_NAME)
 
+    def _install_cmd(self, py: Path) -> list[str]:
         if self.uv_exe:
             cmd = [self.uv_exe, "pip", "install", "--python", str(py)]
         else:
@@ -42,16 +143,162 @@ class EnvManager:
                 cmd += ["--extra-index-url", url]
         else:
             cmd += ["--no-index"]
+        return cmd
 
-        # Prefer local wheel files; otherwise pass spec as-is
-        pkgs: list[str] = []
+    def _resolve(self, requirements: list[str]) -> dict[str, tuple[str, str]]:
+        # Prefer local wheel files (keyed by content hash); otherwise pass spec as-is
+        source = f"{self.find_links}|{self.allow_online}|{','.join(self.extra_index_urls)}"
+        packages: dict[str, tuple[str, str]] = {}
         for req in requirements:
             if self.find_links:
                 candidate = self.find_links / req
                 if candidate.exists():
-                    pkgs.append(str(candidate))
+                    packages[req] = (str(candidate), self._file_hash(candidate))
                     continue
-            pkgs.append(req)
+            packages[req] = (req, f"spec:{source}")
+        return packages
 
-        subprocess.run(cmd + pkgs, check=True)
-        return py
+    def _file_hash(self, path: Path) -> str:
+        stat = path.stat()
+        key = (stat.st_size, stat.st_mtime_ns)
+        cached = self._hash_cache.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+        digest = hashlib.sha256()
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        value = f"sha256:{digest.hexdigest()}"
+        self._hash_cache[path] = (key, value)
+        return value
+
+    def collect_garbage(self, budget: int, keep: Iterable[str] = ()) -> list[str]:
+        # evict least recently used envs until env_root fits in budget bytes
+        with self._index_lock:
+            index = self._read_index()
+            # only envs this manager created are candidates, other directories are left alone
+            names = [name for name in self._env_dirs() if name in index or (self.root / name / MANIFEST_NAME).exists()]
+            for name in names:
+                index.setdefault(name, {"last_used": (self.root / name).stat().st_mtime})
+            for name in set(index) - set(names):
+                del index[name]
+            for name, size in self._measure(names).items():
+                index[name]["size"] = size
+
+            keep = set(keep)
+            keep |= {index[name]["template"] for name in keep if "template" in index.get(name, {})}
+            total = sum(entry["size"] for entry in index.values())
+            evicted = []
+            while total > budget:
+                # a template stays as long as any remaining env is linked to it
+                referenced = {entry.get("template") for entry in index.values()}
+                candidates = [name for name in index if name not in keep and name not in referenced]
+                if not candidates:
+                    break
+                name = min(candidates, key=lambda n: index[n]["last_used"])
+                shutil.rmtree(self.root / name, ignore_errors=True)
+                total -= index.pop(name)["size"]
+                evicted.append(name)
+            self._write_index(index)
+
+        if evicted:
+            LOGGER.info("Evicted %d environment(s): %s", len(evicted), ", ".join(evicted))
+        if total > budget:
+            LOGGER.warning("Environments use %d bytes, over the budget of %d bytes", total, budget)
+        return evicted
+
+    def _touch(self, name: str, **fields):
+        with self._index_lock:
+            index = self._read_index()
+            entry = index.setdefault(name, {})
+            entry["last_used"] = time.time()
+            entry.update(fields)
+            self._write_index(index)
+
+    def _env_dirs(self) -> list[str]:
+        names = [p.name for p in self.root.iterdir() if p.is_dir() and p.name != TEMPLATE_DIR]
+        templates = self.root / TEMPLATE_DIR
+        if templates.is_dir():
+            names += [f"{TEMPLATE_DIR}/{p.name}" for p in templates.iterdir() if p.is_dir()]
+        return names
+
+    def _measure(self, names: list[str]) -> dict[str, int]:
+        # hardlinked files are charged once, to the template that owns them
+        seen: set[tuple[int, int]] = set()
+        sizes = {}
+        for name in sorted(names, key=lambda n: not n.startswith(TEMPLATE_DIR)):
+            total = 0
+            for dirpath, _, files in os.walk(self.root / name):
+                for filename in files:
+                    try:
+                        stat = os.lstat(os.path.join(dirpath, filename))
+                    except OSError:
+                        continue
+                    if (stat.st_dev, stat.st_ino) not in seen:
+                        seen.add((stat.st_dev, stat.st_ino))
+                        total += stat.st_size
+            sizes[name] = total
+        return sizes
+
+    def _read_index(self) -> dict[str, dict]:
+        try:
+            with (self.root / INDEX_NAME).open() as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index: dict[str, dict]):
+        path = self.root / INDEX_NAME
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("w") as f:
+            json.dump(index, f, indent=2)
+        tmp.replace(path)
+
+    @staticmethod
+    def _read_manifest(path: Path) -> dict[str, str]:
+        try:
+            with path.open() as f:
+                return json.load(f).get("packages", {})
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_manifest(path: Path, packages: dict[str, str]):
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("w") as f:
+            json.dump({"packages": packages}, f, indent=2)
+        tmp.replace(path)
+
+
+def _python(env_dir: Path) -> Path:
+    return env_dir / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+
+
+def _wheel_package(wheel: str) -> str:
+    return Path(wheel).name.split("-")[0]
+
+
+def _site_packages(env_dir: Path) -> Path:
+    if os.name == "nt":
+        return env_dir / "Lib" / "site-packages"
+    return next((env_dir / "lib").glob("python*/site-packages"))
+
+
+def _make_read_only(directory: Path):
+    # Hardlinked files share one inode with the template and every sibling env. Without write
+    # permission, writing into an installed file fails instead of changing all of them; pip and
+    # the bytecode cache replace files (unlink or rename), which still works.
+    for dirpath, _, files in os.walk(directory):
+        for filename in files:
+            path = os.path.join(dirpath, filename)
+            if not os.path.islink(path):
+                os.chmod(path, os.stat(path).st_mode & ~0o222)
+
+
+def _link_or_copy(src, dst):
+    # hardlinks share the template's files; fall back to a copy across filesystems
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
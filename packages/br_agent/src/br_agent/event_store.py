@@ -0,0 +1,69 @@
+import json
+import threading
+from collections import Counter, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+
+class EventStore:
+    # Keeps only the newest events in memory; the full history goes to a JSON-lines file
+    # and is read back on demand.
+
+    def __init__(self, path: Optional[Path] = None, tail_size: int = 1000):
+        self.path = path
+        self.total = 0
+        self._tail: deque[dict] = deque(maxlen=tail_size)
+        self._counts: dict[str, Counter] = {}
+        self._lock = threading.Lock()
+        self._file = None
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = path.open("a", encoding="utf-8")
+
+    def append(self, test_id: str, type: str, **fields: str):
+        timestamp = datetime.now().isoformat()
+        with self._lock:
+            record = {"seq": self.total, "ts": timestamp, "test": test_id, "type": type, **fields}
+            self.total += 1
+            self._tail.append(record)
+            counts = self._counts.setdefault(test_id, Counter())
+            counts[type] += 1
+            if type == "ended":
+                counts[fields.get("verdict", "")] += 1
+            elif type == "log":
+                counts[f"log_{fields.get('level', '').lower()}"] += 1
+            if self._file:
+                self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def tail(self, limit: Optional[int] = None) -> list[dict]:
+        with self._lock:
+            events = list(self._tail)
+        return events[-limit:] if limit else events
+
+    def query(self, test_id: Optional[str] = None, type: Optional[str] = None) -> Iterator[dict]:
+        if self.path is None:
+            records = iter(self.tail())
+        else:
+            with self._lock:
+                if self._file:
+                    self._file.flush()
+            records = self._read()
+        for record in records:
+            if (test_id is None or record["test"] == test_id) and (type is None or record["type"] == type):
+                yield record
+
+    def counts(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {test_id: dict(counts) for test_id, counts in self._counts.items()}
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def _read(self) -> Iterator[dict]:
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import signal
+import sys
+from pathlib import Path
+from typing import IO, Optional
+
+JOURNAL_PREFIX = "benderr_journal_"
+
+
+def plan_fingerprint(plan_path: Path) -> str:
+    return hashlib.sha256(plan_path.read_bytes()).hexdigest()
+
+
+def journal_path(directory: Path, fingerprint: str) -> Path:
+    # one journal per plan, plans sharing an output directory do not overwrite each other
+    return directory / f"{JOURNAL_PREFIX}{fingerprint[:16]}.jsonl"
+
+
+class Journal:
+    # Append-only record of every test state transition, so a restarted agent can resume a plan.
+    # The first line identifies the plan; a journal of another plan or of a finished run is ignored.
+
+    def __init__(self, path: Path, fingerprint: str):
+        self.path = path
+        self.fingerprint = fingerprint
+        self._file: Optional[IO[str]] = None
+
+    def open(self, resume: bool = False) -> dict[str, dict]:
+        records = self._load() if resume else {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if records:
+            self._file = self.path.open("a", encoding="utf-8")
+        else:
+            self._file = self.path.open("w", encoding="utf-8")
+            self._write({"type": "plan", "fingerprint": self.fingerprint})
+        return records
+
+    def record(self, entry: dict):
+        if self._file:
+            self._write({"type": "test", **entry})
+
+    def finish(self):
+        if self._file:
+            self._write({"type": "done"})
+            self.close()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _write(self, entry: dict):
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _load(self) -> dict[str, dict]:
+        records: dict[str, dict] = {}
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            return {}
+        for number, line in enumerate(lines):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # the agent may have died in the middle of the last write
+                continue
+            match entry.get("type"):
+                case "plan" if number == 0 and entry.get("fingerprint") == self.fingerprint:
+                    continue
+                case "test" if number > 0:
+                    records[entry["id"]] = entry
+                case _:
+                    return {}
+        return records
+
+
+def process_start_time(pid: int) -> Optional[int]:
+    # pids get reused, the start time (in clock ticks since boot) identifies the process
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    return int(stat.rsplit(")", 1)[1].split()[19])
+
+
+def reap_orphan(pid: int, start_time: Optional[int]) -> bool:
+    current = process_start_time(pid)
+    if current is None or start_time is None or current != start_time:
+        return False
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except OSError as exc:
+        print(f"Could not terminate orphaned process {pid}: {exc}", file=sys.stderr)
+        return False
+    return True
@@ -1,17 +1,23 @@
 import argparse
 import asyncio
 import json
-from dataclasses import dataclass
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 
-from br_sdk.br_types import Step, StepResult
+from br_sdk.br_types import Step, Verdict
 from br_sdk.config import AppConfig
-from br_sdk.events import EventSubscriber, shutdown_event_server
+from br_sdk.events import AGENT_CLIENT, EventSubscriber, StepResultView
 from rich.console import Console
 from rich.table import Table
 
-from br_agent.agent import Agent, SeqStatus, TestSpec
+from br_agent.agent import Agent, SeqRuntime, SeqStatus, TestSpec
+from br_agent.control import DEFAULT_CONTROL_SOCKET, AgentControl, ControlServer
 from br_agent.env_manager import EnvManager
+from br_agent.event_store import EventStore
+from br_agent.journal import Journal, journal_path, plan_fingerprint
+from br_agent.placement import Placement, parse_cpus
 
 
 @dataclass
@@ -21,12 +27,22 @@ class PackagePlan:
     allow_online: bool
     extra_index_urls: list[str]
     requirements: list[str]
+    prepare_concurrency: int = 2
+    template_envs: bool = False
+    env_budget_mb: int | None = None
 
 
 @dataclass
 class Plan:
     packages: PackagePlan
     tests: list[TestSpec]
+    max_parallel: int = 1
+    warm_workers: bool = False
+    output_dir: Path | None = None
+    control_socket: str | None = None
+    sample_interval: float = 1.0
+    placement: Placement = field(default_factory=Placement)
+    resources: dict[str, int] = field(default_factory=dict)
 
 
 console = Console()
@@ -56,6 +72,9 @@ def load_plan(path: Path) -> Plan:
     allow_online = packages_data.get("allow_online", False)
     extra_index_urls = list(packages_data.get("extra_index_urls", []))
     requirements = list(packages_data.get("requirements", []))
+    prepare_concurrency = int(packages_data.get("prepare_concurrency", 2))
+    template_envs = bool(packages_data.get("template_envs", False))
+    env_budget_mb = packages_data.get("env_budget_mb")
 
     package_plan = PackagePlan(
         env_root=env_root,
@@ -63,6 +82,9 @@ def load_plan(path: Path) -> Plan:
         allow_online=allow_online,
         extra_index_urls=extra_index_urls,
         requirements=requirements,
+        prepare_concurrency=prepare_concurrency,
+        template_envs=template_envs,
+        env_budget_mb=int(env_budget_mb) if env_budget_mb is not None else None,
     )
 
     tests: list[TestSpec] = []
@@ -74,104 +96,228 @@ def load_plan(path: Path) -> Plan:
         config_path = resolve_path(config)
         if config_path is None or not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {config}")
-        tests.append(TestSpec(name=name, config_path=config_path))
+        tests.append(
+            TestSpec(
+                name=name,
+                config_path=config_path,
+                id=entry.get("id"),
+                depends_on=list(entry.get("depends_on", [])),
+                resources=list(entry.get("resources", [])),
+            )
+        )
 
     if not tests:
         raise ValueError("Plan contains no tests to execute")
 
-    return Plan(packages=package_plan, tests=tests)
+    execution_data = data.get("execution", {})
+    max_parallel = int(execution_data.get("max_parallel", 1))
+    warm_workers = bool(execution_data.get("warm_workers", False))
+    output_dir = resolve_path(execution_data.get("output_dir", "runs"))
+    control_socket = execution_data.get("control_socket")
+    if control_socket is True:
+        control_socket = DEFAULT_CONTROL_SOCKET
+    sample_interval = float(execution_data.get("sample_interval", 1.0))
+    placement_data = execution_data.get("placement", {})
+    placement = Placement(
+        slot_cpus=[parse_cpus(cpus) for cpus in placement_data.get("slot_cpus", [])],
+        agent_cpus=parse_cpus(placement_data.get("agent_cpus", [])),
+        nice=placement_data.get("nice"),
+        policy=placement_data.get("policy"),
+        priority=int(placement_data.get("priority", 0)),
+    )
+    resources = {name: int(capacity) for name, capacity in data.get("resources", {}).items()}
+
+    return Plan(
+        packages=package_plan,
+        tests=tests,
+        max_parallel=max_parallel,
+        warm_workers=warm_workers,
+        output_dir=output_dir,
+        control_socket=control_socket,
+        sample_interval=sample_interval,
+        placement=placement,
+        resources=resources,
+    )
 
 
-async def run_plan(plan_path: Path):
+async def run_plan(plan_path: Path, resume: bool = False):
     plan = load_plan(plan_path)
+    fingerprint = plan_fingerprint(plan_path)
+    journal = Journal(journal_path(plan.output_dir or plan.packages.env_root, fingerprint), fingerprint)
 
     env_manager = EnvManager(
         root=plan.packages.env_root,
         find_links=plan.packages.find_links,
         allow_online=plan.packages.allow_online,
         extra_index_urls=plan.packages.extra_index_urls,
+        template_envs=plan.packages.template_envs,
     )
 
+    run_dir = plan.output_dir / datetime.now().strftime("%Y%m%d-%H%M%S") if plan.output_dir else None
     agent = Agent(
         tests=plan.tests,
         env_manager=env_manager,
         required_packages=plan.packages.requirements,
+        max_parallel=plan.max_parallel,
+        resources=plan.resources,
+        env_concurrency=plan.packages.prepare_concurrency,
+        warm_workers=plan.warm_workers,
+        output_dir=run_dir,
+        journal=journal,
+        sample_interval=plan.sample_interval,
+        placement=plan.placement,
     )
-
-    captured_events: list[dict[str, str]] = []
-
-    def record_step_started(step: Step):
-        captured_events.append(
-            {
-                "type": "started",
-                "id": str(step.id),
-                "name": step.name,
-            }
+    for error in plan.placement.pin_agent():
+        console.print(f"[yellow]{error}")
+    records = journal.open(resume=resume)
+    restored = agent.restore(records)
+    if restored:
+        console.print(f"Resuming plan, keeping results of: {', '.join(restored)}")
+    agent.prepare_envs()
+    gc_task = None
+    if plan.packages.env_budget_mb is not None:
+        gc_task = asyncio.create_task(agent.collect_envs(plan.packages.env_budget_mb * 1024 * 1024))
+
+    events = EventStore(run_dir / "events.jsonl" if run_dir else None)
+    subscribers: dict[str, EventSubscriber] = {}
+
+    def subscribe(test_id: str) -> EventSubscriber:
+        def record_step_started(step: Step):
+            events.append(test_id, "started", id=str(step.id), name=step.name)
+
+        def record_step_ended(result: StepResultView):
+            events.append(test_id, "ended", id=str(result.id), name=result.name, verdict=result.verdict.value)
+
+        def record_log(message: str, level: str):
+            events.append(test_id, "log", level=level, message=message)
+
+        # every test publishes on its own socket, see Agent.event_socket
+        subscriber = EventSubscriber(
+            on_step_started=record_step_started,
+            on_step_ended=record_step_ended,
+            on_log=record_log,
+            address=f"unix://{agent.event_socket(test_id)}",
+            client=AGENT_CLIENT,
         )
+        subscriber.start()
+        return subscriber
 
-    def record_step_ended(result: StepResult):
-        captured_events.append(
-            {
-                "type": "ended",
-                "id": str(result.id),
-                "name": result.name,
-                "verdict": result.verdict.value,
-            }
-        )
-
-    def record_log(message: str, level: str):
-        captured_events.append(
-            {
-                "type": "log",
-                "level": level,
-                "message": message,
-            }
-        )
-
-    subscriber = EventSubscriber(
-        on_step_started=record_step_started,
-        on_step_ended=record_step_ended,
-        on_log=record_log,
-        start_server=True,
-    )
-    subscriber.start()
-    subscriber.wait_until_ready(timeout=5.0)
-
-    while True:
-        next_idx = agent.next_allowed()
-        if next_idx is None:
-            break
-        await agent.start_sequence(next_idx)
-        while agent.runtime[next_idx].status == SeqStatus.RUNNING:
-            await asyncio.sleep(0.1)
-
-    table = agent.status_table()
-
-    subscriber.stop(grace_period=0.2)
-    shutdown_event_server()
+    def on_status(rt: SeqRuntime):
+        # tests can also be started through the control API
+        if rt.status == SeqStatus.PREPARING:
+            subscribers[rt.id] = subscribe(rt.id)
 
-    return table, captured_events
+    agent.add_listener(on_status)
+    control_server = None
+    try:
+        if plan.control_socket:
+            server = ControlServer(AgentControl(agent), plan.control_socket)
+            await server.start()
+            control_server = server
+        while not agent.is_done():
+            for index in agent.ready():
+                agent.launch(index)
+            finished = await agent.wait_any()
+            for handle in finished:
+                await asyncio.to_thread(subscribers.pop(handle.id).stop, grace_period=0.2)
+            if not finished and not agent.is_done():
+                raise RuntimeError("No test in the plan can be started")
+        journal.finish()
+    except BaseException:
+        if gc_task:
+            # a failed plan does not wait for the remaining env builds to collect garbage
+            gc_task.cancel()
+        raise
+    finally:
+        await agent.cancel_all()
+        await agent.close()
+        journal.close()
+        if control_server:
+            await control_server.stop()
+        for subscriber in subscribers.values():
+            subscriber.stop()
+        events.close()
+        if gc_task:
+            with suppress(asyncio.CancelledError):
+                await gc_task
+
+    return agent.status_table(), agent.resource_table(), events
 
 
 def render_summary(table: list[dict[str, str]]):
     console.rule("[bold]Summary")
     summary = Table(show_header=True, header_style="bold magenta")
+    summary.add_column("Test")
     summary.add_column("Sequence")
     summary.add_column("Status")
     summary.add_column("PID")
     summary.add_column("Started")
     summary.add_column("Ended")
+    summary.add_column("Lease wait [s]")
+    summary.add_column("Blocked on")
+    summary.add_column("CPU [s]")
+    summary.add_column("CPU avg/peak [%]")
+    summary.add_column("RSS avg/peak [MB]")
+    summary.add_column("I/O read/write [MB]")
     for row in table:
         summary.add_row(
+            row["id"],
             row["sequence"],
             row["status"],
             row["pid"],
             row["started_at"],
             row["ended_at"],
+            row["lease_wait"],
+            row["blocked_on"],
+            row["cpu_s"],
+            row["cpu_pct"],
+            row["rss_mb"],
+            row["io_mb"],
         )
     console.print(summary)
 
 
+def render_resources(table: list[dict[str, str]]):
+    if not table:
+        return
+    resources = Table(show_header=True, header_style="bold magenta")
+    resources.add_column("Resource")
+    resources.add_column("Capacity")
+    resources.add_column("Grants")
+    resources.add_column("Total wait [s]")
+    for row in table:
+        resources.add_row(row["resource"], row["capacity"], row["grants"], row["total_wait"])
+    console.print(resources)
+
+
+def render_events(events: EventStore):
+    counts = events.counts()
+    if not counts:
+        return
+    console.rule("[bold]Captured Events")
+    events_table = Table(show_header=True, header_style="bold cyan")
+    events_table.add_column("Test")
+    events_table.add_column("Steps")
+    events_table.add_column("Passed")
+    events_table.add_column("Failed")
+    events_table.add_column("Logs")
+    events_table.add_column("Warnings")
+    events_table.add_column("Errors")
+    for test_id, test_counts in counts.items():
+        events_table.add_row(
+            test_id,
+            str(test_counts.get("started", 0)),
+            str(test_counts.get(Verdict.PASSED.value, 0)),
+            str(test_counts.get(Verdict.FAILED.value, 0) + test_counts.get(Verdict.ABORTED.value, 0)),
+            str(test_counts.get("log", 0)),
+            str(test_counts.get("log_warning", 0)),
+            str(test_counts.get("log_error", 0) + test_counts.get("log_critical", 0)),
+        )
+    console.print(events_table)
+    if events.path:
+        console.print(f"{events.total} events written to {events.path}")
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Agent test runner")
     parser.add_argument(
@@ -180,6 +326,11 @@ def build_parser() -> argparse.ArgumentParser:
         required=True,
         help="Path to a JSON file describing the test plan",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run of the same plan, keeping results of finished tests",
+    )
     return parser
 
 
@@ -187,24 +338,10 @@ def main():
     AppConfig.load(profile="cli", config_dirs=["./config"])
     parser = build_parser()
     args = parser.parse_args()
-    results, events = asyncio.run(run_plan(args.plan.resolve()))
+    results, resource_results, events = asyncio.run(run_plan(args.plan.resolve(), resume=args.resume))
     render_summary(results)
-    if events:
-        console.rule("[bold]Captured Events")
-        events_table = Table(show_header=True, header_style="bold cyan")
-        events_table.add_column("Type")
-        events_table.add_column("ID")
-        events_table.add_column("Name / Message")
-        events_table.add_column("Verdict / Level")
-        for event in events:
-            match event["type"]:
-                case "started":
-                    events_table.add_row("started", event["id"], event["name"], "")
-                case "ended":
-                    events_table.add_row("ended", event["id"], event["name"], event.get("verdict", ""))
-                case "log":
-                    events_table.add_row("log", "", event["message"], event.get("level", ""))
-        console.print(events_table)
+    render_resources(resource_results)
+    render_events(events)
 
 
 if __name__ == "__main__":
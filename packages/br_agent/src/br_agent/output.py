@@ -0,0 +1,117 @@
+import asyncio
+import sys
+from pathlib import Path
+from typing import IO, Optional
+
+READ_CHUNK = 64 * 1024
+
+
+class OutputCapture:
+    # Child output is buffered in chunks and flushed on a timer, so a chatty child costs a few
+    # event loop wakeups per interval instead of one print per line.
+
+    def __init__(
+        self,
+        log_path: Optional[Path] = None,
+        prefix: str = "",
+        ring_size: int = 256 * 1024,
+        console_limit: int = 64 * 1024,
+        interval: float = 0.1,
+    ):
+        self.log_path = log_path
+        self.prefix = prefix
+        self.ring_size = ring_size
+        self.console_limit = console_limit
+        self.interval = interval
+        self.total_bytes = 0
+        self._ring = bytearray()
+        self._console = {False: bytearray(), True: bytearray()}
+        self._dropped = {False: 0, True: 0}
+        self._spool: list[bytes] = []
+        self._file: Optional[IO[bytes]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop = asyncio.Event()
+        # one write at a time, in spool order, also while close() runs
+        self._write_lock = asyncio.Lock()
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    def feed(self, data: bytes, is_err: bool = False):
+        self.total_bytes += len(data)
+        self._ring += data
+        if len(self._ring) > self.ring_size:
+            del self._ring[: len(self._ring) - self.ring_size]
+        if self.log_path:
+            self._spool.append(data)
+
+        pending = self._console[is_err]
+        pending += data
+        # the console only ever shows the newest output of an interval
+        if len(pending) > self.console_limit:
+            excess = len(pending) - self.console_limit
+            del pending[:excess]
+            self._dropped[is_err] += excess
+
+    def tail(self) -> bytes:
+        return bytes(self._ring)
+
+    async def forward(self, stream: asyncio.StreamReader, is_err: bool = False):
+        while True:
+            data = await stream.read(READ_CHUNK)
+            if not data:
+                break
+            self.feed(data, is_err)
+
+    async def flush(self, final: bool = False):
+        self._flush_console(final)
+        async with self._write_lock:
+            if self._spool:
+                data = b"".join(self._spool)
+                self._spool.clear()
+                await asyncio.to_thread(self._write, data)
+
+    async def close(self):
+        if self._task:
+            # not cancelled: a flush in progress finishes before the last one
+            self._stop.set()
+            await self._task
+            self._task = None
+        await self.flush(final=True)
+        async with self._write_lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._stop.wait(), self.interval)
+                return
+            except asyncio.TimeoutError:
+                await self.flush()
+
+    def _flush_console(self, final: bool):
+        for is_err in (False, True):
+            pending = self._console[is_err]
+            # partial lines wait for the rest of the line unless the child is done
+            end = len(pending) if final else pending.rfind(b"\n") + 1
+            dropped = self._dropped[is_err]
+            if end == 0 and not dropped:
+                continue
+            lines = pending[:end].decode(errors="replace").splitlines()
+            del pending[:end]
+            self._dropped[is_err] = 0
+            if dropped:
+                where = f", see {self.log_path}" if self.log_path else ""
+                lines.insert(0, f"... {dropped} bytes of output skipped{where} ...")
+            if lines:
+                text = "\n".join(self.prefix + line for line in lines)
+                print(text, file=sys.stderr if is_err else sys.stdout)
+
+    def _write(self, data: bytes):
+        if self._file is None:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.log_path.open("ab")
+        self._file.write(data)
+        self._file.flush()
@@ -0,0 +1,89 @@
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Optional
+
+POLICIES = {
+    "other": "SCHED_OTHER",
+    "batch": "SCHED_BATCH",
+    "idle": "SCHED_IDLE",
+    "fifo": "SCHED_FIFO",
+    "rr": "SCHED_RR",
+}
+
+
+@dataclass
+class Placement:
+    # CPU sets are per slot: the n-th concurrently running sequence gets slot_cpus[n]
+    slot_cpus: list[set[int]] = field(default_factory=list)
+    agent_cpus: set[int] = field(default_factory=set)
+    nice: Optional[int] = None
+    policy: Optional[str] = None
+    priority: int = 0
+
+    def __post_init__(self):
+        if self.policy is not None and self.policy not in POLICIES:
+            raise ValueError(f"Unknown scheduling policy '{self.policy}'. Use one of {', '.join(POLICIES)}")
+        if any(not cpus for cpus in self.slot_cpus):
+            raise ValueError("Every slot needs at least one CPU")
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.slot_cpus or self.agent_cpus or self.nice is not None or self.policy)
+
+    def cpus_for(self, slot: int) -> set[int]:
+        return self.slot_cpus[slot % len(self.slot_cpus)] if self.slot_cpus else set()
+
+    def pin_agent(self) -> list[str]:
+        if not self.agent_cpus:
+            return []
+        return _try(lambda: os.sched_setaffinity(0, self.agent_cpus), f"pin agent to CPUs {sorted(self.agent_cpus)}")
+
+    def settings(self, slot: int) -> dict:
+        # what a child in this slot applies to itself before it starts, see placement_command
+        settings: dict = {}
+        cpus = self.cpus_for(slot)
+        if cpus:
+            settings["cpus"] = sorted(cpus)
+        if self.policy:
+            settings["policy"] = POLICIES[self.policy]
+            settings["priority"] = self.priority
+        # nice has no effect on real-time policies
+        if self.nice is not None and self.policy not in ("fifo", "rr"):
+            settings["nice"] = self.nice
+        return settings
+
+
+def placement_command(settings: dict, cmd: list[str]) -> list[str]:
+    # The child applies the settings to itself and then execs cmd (see br_cli.placement), so
+    # every thread of the sequence inherits them and the agent needs no preexec_fn. cmd[0] is
+    # the interpreter of the sequence env, which has br_cli installed.
+    return [cmd[0], "-m", "br_cli.placement", json.dumps(settings), *cmd]
+
+
+def parse_cpus(value) -> set[int]:
+    # accepts [0, 1], "0-3" or "0,2,4-5"
+    if isinstance(value, list):
+        return {int(cpu) for cpu in value}
+    cpus: set[int] = set()
+    for part in str(value).split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            first, last = part.split("-", 1)
+            cpus.update(range(int(first), int(last) + 1))
+        else:
+            cpus.add(int(part))
+    return cpus
+
+
+def _try(action, description: str) -> list[str]:
+    if not sys.platform.startswith("linux"):
+        return [f"Could not {description}: only supported on Linux"]
+    try:
+        action()
+    except (OSError, AttributeError) as exc:
+        return [f"Could not {description}: {exc}"]
+    return []
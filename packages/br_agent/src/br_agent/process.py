@@ -0,0 +1,58 @@
+import asyncio
+import os
+import signal
+import subprocess
+from typing import Optional
+
+from br_agent.sampler import ExitUsage
+
+
+class ChildProcess:
+    # Mirrors the parts of asyncio.subprocess.Process the agent uses. The child is reaped here with
+    # wait4() when its pidfd becomes readable, so its final resource usage is known.
+
+    def __init__(self, popen: subprocess.Popen, stdout: asyncio.StreamReader, stderr: asyncio.StreamReader):
+        self.pid = popen.pid
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode: Optional[int] = None
+        self.exit_usage: Optional[ExitUsage] = None
+        self._popen = popen
+        self._loop = asyncio.get_running_loop()
+        self._exit = self._loop.create_future()
+        self._pidfd = os.pidfd_open(popen.pid)
+        self._loop.add_reader(self._pidfd, self._reap)
+
+    def _reap(self):
+        self._loop.remove_reader(self._pidfd)
+        os.close(self._pidfd)
+        _, status, rusage = os.wait4(self.pid, 0)
+        self.returncode = os.waitstatus_to_exitcode(status)
+        # Popen must not wait for the pid again
+        self._popen.returncode = self.returncode
+        self.exit_usage = ExitUsage.from_rusage(rusage)
+        self._exit.set_result(self.returncode)
+
+    async def wait(self) -> int:
+        return await asyncio.shield(self._exit)
+
+    def send_signal(self, sig: int):
+        if self.returncode is None:
+            os.kill(self.pid, sig)
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+
+async def start_child(args: list[str], env: dict[str, str]) -> ChildProcess:
+    popen = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+    loop = asyncio.get_running_loop()
+    readers = []
+    for pipe in (popen.stdout, popen.stderr):
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda reader=reader: asyncio.StreamReaderProtocol(reader), pipe)
+        readers.append(reader)
+    return ChildProcess(popen, *readers)
@@ -0,0 +1,98 @@
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+
+@dataclass
+class Lease:
+    test_id: str
+    resources: list[str]
+    wait: float
+    blocked_on: list[str]
+
+
+@dataclass
+class ResourceStats:
+    capacity: int
+    in_use: int = 0
+    grants: int = 0
+    total_wait: float = 0.0
+
+
+@dataclass
+class _Waiter:
+    test_id: str
+    resources: list[str]
+    requested_at: float
+    blocked_on: set[str] = field(default_factory=set)
+
+
+class ResourceScheduler:
+    # Leases are granted all-or-nothing (no hold-and-wait, so no deadlock) in request order.
+    # A waiter that cannot be served reserves one free unit of each resource it needs, so later
+    # requests cannot starve it; they only wait if they need one of those units themselves.
+
+    def __init__(self, capacities: dict[str, int] | None = None, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._stats: dict[str, ResourceStats] = {}
+        self._waiters: list[_Waiter] = []
+        self._leases: dict[str, Lease] = {}
+        for name, capacity in (capacities or {}).items():
+            if capacity < 1:
+                raise ValueError(f"Resource '{name}' must have a capacity of at least 1")
+            self._stats[name] = ResourceStats(capacity=capacity)
+
+    def request(self, test_id: str, resources: list[str]):
+        if test_id in self._leases or any(w.test_id == test_id for w in self._waiters):
+            return
+        for name in resources:
+            # resources not declared in the plan are exclusive
+            self._stats.setdefault(name, ResourceStats(capacity=1))
+        self._waiters.append(_Waiter(test_id, list(dict.fromkeys(resources)), self._clock()))
+
+    def grantable(self, limit: int | None = None) -> list[str]:
+        available = {name: stats.capacity - stats.in_use for name, stats in self._stats.items()}
+        granted = []
+        for waiter in self._waiters:
+            if limit is not None and len(granted) >= limit:
+                break
+            missing = {name for name in waiter.resources if available[name] < 1}
+            if missing:
+                waiter.blocked_on.update(missing)
+                for name in waiter.resources:
+                    if name not in missing:
+                        available[name] -= 1
+                continue
+            for name in waiter.resources:
+                available[name] -= 1
+            granted.append(waiter.test_id)
+        return granted
+
+    def acquire(self, test_id: str) -> Lease:
+        if test_id not in self.grantable():
+            raise RuntimeError(f"Resources for '{test_id}' are not available")
+        waiter = next(w for w in self._waiters if w.test_id == test_id)
+        self._waiters.remove(waiter)
+        wait = self._clock() - waiter.requested_at
+        for name in waiter.resources:
+            stats = self._stats[name]
+            stats.in_use += 1
+            stats.grants += 1
+        for name in waiter.blocked_on:
+            self._stats[name].total_wait += wait
+        lease = Lease(test_id, waiter.resources, wait, sorted(waiter.blocked_on))
+        self._leases[test_id] = lease
+        return lease
+
+    def release(self, test_id: str):
+        lease = self._leases.pop(test_id, None)
+        if lease is None:
+            return
+        for name in lease.resources:
+            self._stats[name].in_use -= 1
+
+    def cancel(self, test_id: str):
+        self._waiters = [w for w in self._waiters if w.test_id != test_id]
+
+    def stats(self) -> dict[str, ResourceStats]:
+        return dict(self._stats)
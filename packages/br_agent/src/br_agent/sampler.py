@@ -0,0 +1,118 @@
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+@dataclass
+class ProcessSample:
+    time: float
+    cpu_seconds: float
+    rss_bytes: int
+    read_bytes: Optional[int] = None
+    write_bytes: Optional[int] = None
+
+
+def read_sample(pid: int) -> Optional[ProcessSample]:
+    # three small reads from /proc per process, no subprocesses or external libraries
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/statm") as f:
+            rss_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    sample = ProcessSample(
+        time=time.monotonic(),
+        cpu_seconds=(int(fields[11]) + int(fields[12])) / CLOCK_TICKS,
+        rss_bytes=rss_pages * PAGE_SIZE,
+    )
+    try:
+        with open(f"/proc/{pid}/io") as f:
+            io = dict(line.split(":", 1) for line in f.read().splitlines())
+        sample.read_bytes = int(io["read_bytes"])
+        sample.write_bytes = int(io["write_bytes"])
+    except (OSError, ValueError, KeyError):
+        # io accounting can be restricted, CPU and memory are still useful
+        pass
+    return sample
+
+
+@dataclass
+class ExitUsage:
+    cpu_seconds: float
+    rss_peak: int
+    read_bytes: int
+    write_bytes: int
+
+    @classmethod
+    def from_rusage(cls, rusage) -> "ExitUsage":
+        # wait4() totals of a reaped child; maxrss is in KiB and blocks are 512 bytes on Linux,
+        # the same block I/O accounting as read_bytes/write_bytes in /proc/<pid>/io
+        return cls(
+            cpu_seconds=rusage.ru_utime + rusage.ru_stime,
+            rss_peak=rusage.ru_maxrss * 1024,
+            read_bytes=rusage.ru_inblock * 512,
+            write_bytes=rusage.ru_oublock * 512,
+        )
+
+
+@dataclass
+class ResourceUsage:
+    started: float = field(default_factory=time.monotonic)
+    samples: int = 0
+    cpu_seconds: float = 0.0
+    cpu_peak: float = 0.0
+    rss_peak: int = 0
+    rss_total: int = 0
+    read_bytes: Optional[int] = None
+    write_bytes: Optional[int] = None
+    ended: Optional[float] = None
+    _last: Optional[ProcessSample] = field(default=None, repr=False)
+
+    def add(self, sample: ProcessSample):
+        if self._last and sample.time > self._last.time:
+            rate = (sample.cpu_seconds - self._last.cpu_seconds) / (sample.time - self._last.time)
+            self.cpu_peak = max(self.cpu_peak, rate * 100)
+        self._last = sample
+        self.samples += 1
+        self.cpu_seconds = sample.cpu_seconds
+        self.rss_peak = max(self.rss_peak, sample.rss_bytes)
+        self.rss_total += sample.rss_bytes
+        self.read_bytes = sample.read_bytes
+        self.write_bytes = sample.write_bytes
+
+    def finish(self, usage: ExitUsage, now: Optional[float] = None):
+        # the exit totals also cover the time after the last sample, which /proc cannot show
+        # once the child is reaped
+        self.ended = time.monotonic() if now is None else now
+        self.cpu_seconds = max(self.cpu_seconds, usage.cpu_seconds)
+        self.rss_peak = max(self.rss_peak, usage.rss_peak)
+        self.read_bytes = usage.read_bytes
+        self.write_bytes = usage.write_bytes
+
+    @property
+    def cpu_avg(self) -> float:
+        # percent of one core over the lifetime of the process, up to its exit or the last sample
+        end = self.ended if self.ended is not None else self._last.time if self._last else self.started
+        elapsed = end - self.started
+        return self.cpu_seconds / elapsed * 100 if elapsed > 0 else 0.0
+
+    @property
+    def rss_avg(self) -> float:
+        return self.rss_total / self.samples if self.samples else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "samples": self.samples,
+            "cpu_seconds": round(self.cpu_seconds, 3),
+            "cpu_avg": round(self.cpu_avg, 1),
+            "cpu_peak": round(self.cpu_peak, 1),
+            "rss_avg": int(self.rss_avg),
+            "rss_peak": self.rss_peak,
+            "read_bytes": self.read_bytes,
+            "write_bytes": self.write_bytes,
+        }
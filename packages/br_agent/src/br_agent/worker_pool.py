@@ -0,0 +1,188 @@
+import asyncio
+import json
+import os
+import signal
+import socket
+import tempfile
+from itertools import count
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
+
+from br_agent.sampler import ExitUsage
+
+
+class WorkerProcess:
+    # Mirrors the parts of asyncio.subprocess.Process the agent uses, for a child forked by a warm worker
+    def __init__(
+        self,
+        pid: int,
+        stdout: asyncio.StreamReader,
+        stderr: asyncio.StreamReader,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        self.pid = pid
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode: int | None = None
+        self.exit_usage: Optional[ExitUsage] = None
+        self._reader = reader
+        self._writer = writer
+        self._exit = asyncio.ensure_future(self._read_exit())
+
+    async def _read_exit(self) -> int:
+        line = await self._reader.readline()
+        self._writer.close()
+        # a worker that dies mid-run cannot report the exit code
+        message = json.loads(line) if line else {"returncode": -1}
+        if message.get("rusage"):
+            self.exit_usage = ExitUsage.from_rusage(SimpleNamespace(**message["rusage"]))
+        self.returncode = message["returncode"]
+        return self.returncode
+
+    async def wait(self) -> int:
+        return await asyncio.shield(self._exit)
+
+    def send_signal(self, sig: int):
+        if self.returncode is None:
+            os.kill(self.pid, sig)
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+
+class WarmWorker:
+    def __init__(self, python: Path, socket_path: Path, env: dict[str, str] | None = None):
+        self.python = python
+        self.socket_path = socket_path
+        self._env = env
+        self._proc: asyncio.subprocess.Process | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    async def start(self, timeout: float = 60.0):
+        self._proc = await asyncio.create_subprocess_exec(
+            str(self.python),
+            "-m",
+            "br_cli.worker",
+            "--socket",
+            str(self.socket_path),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=self._env,
+        )
+        try:
+            line = await asyncio.wait_for(self._proc.stdout.readline(), timeout)
+        except asyncio.TimeoutError:
+            line = b""
+        if line.strip() != b"READY":
+            await self.stop()
+            raise RuntimeError(f"Warm worker for {self.python} failed to start")
+
+    async def spawn(
+        self,
+        module: str,
+        argv: list[str],
+        env: dict[str, str],
+        cwd: Path | None = None,
+        placement: dict | None = None,
+    ) -> WorkerProcess:
+        if not self.running:
+            raise RuntimeError(f"Warm worker for {self.python} is not running")
+        # the child's environment is replaced with env, as for a new interpreter
+        request = {"module": module, "argv": argv, "env": env, "cwd": str(cwd or Path.cwd())}
+        if placement:
+            # see placement.apply_settings, applied by the child right after fork
+            request["placement"] = placement
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(self.socket_path))
+            socket.send_fds(sock, [json.dumps(request).encode() + b"\n"], [out_w, err_w])
+        except OSError:
+            sock.close()
+            os.close(out_r)
+            os.close(err_r)
+            raise
+        finally:
+            os.close(out_w)
+            os.close(err_w)
+
+        sock.setblocking(False)
+        reader, writer = await asyncio.open_unix_connection(sock=sock)
+        line = await reader.readline()
+        if not line:
+            writer.close()
+            os.close(out_r)
+            os.close(err_r)
+            raise RuntimeError(f"Warm worker for {self.python} did not start the sequence")
+        pid = json.loads(line)["pid"]
+        stdout = await _pipe_reader(out_r)
+        stderr = await _pipe_reader(err_r)
+        return WorkerProcess(pid, stdout, stderr, reader, writer)
+
+    async def stop(self, timeout: float = 5.0):
+        if not self.running:
+            return
+        self._proc.stdin.close()
+        try:
+            await asyncio.wait_for(self._proc.wait(), timeout)
+        except asyncio.TimeoutError:
+            self._proc.kill()
+            await self._proc.wait()
+
+
+class WorkerPool:
+    def __init__(self, socket_dir: Path | None = None):
+        self._socket_dir = Path(socket_dir or tempfile.gettempdir())
+        self._ids = count(1)
+        self._workers: dict[Path, asyncio.Task] = {}
+
+    async def get(self, python: Path) -> WarmWorker:
+        task = self._workers.get(python)
+        if task is None or (task.done() and (task.exception() or not task.result().running)):
+            task = asyncio.ensure_future(self._start(python))
+            self._workers[python] = task
+        return await asyncio.shield(task)
+
+    async def _start(self, python: Path) -> WarmWorker:
+        socket_path = self._socket_dir / f"benderr_worker_{os.getpid()}_{next(self._ids)}.sock"
+        worker = WarmWorker(python, socket_path)
+        await worker.start()
+        return worker
+
+    async def spawn(
+        self,
+        python: Path,
+        module: str,
+        argv: list[str],
+        env: dict[str, str],
+        cwd: Path | None = None,
+        placement: dict | None = None,
+    ) -> WorkerProcess:
+        worker = await self.get(python)
+        return await worker.spawn(module, argv, env, cwd, placement)
+
+    async def close(self):
+        tasks = list(self._workers.values())
+        self._workers.clear()
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+                continue
+            if not task.cancelled() and task.exception() is None:
+                await task.result().stop()
+
+
+async def _pipe_reader(fd: int) -> asyncio.StreamReader:
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), os.fdopen(fd, "rb", buffering=0))
+    return reader
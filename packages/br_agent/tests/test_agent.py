@@ -0,0 +1,299 @@
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from br_agent.agent import Agent, SeqStatus
+from br_agent.agent import TestSpec as PlanTest
+from br_agent.env_manager import EnvManager
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "steps.json"
+    path.write_text("[]")
+    return path
+
+
+def make_agent(tmp_path, tests, max_parallel=1):
+    return Agent(
+        tests=tests,
+        env_manager=EnvManager(root=tmp_path / "envs"),
+        required_packages=[],
+        max_parallel=max_parallel,
+    )
+
+
+def start(agent, index):
+    assert index in agent.ready()
+    rt = agent.runtime[index]
+    agent.scheduler.acquire(rt.id)
+    rt.status = SeqStatus.RUNNING
+
+
+def finish(agent, index, status=SeqStatus.COMPLETED):
+    rt = agent.runtime[index]
+    agent.scheduler.release(rt.id)
+    rt.status = status
+
+
+def test_serial_plan_runs_in_order(tmp_path, config_path):
+    agent = make_agent(tmp_path, [PlanTest("a", config_path), PlanTest("b", config_path)])
+    assert agent.ready() == [0]
+    start(agent, 0)
+    assert agent.ready() == []
+    finish(agent, 0)
+    assert agent.ready() == [1]
+
+
+def test_independent_tests_run_concurrently(tmp_path, config_path):
+    tests = [
+        PlanTest("a", config_path),
+        PlanTest("b", config_path),
+        PlanTest("c", config_path, depends_on=["a", "b"]),
+    ]
+    agent = make_agent(tmp_path, tests, max_parallel=4)
+    assert agent.ready() == [0, 1]
+    start(agent, 0)
+    start(agent, 1)
+    finish(agent, 0)
+    assert agent.ready() == []
+    finish(agent, 1)
+    assert agent.ready() == [2]
+
+
+def test_shared_resource_is_exclusive(tmp_path, config_path):
+    tests = [
+        PlanTest("a", config_path, resources=["dmm"]),
+        PlanTest("b", config_path, resources=["dmm"]),
+        PlanTest("c", config_path, resources=["scope"]),
+    ]
+    agent = make_agent(tmp_path, tests, max_parallel=3)
+    assert agent.ready() == [0, 2]
+    start(agent, 0)
+    assert agent.ready() == [2]
+    start(agent, 2)
+    finish(agent, 0)
+    assert agent.ready() == [1]
+    start(agent, 1)
+    assert agent.runtime[1].status == SeqStatus.RUNNING
+
+
+def test_failed_dependency_skips_dependents(tmp_path, config_path):
+    tests = [
+        PlanTest("a", config_path),
+        PlanTest("b", config_path, depends_on=["a"]),
+        PlanTest("c", config_path, depends_on=["b"]),
+    ]
+    agent = make_agent(tmp_path, tests)
+    start(agent, 0)
+    finish(agent, 0, SeqStatus.FAILED)
+    assert agent.ready() == []
+    assert agent.is_done()
+    assert [rt.status for rt in agent.runtime[1:]] == [SeqStatus.SKIPPED, SeqStatus.SKIPPED]
+
+
+def test_start_sequence_rejects_blocked_test(tmp_path, config_path):
+    agent = make_agent(tmp_path, [PlanTest("a", config_path), PlanTest("b", config_path, depends_on=["a"])])
+    with pytest.raises(RuntimeError):
+        asyncio.run(agent.start_sequence(1))
+
+
+def test_plan_validation(tmp_path, config_path):
+    with pytest.raises(ValueError, match="unknown test"):
+        make_agent(tmp_path, [PlanTest("a", config_path, depends_on=["missing"])])
+    with pytest.raises(ValueError, match="cycle"):
+        make_agent(
+            tmp_path,
+            [PlanTest("a", config_path, depends_on=["b"]), PlanTest("b", config_path, depends_on=["a"])],
+        )
+    with pytest.raises(ValueError, match="Duplicate"):
+        make_agent(tmp_path, [PlanTest("a", config_path), PlanTest("a", config_path)])
+    with pytest.raises(ValueError):
+        make_agent(tmp_path, [PlanTest("a", config_path)], max_parallel=0)
+
+
+def test_test_id_defaults_to_sequence_name(tmp_path, config_path):
+    agent = make_agent(tmp_path, [PlanTest("a", config_path), PlanTest("a", config_path, id="a-second")])
+    assert [rt.id for rt in agent.runtime] == ["a", "a-second"]
+
+
+class SlowEnvManager:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.active = 0
+        self.peak = 0
+        self.prepared = []
+        self._lock = threading.Lock()
+
+    def ensure_env(self, sequence_name, requirements):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+            self.prepared.append(sequence_name)
+        if self.fail:
+            raise RuntimeError("install failed")
+        return Path("/nonexistent/python")
+
+
+def test_envs_prepared_concurrently_once_per_sequence(config_path):
+    env_manager = SlowEnvManager()
+    tests = [PlanTest(name, config_path, id=f"{name}-{i}") for i, name in enumerate(["a", "b", "c", "a"])]
+    agent = Agent(tests=tests, env_manager=env_manager, required_packages=[], env_concurrency=2)
+
+    async def prepare():
+        agent.prepare_envs()
+        await asyncio.gather(*agent._env_tasks.values())
+
+    asyncio.run(prepare())
+    assert sorted(env_manager.prepared) == ["a", "b", "c"]
+    assert env_manager.peak == 2
+
+
+def test_env_failure_fails_test_and_releases_leases(config_path):
+    tests = [PlanTest("a", config_path, resources=["dmm"]), PlanTest("b", config_path, depends_on=["a"])]
+    agent = Agent(tests=tests, env_manager=SlowEnvManager(fail=True), required_packages=[])
+
+    handle = asyncio.run(agent.start_sequence(0))
+    assert handle.pid is None
+    assert handle.status == agent.runtime[0].status == SeqStatus.FAILED
+    assert agent.scheduler.stats()["dmm"].in_use == 0
+    assert agent.is_done()
+    assert agent.runtime[1].status == SeqStatus.SKIPPED
+
+
+def test_cancelled_env_collection_waits_for_eviction(config_path):
+    evicting, evicted = threading.Event(), threading.Event()
+
+    class CollectingEnvManager(SlowEnvManager):
+        def collect_garbage(self, budget, keep):
+            evicting.set()
+            self.keep = set(keep)
+            time.sleep(0.2)
+            evicted.set()
+            return []
+
+    env_manager = CollectingEnvManager()
+    tests = [PlanTest("a", config_path), PlanTest("b", config_path, depends_on=["a"])]
+    agent = Agent(tests=tests, env_manager=env_manager, required_packages=[])
+
+    async def run():
+        agent.prepare_envs()
+        task = asyncio.create_task(agent.collect_envs(0))
+        while not evicting.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return evicted.is_set()
+
+    assert asyncio.run(run())
+    assert env_manager.keep == {"a", "b"}
+
+
+def fake_spawn(code):
+    async def spawn(py, args, env, placement=None):
+        return await asyncio.create_subprocess_exec(
+            sys.executable, "-c", code, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+
+    return spawn
+
+
+def test_wait_any_reports_completion_without_polling(config_path):
+    tests = [PlanTest("a", config_path), PlanTest("b", config_path, depends_on=["a"])]
+    agent = Agent(tests=tests, env_manager=SlowEnvManager(), required_packages=[])
+    agent._spawn = fake_spawn("pass")
+
+    async def run():
+        finished = []
+        while not agent.is_done():
+            for index in agent.ready():
+                agent.launch(index)
+            finished += [handle.id for handle in await agent.wait_any()]
+        return finished
+
+    assert asyncio.run(run()) == ["a", "b"]
+    assert [rt.status for rt in agent.runtime] == [SeqStatus.COMPLETED, SeqStatus.COMPLETED]
+    assert agent.runtime[0].ended_at <= agent.runtime[1].started_at
+
+
+def test_failed_finalization_fails_test_and_finishes_handle(config_path, capsys):
+    tests = [PlanTest("a", config_path), PlanTest("b", config_path, depends_on=["a"])]
+    agent = Agent(tests=tests, env_manager=SlowEnvManager(), required_packages=[])
+    agent._spawn = fake_spawn("pass")
+
+    async def broken_close():
+        raise OSError("disk full")
+
+    async def run():
+        handle = agent.launch(0)
+        await handle.started
+        agent.runtime[0].output.close = broken_close
+        return await asyncio.wait_for(agent.wait_any(), timeout=5.0)
+
+    [handle] = asyncio.run(run())
+    assert handle.status == SeqStatus.FAILED
+    assert "Could not finalize 'a': disk full" in capsys.readouterr().err
+    assert agent.is_done()
+    assert agent.runtime[1].status == SeqStatus.SKIPPED
+
+
+def test_cancel_terminates_child_and_skips_dependents(config_path):
+    tests = [PlanTest("a", config_path), PlanTest("b", config_path, depends_on=["a"])]
+    agent = Agent(tests=tests, env_manager=SlowEnvManager(), required_packages=[])
+    agent._spawn = fake_spawn("import time; time.sleep(30)")
+
+    async def run():
+        handle = await agent.start_sequence(0)
+        assert handle.status == SeqStatus.RUNNING
+        assert await agent.wait_any(timeout=0.05) == set()
+        assert await handle.cancel(grace=5.0) == SeqStatus.CANCELLED
+        return handle
+
+    handle = asyncio.run(run())
+    assert handle.runtime.proc.returncode is not None
+    assert all(stats.in_use == 0 for stats in agent.scheduler.stats().values())
+    assert agent.is_done()
+    assert agent.runtime[1].status == SeqStatus.SKIPPED
+
+
+def test_cancel_while_preparing_env(config_path):
+    agent = Agent(tests=[PlanTest("a", config_path)], env_manager=SlowEnvManager(), required_packages=[])
+
+    async def run():
+        handle = agent.launch(0)
+        assert handle.status == SeqStatus.PREPARING
+        return await handle.cancel()
+
+    assert asyncio.run(run()) == SeqStatus.CANCELLED
+    assert agent.runtime[0].proc is None
+
+
+def test_cancel_while_spawning_reaps_child(config_path):
+    agent = Agent(tests=[PlanTest("a", config_path)], env_manager=SlowEnvManager(), required_packages=[])
+    spawned = []
+
+    async def slow_spawn(py, args, env, placement=None):
+        proc = await fake_spawn("import time; time.sleep(30)")(py, args, env)
+        spawned.append(proc)
+        # the child exists but the handover to the agent is not finished yet
+        await asyncio.sleep(0.2)
+        return proc
+
+    agent._spawn = slow_spawn
+
+    async def run():
+        handle = agent.launch(0)
+        while not spawned:
+            await asyncio.sleep(0.01)
+        return await handle.cancel()
+
+    assert asyncio.run(run()) == SeqStatus.CANCELLED
+    assert spawned[0].returncode is not None
+    assert agent.runtime[0].proc is None
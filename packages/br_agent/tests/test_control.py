@@ -0,0 +1,114 @@
+import asyncio
+import socket
+from pathlib import Path
+
+import pytest
+from br_agent.agent import Agent, SeqStatus
+from br_agent.agent import TestSpec as PlanTest
+from br_agent.control import AgentControl, ControlClient, ControlServer, WatchOverflow
+
+
+class InstantEnvManager:
+    def ensure_env(self, sequence_name, requirements):
+        return Path("/nonexistent/python")
+
+
+@pytest.fixture
+def agent(tmp_path):
+    config_path = tmp_path / "steps.json"
+    config_path.write_text("[]")
+    tests = [PlanTest("a", config_path), PlanTest("b", config_path, depends_on=["a"])]
+    return Agent(tests=tests, env_manager=InstantEnvManager(), required_packages=[])
+
+
+def test_local_control_streams_deltas(agent):
+    async def run():
+        control = AgentControl(agent)
+        updates = control.watch()
+        snapshot = await anext(updates)
+        assert snapshot.snapshot and [row["status"] for row in snapshot.tests] == ["PENDING", "PENDING"]
+
+        assert control.start_test("missing") == (False, "Unknown test 'missing'")
+        assert control.start_test("b")[0] is False
+        assert control.start_test("a") == (True, "Started 'a'")
+
+        delta = await anext(updates)
+        assert not delta.snapshot and delta.revision == 1
+        assert [(row["id"], row["status"]) for row in delta.tests] == [("a", "PREPARING")]
+        # the env cannot be used, so the test fails and nothing else is started
+        await agent.wait_all()
+        assert (await anext(updates)).tests[0]["status"] == "FAILED"
+
+        control.close()
+        assert [update async for update in updates] == []
+
+    asyncio.run(run())
+
+
+def test_stalled_watcher_is_disconnected(agent):
+    async def run():
+        control = AgentControl(agent, watch_queue_size=2)
+        stalled = control.watch()
+        await anext(stalled)
+        for _ in range(3):
+            control._on_change(agent.runtime[0])
+        # the updates were dropped, not buffered
+        assert control._watchers == []
+        with pytest.raises(WatchOverflow):
+            await anext(stalled)
+
+    asyncio.run(run())
+
+
+def test_grpc_control_service(agent, tmp_path):
+    async def run():
+        server = ControlServer(AgentControl(agent), str(tmp_path / "agent.sock"))
+        await server.start()
+        client = ControlClient(server.address)
+        try:
+            rows = await asyncio.to_thread(client.list_tests)
+            assert [row["id"] for row in rows] == ["a", "b"]
+
+            watch = client.watch()
+            snapshot = await asyncio.to_thread(next, watch)
+            assert snapshot.snapshot and len(snapshot.tests) == 2
+
+            ok, message = await asyncio.to_thread(client.cancel_test, "b")
+            assert ok, message
+            delta = await asyncio.to_thread(next, watch)
+            assert delta.tests[0]["id"] == "b" and delta.tests[0]["status"] == "CANCELLED"
+            watch.close()
+        finally:
+            client.close()
+            await server.stop()
+
+    asyncio.run(run())
+    assert agent.runtime[1].status == SeqStatus.CANCELLED
+    assert not (tmp_path / "agent.sock").exists()
+
+
+def test_control_socket_of_a_running_agent_is_not_taken_over(agent, tmp_path):
+    path = tmp_path / "agent.sock"
+
+    async def run():
+        first = ControlServer(AgentControl(agent), str(path))
+        await first.start()
+        try:
+            with pytest.raises(RuntimeError, match="Another agent"):
+                await ControlServer(AgentControl(agent), str(path)).start()
+            client = ControlClient(first.address)
+            try:
+                assert len(await asyncio.to_thread(client.list_tests)) == 2
+            finally:
+                client.close()
+        finally:
+            await first.stop()
+
+        # the socket file of an agent that died is replaced
+        with socket.socket(socket.AF_UNIX) as stale:
+            stale.bind(str(path))
+        second = ControlServer(AgentControl(agent), str(path))
+        await second.start()
+        await second.stop()
+
+    asyncio.run(run())
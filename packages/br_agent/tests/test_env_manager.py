@@ -0,0 +1,162 @@
+import os
+from pathlib import Path
+
+import pytest
+from br_agent import env_manager
+from br_agent.env_manager import EnvManager
+
+
+@pytest.fixture
+def installs(monkeypatch):
+    calls = []
+    monkeypatch.setattr(env_manager.subprocess, "run", lambda cmd, check: calls.append(cmd))
+    return calls
+
+
+@pytest.fixture
+def wheels(tmp_path):
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "br_sdk-0.1.0-py3-none-any.whl").write_bytes(b"sdk")
+    (dist / "br_hw-0.1.0-py3-none-any.whl").write_bytes(b"hw")
+    return dist
+
+
+def make_manager(tmp_path, wheels):
+    manager = EnvManager(root=tmp_path / "envs", find_links=wheels, allow_online=False)
+    manager.uv_exe = "uv"
+    return manager
+
+
+REQUIREMENTS = ["br_sdk-0.1.0-py3-none-any.whl", "br_hw-0.1.0-py3-none-any.whl"]
+
+
+def test_unchanged_env_skips_install(tmp_path, wheels, installs):
+    manager = make_manager(tmp_path, wheels)
+    py = manager.ensure_env("demo", REQUIREMENTS)
+    assert len(installs) == 1
+    assert installs[0][-2:] == [str(wheels / req) for req in REQUIREMENTS]
+
+    assert manager.ensure_env("demo", REQUIREMENTS) == py
+    assert len(installs) == 1
+
+
+def test_changed_wheel_is_reinstalled_alone(tmp_path, wheels, installs):
+    manager = make_manager(tmp_path, wheels)
+    manager.ensure_env("demo", REQUIREMENTS)
+    (wheels / "br_hw-0.1.0-py3-none-any.whl").write_bytes(b"hw rebuilt")
+
+    manager.ensure_env("demo", REQUIREMENTS)
+    assert len(installs) == 2
+    assert installs[1][-1] == str(wheels / "br_hw-0.1.0-py3-none-any.whl")
+    assert str(wheels / "br_sdk-0.1.0-py3-none-any.whl") not in installs[1]
+    assert "--reinstall-package" in installs[1]
+
+
+def test_pip_reinstalls_changed_wheel_without_dependencies(tmp_path, wheels, installs):
+    manager = make_manager(tmp_path, wheels)
+    manager.ensure_env("demo", REQUIREMENTS[:1])
+    manager.uv_exe = None
+    (wheels / "br_sdk-0.1.0-py3-none-any.whl").write_bytes(b"sdk rebuilt")
+
+    manager.ensure_env("demo", REQUIREMENTS)
+    sdk, hw = (str(wheels / req) for req in REQUIREMENTS)
+    assert installs[1][-3:] == ["--force-reinstall", "--no-deps", sdk]
+    assert installs[2][-2:] == [sdk, hw]
+    assert "--force-reinstall" not in installs[2]
+
+
+def test_new_requirement_installed_without_reinstall(tmp_path, wheels, installs):
+    manager = make_manager(tmp_path, wheels)
+    manager.ensure_env("demo", REQUIREMENTS[:1])
+    manager.ensure_env("demo", REQUIREMENTS)
+    assert installs[1][-1] == str(wheels / "br_hw-0.1.0-py3-none-any.whl")
+    assert "--reinstall-package" not in installs[1]
+
+
+def test_failed_install_does_not_update_manifest(tmp_path, wheels, monkeypatch):
+    manager = make_manager(tmp_path, wheels)
+
+    def fail(cmd, check):
+        raise env_manager.subprocess.CalledProcessError(1, cmd)
+
+    monkeypatch.setattr(env_manager.subprocess, "run", fail)
+    with pytest.raises(env_manager.subprocess.CalledProcessError):
+        manager.ensure_env("demo", REQUIREMENTS)
+    assert not (tmp_path / "envs" / "demo" / env_manager.MANIFEST_NAME).exists()
+
+
+def test_template_envs_share_one_install(tmp_path, wheels, monkeypatch):
+    manager = make_manager(tmp_path, wheels)
+    manager.template_envs = True
+    installs = []
+
+    def install(cmd, check):
+        installs.append(cmd)
+        py = Path(cmd[cmd.index("--python") + 1])
+        site = env_manager._site_packages(py.parent.parent)
+        (site / "fake_pkg").mkdir()
+        (site / "fake_pkg" / "__init__.py").write_text("VALUE = 1\n")
+        (py.parent / "fake-cli").write_text(f"#!{py}\nimport fake_pkg\n")
+
+    monkeypatch.setattr(env_manager.subprocess, "run", install)
+    py_a = manager.ensure_env("a", REQUIREMENTS)
+    py_b = manager.ensure_env("b", REQUIREMENTS)
+    assert len(installs) == 1
+
+    module_a = env_manager._site_packages(py_a.parent.parent) / "fake_pkg" / "__init__.py"
+    module_b = env_manager._site_packages(py_b.parent.parent) / "fake_pkg" / "__init__.py"
+    assert module_a.stat().st_ino == module_b.stat().st_ino
+    # shared files are read-only, a sequence writing into one must not change its siblings
+    assert not module_a.stat().st_mode & 0o222
+    assert (py_b.parent / "fake-cli").read_text().startswith(f"#!{py_b}\n")
+
+    assert manager.ensure_env("b", REQUIREMENTS) == py_b
+    assert len(installs) == 1
+
+
+def make_env(root, name, size, last_used):
+    env_dir = root / name
+    env_dir.mkdir(parents=True)
+    (env_dir / "payload").write_bytes(b"x" * size)
+    (env_dir / env_manager.MANIFEST_NAME).write_text("{}")
+    os.utime(env_dir, (last_used, last_used))
+    return env_dir
+
+
+def test_garbage_collection_evicts_least_recently_used(tmp_path, wheels):
+    manager = make_manager(tmp_path, wheels)
+    root = manager.root
+    make_env(root, "oldest", 100, 1000)
+    make_env(root, "old", 100, 2000)
+    make_env(root, "in-plan", 100, 500)
+    make_env(root, "recent", 100, 3000)
+
+    assert manager.collect_garbage(budget=250, keep={"in-plan"}) == ["oldest", "old"]
+    assert sorted(p.name for p in root.iterdir() if p.is_dir()) == ["in-plan", "recent"]
+    assert manager.collect_garbage(budget=250, keep={"in-plan"}) == []
+
+
+def test_garbage_collection_keeps_linked_templates(tmp_path, wheels):
+    manager = make_manager(tmp_path, wheels)
+    root = manager.root
+    template = make_env(root, f"{env_manager.TEMPLATE_DIR}/abc", 1000, 100)
+    env_dir = make_env(root, "demo", 10, 200)
+    os.link(template / "payload", env_dir / "shared")
+    manager._touch("demo", template=f"{env_manager.TEMPLATE_DIR}/abc")
+
+    assert manager.collect_garbage(budget=500, keep={"demo"}) == []
+    assert template.exists()
+    assert manager.collect_garbage(budget=500) == ["demo", f"{env_manager.TEMPLATE_DIR}/abc"]
+
+
+def test_garbage_collection_ignores_foreign_directories(tmp_path, wheels):
+    manager = make_manager(tmp_path, wheels)
+    root = manager.root
+    foreign = root / "backups"
+    foreign.mkdir()
+    (foreign / "data").write_bytes(b"x" * 1000)
+    make_env(root, "old", 100, 1000)
+
+    assert manager.collect_garbage(budget=0) == ["old"]
+    assert (foreign / "data").exists()
@@ -0,0 +1,29 @@
+from br_agent.event_store import EventStore
+
+
+def fill(store):
+    store.append("a", "started", id="1", name="step")
+    store.append("a", "ended", id="1", name="step", verdict="passed")
+    store.append("b", "log", level="WARNING", message="careful")
+    store.append("b", "ended", id="1", name="step", verdict="failed")
+
+
+def test_tail_is_bounded_and_history_is_on_disk(tmp_path):
+    store = EventStore(tmp_path / "run" / "events.jsonl", tail_size=2)
+    fill(store)
+
+    assert [event["seq"] for event in store.tail()] == [2, 3]
+    assert [event["type"] for event in store.query(test_id="a")] == ["started", "ended"]
+    assert [event["message"] for event in store.query(type="log")] == ["careful"]
+    store.close()
+    assert len(list(store.query())) == store.total == 4
+
+
+def test_counts_aggregate_per_test():
+    store = EventStore()
+    fill(store)
+
+    counts = store.counts()
+    assert counts["a"] == {"started": 1, "ended": 1, "passed": 1}
+    assert counts["b"] == {"log": 1, "log_warning": 1, "ended": 1, "failed": 1}
+    assert [event["seq"] for event in store.query(test_id="b")] == [2, 3]
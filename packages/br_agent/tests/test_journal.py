@@ -0,0 +1,93 @@
+import subprocess
+import sys
+import time
+
+import pytest
+from br_agent.agent import Agent, SeqStatus
+from br_agent.agent import TestSpec as PlanTest
+from br_agent.env_manager import EnvManager
+from br_agent.journal import Journal, journal_path, plan_fingerprint, process_start_time
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "steps.json"
+    path.write_text("[]")
+    return path
+
+
+def make_agent(tmp_path, config_path, journal):
+    tests = [
+        PlanTest("a", config_path),
+        PlanTest("b", config_path, depends_on=["a"]),
+        PlanTest("c", config_path, depends_on=["b"]),
+    ]
+    return Agent(tests=tests, env_manager=EnvManager(root=tmp_path / "envs"), required_packages=[], journal=journal)
+
+
+def test_resume_keeps_finished_tests(tmp_path, config_path):
+    path = tmp_path / "journal.jsonl"
+    journal = Journal(path, "plan-1")
+    agent = make_agent(tmp_path, config_path, journal)
+    assert journal.open(resume=True) == {}
+    agent._set_status(agent.runtime[0], SeqStatus.COMPLETED)
+    agent._set_status(agent.runtime[1], SeqStatus.PREPARING)
+    journal.close()
+
+    resumed = Journal(path, "plan-1")
+    agent = make_agent(tmp_path, config_path, resumed)
+    assert agent.restore(resumed.open(resume=True)) == ["a"]
+    assert [rt.status for rt in agent.runtime] == [SeqStatus.COMPLETED, SeqStatus.PENDING, SeqStatus.PENDING]
+    assert agent.ready() == [1]
+    resumed.finish()
+
+    # a finished run or another plan starts from scratch
+    assert Journal(path, "plan-1").open(resume=True) == {}
+    assert Journal(path, "plan-2").open(resume=True) == {}
+
+
+def test_orphaned_child_is_terminated_on_resume(tmp_path, config_path):
+    orphan = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        start_time = process_start_time(orphan.pid)
+        if start_time is None:
+            pytest.skip("process start times need /proc")
+        records = {"a": {"id": "a", "status": "RUNNING", "pid": orphan.pid, "pid_start": start_time}}
+        agent = make_agent(tmp_path, config_path, None)
+        assert agent.restore(records) == []
+        assert orphan.wait(timeout=5) != 0
+        assert agent.runtime[0].status == SeqStatus.PENDING
+
+        # a reused pid must not be killed
+        records["a"]["pid_start"] = start_time - 1
+        other = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        records["a"]["pid"] = other.pid
+        agent.restore(records)
+        time.sleep(0.1)
+        assert other.poll() is None
+        other.kill()
+        other.wait()
+    finally:
+        orphan.kill()
+        orphan.wait()
+
+
+def test_plans_sharing_an_output_dir_keep_separate_journals(tmp_path):
+    first, second = tmp_path / "first.yaml", tmp_path / "second.yaml"
+    first.write_text("tests: [a]\n")
+    second.write_text("tests: [b]\n")
+    paths = [journal_path(tmp_path, plan_fingerprint(plan)) for plan in (first, second)]
+    assert paths[0] != paths[1]
+    assert all(path.parent == tmp_path for path in paths)
+
+    journal = Journal(paths[0], plan_fingerprint(first))
+    journal.open()
+    journal.record({"id": "a", "status": "completed"})
+    journal.close()
+    other = Journal(paths[1], plan_fingerprint(second))
+    other.open()
+    other.close()
+
+    resumed = Journal(paths[0], plan_fingerprint(first))
+    assert resumed.open(resume=True)["a"]["status"] == "completed"
+    resumed.close()
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+
+from br_agent.output import OutputCapture
+
+
+def test_output_is_spooled_to_log_and_ring_is_bounded(tmp_path, capsys):
+    log_path = tmp_path / "run" / "demo.log"
+    capture = OutputCapture(log_path, prefix="[demo] ", ring_size=100, console_limit=1000)
+
+    async def run():
+        capture.start()
+        capture.feed(b"first\nsec")
+        capture.feed(b"ond\n")
+        capture.feed(b"oops\n", is_err=True)
+        await capture.close()
+
+    asyncio.run(run())
+    assert log_path.read_bytes() == b"first\nsecond\noops\n"
+    assert capture.tail() == b"first\nsecond\noops\n"
+    out, err = capsys.readouterr()
+    assert out == "[demo] first\n[demo] second\n"
+    assert err == "[demo] oops\n"
+
+    capture.feed(b"x" * 500)
+    assert len(capture.tail()) == 100
+
+
+def test_console_skips_output_beyond_limit(capsys):
+    capture = OutputCapture(console_limit=64)
+
+    async def run():
+        for i in range(100):
+            capture.feed(f"line {i:03}\n".encode())
+        await capture.flush()
+
+    asyncio.run(run())
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("... ") and "bytes of output skipped" in lines[0]
+    assert lines[-1] == "line 099"
+    assert len(lines) <= 64 // len("line 000\n") + 2
+    assert capture.total_bytes == 900
+
+
+def test_forward_reads_stream_in_chunks():
+    capture = OutputCapture()
+
+    async def run():
+        stream = asyncio.StreamReader()
+        stream.feed_data(b"a" * 200_000)
+        stream.feed_eof()
+        await capture.forward(stream)
+
+    asyncio.run(run())
+    assert capture.total_bytes == 200_000
+
+
+def test_log_writes_are_serialized_and_close_waits_for_them(tmp_path, monkeypatch):
+    capture = OutputCapture(tmp_path / "demo.log", interval=0.01)
+    write = capture._write
+    active = []
+    overlapped = threading.Event()
+
+    def slow_write(data):
+        active.append(data)
+        if len(active) > 1:
+            overlapped.set()
+        time.sleep(0.05)
+        write(data)
+        active.remove(data)
+
+    monkeypatch.setattr(capture, "_write", slow_write)
+
+    async def run():
+        capture.start()
+        for i in range(20):
+            capture.feed(f"line {i:02}\n".encode())
+            await asyncio.sleep(0.005)
+        await asyncio.gather(capture.flush(), capture.flush())
+        await capture.close()
+
+    asyncio.run(run())
+    assert not overlapped.is_set()
+    assert (tmp_path / "demo.log").read_text() == "".join(f"line {i:02}\n" for i in range(20))
@@ -0,0 +1,70 @@
+import asyncio
+import os
+import sys
+
+import pytest
+from br_agent.placement import Placement, parse_cpus, placement_command
+from br_agent.process import start_child
+from br_cli.placement import apply_placement
+
+
+def test_parse_cpus():
+    assert parse_cpus([0, "2"]) == {0, 2}
+    assert parse_cpus("0-2, 5") == {0, 1, 2, 5}
+    assert parse_cpus("") == set()
+
+
+def test_slots_cycle_through_cpu_sets():
+    placement = Placement(slot_cpus=[{0}, {1, 2}])
+    assert [placement.cpus_for(slot) for slot in range(3)] == [{0}, {1, 2}, {0}]
+    assert Placement().cpus_for(3) == set()
+    assert not Placement().enabled
+
+
+def test_settings_for_slot():
+    placement = Placement(slot_cpus=[{1, 0}], nice=5, policy="batch", priority=0)
+    assert placement.settings(0) == {"cpus": [0, 1], "policy": "SCHED_BATCH", "priority": 0, "nice": 5}
+    # nice does not apply to real-time policies
+    assert "nice" not in Placement(nice=5, policy="fifo").settings(0)
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        Placement(policy="realtime")
+    with pytest.raises(ValueError):
+        Placement(slot_cpus=[set()])
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="affinity, priority and pidfd need Linux")
+def test_child_is_placed_before_it_runs():
+    cpu = min(os.sched_getaffinity(0))
+    nice = os.getpriority(os.PRIO_PROCESS, 0) + 5
+    settings = Placement(slot_cpus=[{cpu}], nice=nice, policy="batch").settings(0)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+    async def run():
+        code = (
+            "import os; print(sorted(os.sched_getaffinity(0)), os.getpriority(os.PRIO_PROCESS, 0),"
+            " os.sched_getscheduler(0) == os.SCHED_BATCH, os.getpid())"
+        )
+        proc = await start_child(placement_command(settings, [sys.executable, "-c", code]), env)
+        out, err = await proc.stdout.read(), await proc.stderr.read()
+        assert await proc.wait() == 0, err
+        return out.decode().split(), proc.pid
+
+    (cpus, child_nice, batch, pid), spawned_pid = asyncio.run(run())
+    assert (cpus, int(child_nice), batch) == (f"[{cpu}]", nice, "True")
+    # the shim execs the sequence, so the agent reaps the process it spawned
+    assert int(pid) == spawned_pid
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="affinity needs Linux")
+def test_placement_errors_are_reported_not_raised():
+    cpus = os.sched_getaffinity(0)
+    try:
+        [error] = apply_placement({"cpus": [4096]})
+        assert error.startswith("Could not pin to CPUs [4096]")
+        assert os.sched_getaffinity(0) == cpus
+        assert apply_placement({}) == []
+    finally:
+        os.sched_setaffinity(0, cpus)
@@ -0,0 +1,85 @@
+import pytest
+from br_agent.resources import ResourceScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_capacity_allows_concurrent_leases():
+    scheduler = ResourceScheduler({"psu": 2})
+    for test_id in ("a", "b", "c"):
+        scheduler.request(test_id, ["psu"])
+    assert scheduler.grantable() == ["a", "b"]
+    scheduler.acquire("a")
+    scheduler.acquire("b")
+    assert scheduler.grantable() == []
+    scheduler.release("a")
+    assert scheduler.grantable() == ["c"]
+
+
+def test_blocked_request_is_not_starved():
+    scheduler = ResourceScheduler({"dmm": 1, "table": 1})
+    scheduler.request("a", ["dmm"])
+    scheduler.acquire("a")
+    scheduler.request("b", ["dmm", "table"])
+    scheduler.request("c", ["table"])
+    # c could run now, but it would take the table that b is waiting for
+    assert scheduler.grantable() == []
+    scheduler.release("a")
+    assert scheduler.grantable() == ["b"]
+
+
+def test_blocked_request_reserves_only_what_it_needs():
+    scheduler = ResourceScheduler({"dmm": 1, "psu": 2, "scope": 1})
+    scheduler.request("a", ["dmm"])
+    scheduler.acquire("a")
+    scheduler.request("b", ["dmm", "psu"])
+    scheduler.request("c", ["psu"])
+    scheduler.request("d", ["psu"])
+    scheduler.request("e", ["scope"])
+    # b keeps one psu, the other one and the scope are free for later tests
+    assert scheduler.grantable() == ["c", "e"]
+
+
+def test_grantable_respects_limit():
+    scheduler = ResourceScheduler()
+    scheduler.request("a", [])
+    scheduler.request("b", [])
+    assert scheduler.grantable(limit=1) == ["a"]
+
+
+def test_wait_time_recorded_against_blocking_resource():
+    clock = FakeClock()
+    scheduler = ResourceScheduler({"dmm": 1}, clock=clock)
+    scheduler.request("a", ["dmm"])
+    scheduler.acquire("a")
+    scheduler.request("b", ["dmm", "scope"])
+    scheduler.grantable()
+    clock.now = 2.5
+    scheduler.release("a")
+    lease = scheduler.acquire("b")
+    assert lease.wait == 2.5
+    assert lease.blocked_on == ["dmm"]
+    stats = scheduler.stats()
+    assert stats["dmm"].total_wait == 2.5
+    assert stats["dmm"].grants == 2
+    assert stats["scope"].total_wait == 0.0
+
+
+def test_acquire_unavailable_raises():
+    scheduler = ResourceScheduler({"dmm": 1})
+    scheduler.request("a", ["dmm"])
+    scheduler.request("b", ["dmm"])
+    scheduler.acquire("a")
+    with pytest.raises(RuntimeError):
+        scheduler.acquire("b")
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        ResourceScheduler({"dmm": 0})
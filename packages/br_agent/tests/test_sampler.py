@@ -0,0 +1,91 @@
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from br_agent.agent import Agent, SeqStatus
+from br_agent.agent import TestSpec as PlanTest
+from br_agent.process import start_child
+from br_agent.sampler import ExitUsage, ProcessSample, ResourceUsage, read_sample
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="sampling reads /proc")
+
+
+def test_usage_tracks_peaks_and_averages():
+    usage = ResourceUsage(started=0.0)
+    usage.add(ProcessSample(time=1.0, cpu_seconds=0.5, rss_bytes=100, read_bytes=10, write_bytes=0))
+    usage.add(ProcessSample(time=2.0, cpu_seconds=1.4, rss_bytes=300, read_bytes=20, write_bytes=5))
+    usage.add(ProcessSample(time=4.0, cpu_seconds=1.6, rss_bytes=200, read_bytes=20, write_bytes=5))
+
+    assert usage.cpu_peak == pytest.approx(90.0)
+    assert usage.cpu_avg == pytest.approx(40.0)
+    assert usage.rss_peak == 300
+    assert usage.rss_avg == 200
+    assert usage.summary()["write_bytes"] == 5
+
+
+def test_exit_usage_covers_time_after_last_sample():
+    usage = ResourceUsage(started=0.0)
+    usage.add(ProcessSample(time=0.0, cpu_seconds=0.0, rss_bytes=100))
+    usage.finish(ExitUsage(cpu_seconds=1.5, rss_peak=400, read_bytes=512, write_bytes=1024), now=3.0)
+
+    assert usage.cpu_seconds == 1.5
+    assert usage.cpu_avg == pytest.approx(50.0)
+    assert usage.rss_peak == 400
+    assert (usage.read_bytes, usage.write_bytes) == (512, 1024)
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="needs pidfd")
+def test_child_process_reports_exit_usage():
+    code = "import sys, time\nend = time.process_time() + 0.2\nwhile time.process_time() < end: pass\nsys.exit(2)"
+
+    async def run():
+        proc = await start_child([sys.executable, "-c", code], dict(os.environ))
+        await proc.stdout.read()
+        return proc, await proc.wait()
+
+    proc, rc = asyncio.run(run())
+    assert rc == proc.returncode == 2
+    assert proc.exit_usage.cpu_seconds >= 0.2
+    assert proc.exit_usage.rss_peak > 0
+
+
+@linux_only
+def test_read_sample_of_own_process():
+    sample = read_sample(os.getpid())
+    assert sample.cpu_seconds > 0
+    assert sample.rss_bytes > 0
+    assert read_sample(2**22 + 1) is None
+
+
+@linux_only
+def test_agent_samples_running_children(tmp_path):
+    class InstantEnvManager:
+        def ensure_env(self, sequence_name, requirements):
+            return Path(sys.executable)
+
+    async def spawn(py, args, env, placement=None):
+        code = "import time\nend = time.time() + 0.3\nwhile time.time() < end: pass"
+        return await asyncio.create_subprocess_exec(sys.executable, "-c", code)
+
+    config_path = tmp_path / "steps.json"
+    config_path.write_text("[]")
+    agent = Agent(
+        tests=[PlanTest("a", config_path)],
+        env_manager=InstantEnvManager(),
+        required_packages=[],
+        sample_interval=0.05,
+    )
+    agent._spawn = spawn
+
+    async def run():
+        await (await agent.start_sequence(0))
+        await agent.close()
+
+    asyncio.run(run())
+    usage = agent.runtime[0].usage
+    assert agent.runtime[0].status == SeqStatus.COMPLETED
+    assert usage.samples >= 3
+    assert usage.cpu_seconds > 0 and usage.rss_peak > 0
+    assert agent.status_table()[0]["cpu_s"] != ""
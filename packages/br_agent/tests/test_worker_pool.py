@@ -0,0 +1,113 @@
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from br_agent.worker_pool import WarmWorker
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="warm workers need fork")
+
+
+@pytest.fixture
+def worker_env(tmp_path):
+    (tmp_path / "fake_sequence.py").write_text(
+        "import os, sys\n"
+        "stdin = os.fstat(0).st_rdev == os.stat(os.devnull).st_rdev\n"
+        "print('args', sys.argv[1:], os.environ.get('FAKE_TOKEN'), os.environ.get('WORKER_ONLY'), stdin)\n"
+        "print('oops', file=sys.stderr)\n"
+        "sys.exit(3)\n"
+    )
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join([str(tmp_path), *sys.path])
+    env.pop("WORKER_ONLY", None)
+    return env
+
+
+def test_warm_worker_forks_module_runs(tmp_path, worker_env):
+    async def run():
+        # variables the agent leaves out must not reach the sequence
+        worker = WarmWorker(Path(sys.executable), tmp_path / "worker.sock", env=dict(worker_env, WORKER_ONLY="1"))
+        await worker.start()
+        try:
+            results = []
+            for token in ("a", "b"):
+                env = dict(worker_env, FAKE_TOKEN=token)
+                proc = await worker.spawn("fake_sequence", ["--sequence", "demo"], env, cwd=tmp_path)
+                out = await proc.stdout.read()
+                err = await proc.stderr.read()
+                results.append((out.decode().strip(), err.decode().strip(), await proc.wait(), proc.pid))
+                # reaped by the worker, which reports the child's totals
+                assert proc.exit_usage.cpu_seconds > 0
+            return results
+        finally:
+            await worker.stop()
+
+    (out_a, err_a, rc_a, pid_a), (out_b, _, rc_b, pid_b) = asyncio.run(run())
+    assert out_a == "args ['--sequence', 'demo'] a None True"
+    assert out_b == "args ['--sequence', 'demo'] b None True"
+    assert err_a == "oops"
+    assert rc_a == rc_b == 3
+    assert pid_a != pid_b
+    assert not (tmp_path / "worker.sock").exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="affinity needs Linux")
+def test_forked_child_applies_placement(tmp_path, worker_env):
+    (tmp_path / "affinity.py").write_text("import os\nprint(sorted(os.sched_getaffinity(0)))\n")
+    cpu = min(os.sched_getaffinity(0))
+
+    async def run():
+        worker = WarmWorker(Path(sys.executable), tmp_path / "worker.sock", env=worker_env)
+        await worker.start()
+        try:
+            proc = await worker.spawn("affinity", [], worker_env, cwd=tmp_path, placement={"cpus": [cpu]})
+            out = await proc.stdout.read()
+            await proc.wait()
+            return out
+        finally:
+            await worker.stop()
+
+    assert asyncio.run(run()).decode().strip() == f"[{cpu}]"
+
+
+def test_forked_child_inherits_preloaded_modules(tmp_path, worker_env):
+    modules = ["grpc", "yaml", "br_sdk._grpc.events_pb2", "br_sdk._grpc.events_pb2_grpc", "br_sdk.sequence"]
+    (tmp_path / "loaded.py").write_text(f"import sys\nprint([name in sys.modules for name in {modules!r}])\n")
+
+    async def run():
+        worker = WarmWorker(Path(sys.executable), tmp_path / "worker.sock", env=worker_env)
+        await worker.start()
+        try:
+            proc = await worker.spawn("loaded", [], worker_env, cwd=tmp_path)
+            out = await proc.stdout.read()
+            await proc.wait()
+            return out
+        finally:
+            await worker.stop()
+
+    assert asyncio.run(run()).decode().strip() == str([True] * len(modules))
+
+
+def test_forked_entry_point_runs_without_warnings(tmp_path, worker_env):
+    async def run():
+        worker = WarmWorker(Path(sys.executable), tmp_path / "worker.sock", env=worker_env)
+        await worker.start()
+        try:
+            proc = await worker.spawn("br_cli.main", ["--help"], worker_env, cwd=tmp_path)
+            out = await proc.stdout.read()
+            err = await proc.stderr.read()
+            return out.decode(), err.decode(), await proc.wait()
+        finally:
+            await worker.stop()
+
+    out, err, rc = asyncio.run(run())
+    assert rc == 0
+    assert out.startswith("usage:")
+    assert err == ""
+
+
+def test_spawn_requires_running_worker(tmp_path):
+    worker = WarmWorker(Path(sys.executable), tmp_path / "worker.sock")
+    with pytest.raises(RuntimeError):
+        asyncio.run(worker.spawn("fake_sequence", [], {}))
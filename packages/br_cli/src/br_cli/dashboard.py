@@ -0,0 +1,206 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Union
+
+from br_sdk.br_types import Measurement, Step, StepProgress, Verdict
+from br_sdk.events import MeasurementView, StepResultView
+from rich.console import Console, Group
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
+
+if TYPE_CHECKING:
+    from br_cli.profiling import StepProfiler
+
+REFRESH_PER_SECOND = 4
+PAGE_SIZE = 10
+
+AnyMeasurement = Union[Measurement, MeasurementView]
+
+
+@dataclass
+class DashboardState:
+    # Aggregated view of a run. Events only update counters and bounded deques, so the cost per
+    # event does not depend on how much has been measured; rendering reads at most a page of rows.
+    title: str = ""
+    step: Optional[str] = None
+    step_started: float = 0.0
+    progress: Optional[float] = None
+    message: str = ""
+    streamed: int = 0
+    steps: dict[str, int] = field(default_factory=dict)
+    measurements: int = 0
+    failed: int = 0
+    recent: deque[AnyMeasurement] = field(default_factory=lambda: deque(maxlen=PAGE_SIZE))
+    failures: deque[tuple[str, AnyMeasurement]] = field(default_factory=lambda: deque(maxlen=PAGE_SIZE))
+
+    def add(self, step: str, measurements):
+        for m in measurements:
+            self.measurements += 1
+            self.recent.append(m)
+            if not m.passed:
+                self.failed += 1
+                self.failures.append((step, m))
+
+
+class Dashboard:
+    # The subscriber thread only updates the state; rich.Live redraws it from its own thread at a
+    # fixed frame rate, so a burst of events cannot queue up behind console rendering.
+
+    def __init__(self, console: Console, refresh_per_second: float = REFRESH_PER_SECOND):
+        self.console = console
+        self.state = DashboardState()
+        self._lock = threading.Lock()
+        self._live = Live(
+            console=console,
+            refresh_per_second=refresh_per_second,
+            get_renderable=self.render,
+            redirect_stderr=False,
+        )
+
+    def __enter__(self):
+        self._live.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._live.stop()
+
+    def begin(self, title: str, run_name: str = ""):
+        self.console.rule(f"[bold]{title}[/]")
+        with self._lock:
+            self.state = DashboardState(title=title)
+
+    def run_finished(self, row: dict[str, str]):
+        if row["error"]:
+            self.console.print(f"[bold red]{row['dut'] or row['sequence']} failed: {row['error']}[/]")
+
+    def profile_finished(self, profiler: "StepProfiler"):
+        for table in profiler.summary():
+            self.console.print(table)
+
+    def on_step_started(self, step: Step):
+        with self._lock:
+            self.state.step = step.name
+            self.state.step_started = time.monotonic()
+            self.state.progress = None
+            self.state.message = ""
+            self.state.streamed = 0
+
+    def on_step_progress(self, progress: StepProgress):
+        with self._lock:
+            state = self.state
+            if progress.progress is not None:
+                state.progress = progress.progress
+            if progress.message:
+                state.message = progress.message
+            state.streamed += len(progress.measurements)
+            state.add(progress.name, progress.measurements)
+
+    def on_step_ended(self, result: StepResultView):
+        with self._lock:
+            state = self.state
+            duration = time.monotonic() - state.step_started if state.step == result.name else None
+            # streamed measurements are repeated in the result, count only the rest
+            state.add(result.name, result.results[state.streamed:])
+            state.steps[result.verdict.value] = state.steps.get(result.verdict.value, 0) + 1
+            state.step = None
+            state.streamed = 0
+            failed = sum(1 for m in result.results if not m.passed)
+        # one line per step stays in the scrollback, the tables are redrawn in place
+        passed = result.verdict == Verdict.PASSED
+        color = "green" if passed else "red"
+        icon = "✅" if passed else "❌"
+        timing = f" in {duration:.2f}s" if duration is not None else ""
+        counts = f"{len(result.results)} measurements, {failed} failed" if result.results else "no measurements"
+        self.console.print(f"{icon} [bold {color}]{result.name}[/] {result.verdict.value}{timing} ({counts})")
+
+    def on_log(self, message: str, level: str):
+        pass
+
+    def render(self):
+        with self._lock:
+            state = self.state
+            header = Text.assemble(
+                (f"{state.title}  ", "bold"),
+                f"steps: {_format_counts(state.steps)}  ",
+                f"measurements: {state.measurements} ",
+                (f"({state.failed} failed)", "red" if state.failed else "green"),
+            )
+            parts = [header]
+            if state.step:
+                percent = f"{state.progress:.0%} " if state.progress is not None else ""
+                elapsed = time.monotonic() - state.step_started
+                parts.append(Text(f"🟡 {state.step} {percent}{state.message} ({elapsed:.1f}s)", style="blue"))
+            if state.recent:
+                parts.append(measurement_table(f"Last {len(state.recent)} measurements", state.recent))
+            if state.failures:
+                failures = [m for _, m in state.failures]
+                title = f"Last {len(failures)} of {state.failed} failed measurements"
+                parts.append(measurement_table(title, failures, steps=[step for step, _ in state.failures]))
+        return Group(*parts)
+
+
+def _format_counts(counts: dict[str, int]) -> str:
+    return ", ".join(f"{count} {verdict}" for verdict, count in counts.items()) or "0"
+
+
+def measurement_table(title: str, measurements, steps: Optional[list[str]] = None) -> Table:
+    table = Table(title=title)
+    if steps is not None:
+        table.add_column("Step")
+    table.add_column("Passed")
+    table.add_column("Step name")
+    table.add_column("Value")
+    table.add_column("Comparator")
+    table.add_column("Lower")
+    table.add_column("Upper")
+    table.add_column("Units")
+    for index, m in enumerate(measurements):
+        add_to_table(table, m, [steps[index]] if steps is not None else [])
+    return table
+
+
+def add_to_table(table: Table, m: AnyMeasurement, prefix: list[str]):
+    m_color = "green" if m.passed else "red"
+    m_icon = "✅" if m.passed else "❌"
+    match m.spec.type:
+        case "boolean":
+            table.add_row(
+                *prefix,
+                f"{m_icon}",
+                f"[bold {m_color}]{m.spec.name}[/]",
+                f"[{m_color}]{m.value}[/]",
+                f"{m.spec.pass_if_true}",
+                "",
+                "",
+                "",
+            )
+        case "numeric":
+            table.add_row(
+                *prefix,
+                f"{m_icon}",
+                f"[bold {m_color}]{m.spec.name}[/]",
+                f"[{m_color}]{m.value}[/]",
+                f"{m.spec.comparator}",
+                f"{m.spec.lower}",
+                f"{m.spec.upper}",
+                f"{m.spec.units}",
+            )
+        case "string":
+            table.add_row(
+                *prefix,
+                f"{m_icon}",
+                f"[bold {m_color}]{m.spec.name}[/]",
+                f"[{m_color}]{m.value}[/]",
+                "EQ",
+            )
+        case "none":
+            table.add_row(
+                *prefix,
+                f"{m_icon}",
+                f"[bold {m_color}]{m.spec.name}[/]",
+                f"[{m_color}]{m.value}[/]",
+                f"{m.spec.action}",
+            )
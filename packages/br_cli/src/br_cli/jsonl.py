@@ -0,0 +1,137 @@
+import json
+import math
+import threading
+import time
+from typing import IO, TYPE_CHECKING, Optional
+
+from br_sdk.br_types import Measurement, NoSpecAction, Step, StepProgress
+from br_sdk.events import MeasurementView, StepResultView
+
+if TYPE_CHECKING:
+    from br_cli.profiling import StepProfiler
+
+# the C accelerated encoder of the json module, compact separators and no escaping of non-ASCII text.
+# NaN and Infinity are not JSON, see _finite.
+_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, allow_nan=False, default=str).encode
+
+
+class JsonLinesWriter:
+    # One JSON object per line for machine consumers, written as events arrive.
+    # Types: run_started, step_started, step_progress, step_ended, log, profile and run.
+
+    def __init__(self, stream: IO[str], close: bool = False):
+        self._stream = stream
+        self._close = close
+        self._lock = threading.Lock()
+        self._run: Optional[str] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        with self._lock:
+            self._stream.flush()
+            if self._close:
+                self._stream.close()
+
+    def write(self, type: str, **fields):
+        record = {"type": type, "ts": round(time.time(), 6), **fields}
+        if self._run is not None:
+            record["run"] = self._run
+        try:
+            line = _encode(record) + "\n"
+        except ValueError:
+            # a failed instrument read can measure NaN or inf, strict parsers reject those
+            line = _encode(_finite(record)) + "\n"
+        with self._lock:
+            self._stream.write(line)
+            # consumers parse the stream while the run is still going
+            self._stream.flush()
+
+    def begin(self, title: str, run_name: str = ""):
+        # every record of a run carries its name, batch runs stay apart in one stream
+        self._run = run_name or title
+        self.write("run_started", title=title)
+
+    def run_finished(self, row: dict[str, str]):
+        self.write("run", **row)
+
+    def profile_finished(self, profiler: "StepProfiler"):
+        self.write(
+            "profile",
+            directory=str(profiler.output_dir),
+            phases=[{"name": p.name, "seconds": round(p.seconds, 6), "samples": p.samples} for p in profiler.phases],
+            top=profiler.top_functions(),
+        )
+
+    def on_step_started(self, step: Step):
+        self.write("step_started", id=step.id, name=step.name)
+
+    def on_step_progress(self, progress: StepProgress):
+        self.write(
+            "step_progress",
+            id=progress.id,
+            name=progress.name,
+            progress=progress.progress,
+            message=progress.message,
+            measurements=[measurement_to_dict(m) for m in progress.measurements],
+        )
+
+    def on_step_ended(self, result: StepResultView):
+        self.write(
+            "step_ended",
+            id=result.id,
+            name=result.name,
+            verdict=result.verdict.value,
+            start_time=result.start_time.isoformat() if result.start_time else None,
+            end_time=result.end_time.isoformat() if result.end_time else None,
+            measurements=[view_to_dict(m) for m in result.results],
+        )
+
+    def on_log(self, message: str, level: str):
+        self.write("log", level=level, message=message)
+
+
+def measurement_to_dict(measurement: Measurement) -> dict:
+    # streamed progress measurements, same fields as view_to_dict
+    spec = measurement.spec
+    data = {"name": spec.name, "type": spec.type.value, "value": measurement.value, "passed": measurement.passed}
+    match spec.type:
+        case "boolean":
+            data["pass_if_true"] = spec.pass_if_true
+        case "numeric":
+            data.update(comparator=spec.comparator.value, lower=spec.lower, upper=spec.upper, units=spec.units)
+        case "string":
+            data.update(expected=spec.expected, case_sensitive=spec.case_sensitive)
+        case "none":
+            data["action"] = spec.action.value
+    return data
+
+
+def view_to_dict(view: MeasurementView) -> dict:
+    # plain fields straight from the message, without building the pydantic spec
+    spec = view.message.spec
+    data = {"name": spec.name, "type": spec.type, "value": view.value, "passed": view.passed}
+    match spec.type:
+        case "boolean":
+            data["pass_if_true"] = spec.pass_if_true
+        case "numeric":
+            lower = spec.lower if spec.has_lower else None
+            upper = spec.upper if spec.has_upper else None
+            data.update(comparator=spec.comparator, lower=lower, upper=upper, units=spec.units)
+        case "string":
+            data.update(expected=spec.expected, case_sensitive=spec.case_sensitive)
+        case "none":
+            data["action"] = spec.expected if spec.has_expected else NoSpecAction.LOG.value
+    return data
+
+
+def _finite(value):
+    # non-finite floats become null
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
@@ -1,120 +1,291 @@
 import argparse
-from importlib.metadata import entry_points
+import json
+import logging
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
+from typing import Iterable
 
 from br_sdk.br_logging import setup_logger
-from br_sdk.br_types import Measurement, Step, StepResult, Verdict
+from br_sdk.br_types import Verdict
 from br_sdk.config import AppConfig
-from br_sdk.events import EventSubscriber, shutdown_event_server
-from br_sdk.parse_steps import steps_from_file
-from br_sdk.report_json import JsonReportFormatter
+from br_sdk.events import EventSubscriber, ensure_event_server, shutdown_event_server
+from br_sdk.parse_steps import StepsDefinition, steps_from_file
+from br_sdk.registry import load_sequence
+from br_sdk.report_json import JsonReportFormatter, load_report
 from rich.console import Console
 from rich.table import Table
 
+from br_cli.dashboard import Dashboard
+from br_cli.jsonl import JsonLinesWriter
+from br_cli.profiling import DEFAULT_INTERVAL, StepProfiler, safe_name
+
+Display = Dashboard | JsonLinesWriter
+
+SUBSCRIBE_TIMEOUT = 5.0
+DISPLAY_CLIENT = "br_cli"
+
 console = Console()
+LOGGER = logging.getLogger(__name__)
 
 
-def handle_step_started(step: Step):
-    console.rule(f"[bold blue]🟡 Step Start: {step.name}")
+def get_sequence(name: str):
+    return load_sequence(name)
 
 
-def handle_step_ended(result: StepResult):
-    passed = result.verdict == Verdict.PASSED
-    color = "green" if passed else "red"
-    icon = "✅" if passed else "❌"
-    console.print(f"{icon} [bold {color}]Step Complete: {result.name}[/bold {color}]")
+@dataclass
+class BatchEntry:
+    sequence: str
+    config: Path
+    dut: str = ""
+    retest: Path | None = None
+    # set for a line that could not be read, the runner records it as aborted
+    error: str = ""
 
-    table = Table(title="Measurement results")
-    table.add_column("Passed")
-    table.add_column("Step name")
-    table.add_column("Value")
-    table.add_column("Comparator")
-    table.add_column("Lower")
-    table.add_column("Upper")
-    table.add_column("Units")
-    for m in result.results:
-        add_to_table(table, m)
-    if result.results:
-        console.print(table)
 
+def read_manifest(lines: Iterable[str], sequence: str | None = None, config: Path | None = None):
+    # One entry per line, either a JSON object with sequence, config, dut and retest or just a DUT serial.
+    # Missing sequence and config fall back to --sequence and --config. Read lazily so a scanner can feed stdin.
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            fields = json.loads(line) if line.startswith("{") else {"dut": line}
+        except json.JSONDecodeError as exc:
+            # a bad line must not end the batch, the DUTs after it still get tested
+            error = f"Manifest line {number} is not valid JSON: {exc}"
+            yield BatchEntry(sequence or "", Path(config or ""), error=error)
+            continue
+        entry_sequence = fields.get("sequence", sequence)
+        entry_config = fields.get("config", config)
+        dut = str(fields.get("dut", ""))
+        if not entry_sequence or not entry_config:
+            error = f"Manifest line {number} needs a sequence and a config (or --sequence and --config)"
+            yield BatchEntry(entry_sequence or "", Path(entry_config or ""), dut, error=error)
+            continue
+        retest = Path(fields["retest"]) if fields.get("retest") else None
+        yield BatchEntry(entry_sequence, Path(entry_config), dut, retest)
 
-def add_to_table(table: Table, m: Measurement):
-    m_color = "green" if m.passed else "red"
-    m_icon = "✅" if m.passed else "❌"
-    match m.spec.type:
-        case "boolean":
-            table.add_row(
-                f"{m_icon}",
-                f"[bold {m_color}]{m.spec.name}[/]",
-                f"[{m_color}]{m.value}[/]",
-                f"{m.spec.pass_if_true}",
-                "",
-                "",
-                "",
-            )
-        case "numeric":
-            table.add_row(
-                f"{m_icon}",
-                f"[bold {m_color}]{m.spec.name}[/]",
-                f"[{m_color}]{m.value}[/]",
-                f"{m.spec.comparator}",
-                f"{m.spec.lower}",
-                f"{m.spec.upper}",
-                f"{m.spec.units}",
-            )
-        case "string":
-            table.add_row(
-                f"{m_icon}",
-                f"[bold {m_color}]{m.spec.name}[/]",
-                f"[{m_color}]{m.value}[/]",
-                "EQ",
+
+class BatchRunner:
+    # Runs manifest entries back to back in one process. Steps files are parsed once per path
+    # (and again only if they change), sequence classes are loaded once per name, and the
+    # event server and subscriber stay up for the whole batch.
+
+    def __init__(self, display: Display | None = None, profile_interval: float | None = None):
+        self.display = display
+        self.profile_interval = profile_interval
+        self._steps: dict[Path, tuple[int, StepsDefinition]] = {}
+        self._classes: dict[str, type] = {}
+        self.results: list[dict[str, str]] = []
+
+    def steps(self, path: Path) -> StepsDefinition:
+        path = path.resolve()
+        mtime = path.stat().st_mtime_ns
+        cached = self._steps.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = self._steps[path] = (mtime, steps_from_file(path))
+        return cached[1]
+
+    def sequence_class(self, name: str) -> type:
+        if name not in self._classes:
+            self._classes[name] = get_sequence(name)
+        return self._classes[name]
+
+    def run(self, entry: BatchEntry) -> Verdict:
+        started = time.perf_counter()
+        run_name = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        if entry.dut:
+            run_name = f"{safe_name(entry.dut, 'dut')}_{run_name}"
+        if self.display:
+            self.display.begin(f"{entry.dut or entry.sequence} ({entry.sequence})", run_name)
+        error = ""
+        sequence = None
+        profiler = None
+        try:
+            if entry.error:
+                raise ValueError(entry.error)
+            definition = self.steps(entry.config)
+            previous = load_report(entry.retest) if entry.retest else None
+            sequence = self.sequence_class(entry.sequence)(
+                definition.steps,
+                JsonReportFormatter(),
+                sequence_config={**definition.config, "dut_serial": entry.dut},
             )
-        case "none":
+            if self.profile_interval is not None:
+                profiler = attach_profiler(sequence, run_name, self.profile_interval)
+            sequence.run(retest=previous, run_name=run_name)
+        except Exception as exc:
+            # one broken DUT or config must not stop the station
+            error = f"{type(exc).__name__}: {exc}"
+        row = run_summary(entry.sequence, sequence, started, run_name, error, dut=entry.dut)
+        self.results.append(row)
+        if self.display:
+            if profiler:
+                self.display.profile_finished(profiler)
+            self.display.run_finished(row)
+        return Verdict(row["verdict"])
+
+    def summary(self) -> Table:
+        table = Table(title="Batch results")
+        for column in ("DUT", "Sequence", "Verdict", "Duration", "Run", "Error"):
+            table.add_column(column)
+        for row in self.results:
+            color = "green" if row["verdict"] == Verdict.PASSED else "red"
             table.add_row(
-                f"{m_icon}",
-                f"[bold {m_color}]{m.spec.name}[/]",
-                f"[{m_color}]{m.value}[/]",
-                f"{m.spec.action}",
+                row["dut"], row["sequence"], f"[{color}]{row['verdict']}[/]", row["duration"], row["run"], row["error"]
             )
+        return table
 
 
-def get_sequence(name: str):
-    eps = entry_points(group="sequences")
-    matches = {ep.name: ep.load() for ep in eps}
-    if name not in matches:
-        raise ValueError(f"Sequence '{name}' not found. Available: {list(matches)}")
-    return matches[name]
+def run_summary(
+    sequence_name: str, sequence, started: float, run_name: str, error: str = "", dut: str = ""
+) -> dict[str, str]:
+    verdict = sequence.verdict() if sequence else Verdict.ABORTED
+    if error and verdict == Verdict.PASSED:
+        verdict = Verdict.ABORTED
+    return {
+        "dut": dut,
+        "sequence": sequence_name,
+        "verdict": verdict.value,
+        "duration": f"{time.perf_counter() - started:.2f}s",
+        "run": run_name,
+        "error": error,
+    }
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Run a test sequence.")
-    parser.add_argument("--sequence", required=True, help="Entry point name for the sequence (e.g., demo-sequence)")
-    parser.add_argument("--config", required=True, type=Path, help="Path to a steps config JSON file")
-    args = parser.parse_args()
+def attach_profiler(sequence, run_name: str, interval: float) -> StepProfiler:
+    # next to the report and the log of the run
+    output_dir = Path(AppConfig.get("output_dir", tempfile.gettempdir())) / f"{run_name}_profile"
+    profiler = StepProfiler(output_dir, interval)
+    sequence.phase_hook = profiler.phase
+    return profiler
 
-    AppConfig.load(profile="cli", config_dirs=["./config"])
-    setup_logger()
-    steps_definition = steps_from_file(args.config)
 
+def start_subscriber(display: Display) -> EventSubscriber:
     subscriber = EventSubscriber(
-        on_step_started=handle_step_started,
-        on_step_ended=handle_step_ended,
-        on_log=lambda msg, level: None,
+        on_step_started=display.on_step_started,
+        on_step_ended=display.on_step_ended,
+        on_log=display.on_log,
+        on_step_progress=display.on_step_progress,
         start_server=True,
+        client=DISPLAY_CLIENT,
     )
     subscriber.start()
+    # the server is in this process, wait until the subscription is registered so no step event is dropped.
+    # An agent may already be subscribed, so wait for this subscriber in particular.
+    if not ensure_event_server().wait_for_subscriber(timeout=SUBSCRIBE_TIMEOUT, client=DISPLAY_CLIENT):
+        LOGGER.warning("Display not subscribed after %.1fs, early events may be missing", SUBSCRIBE_TIMEOUT)
+    return subscriber
+
+
+def open_display(output: str, output_file: Path | None) -> Display:
+    if output == "jsonl":
+        if output_file is None:
+            return JsonLinesWriter(sys.stdout)
+        return JsonLinesWriter(output_file.open("w", encoding="utf-8"), close=True)
+    return Dashboard(console)
+
+
+def run_batch(
+    display: Display, manifest: Path, sequence: str | None, config: Path | None, profile_interval: float | None
+) -> int:
+    with display:
+        runner = BatchRunner(display, profile_interval)
+        subscriber = start_subscriber(display)
+        try:
+            with nullcontext(sys.stdin) if str(manifest) == "-" else manifest.open() as f:
+                for entry in read_manifest(f, sequence, config):
+                    runner.run(entry)
+        finally:
+            subscriber.stop(grace_period=0.2)
+            shutdown_event_server()
+    if runner.results and isinstance(display, Dashboard):
+        console.print(runner.summary())
+    return 0 if all(row["verdict"] == Verdict.PASSED for row in runner.results) else 1
 
-    SequenceClass = get_sequence(args.sequence)
-    sequence = SequenceClass(
-        steps_definition.steps,
-        JsonReportFormatter(),
-        sequence_config=steps_definition.config,
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a test sequence.")
+    parser.add_argument("--sequence", help="Entry point name for the sequence (e.g., demo-sequence)")
+    parser.add_argument("--config", type=Path, help="Path to a steps config JSON file")
+    parser.add_argument(
+        "--retest",
+        type=Path,
+        help="JSON report of a previous run. Only its failed, aborted or missing steps (and their prerequisites) run",
+    )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        metavar="MANIFEST",
+        help="Run every entry of a manifest ('-' reads stdin) in this process. "
+        "Each line is a JSON object with sequence, config, dut and retest, or a DUT serial",
+    )
+    parser.add_argument(
+        "--output",
+        choices=["rich", "jsonl"],
+        default="rich",
+        help="rich: live console dashboard. jsonl: one JSON object per event, for other tools",
     )
-    try:
-        sequence.run()
-    finally:
-        subscriber.stop(grace_period=0.2)
-        shutdown_event_server()
+    parser.add_argument("--output-file", type=Path, help="Write the jsonl output to this file instead of stdout")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile setup, every step and cleanup. Writes pstats and collapsed stacks next to the report",
+    )
+    parser.add_argument(
+        "--profile-interval",
+        type=float,
+        default=DEFAULT_INTERVAL * 1000,
+        help="Stack sampling interval in milliseconds (default %(default)s)",
+    )
+    args = parser.parse_args()
+    if args.batch is None and (not args.sequence or not args.config):
+        parser.error("--sequence and --config are required without --batch")
+
+    AppConfig.load(profile="cli", config_dirs=["./config"])
+    setup_logger()
+    display = open_display(args.output, args.output_file)
+    profile_interval = args.profile_interval / 1000 if args.profile else None
+    if args.batch is not None:
+        sys.exit(run_batch(display, args.batch, args.sequence, args.config, profile_interval))
+
+    steps_definition = steps_from_file(args.config)
+    previous = load_report(args.retest) if args.retest else None
+
+    with display:
+        run_name = datetime.now().strftime("%Y%m%d_%H%M%S")
+        display.begin(args.sequence, run_name)
+        subscriber = start_subscriber(display)
+        started = time.perf_counter()
+        sequence = None
+        profiler = None
+        error = ""
+        try:
+            SequenceClass = get_sequence(args.sequence)
+            sequence = SequenceClass(
+                steps_definition.steps,
+                JsonReportFormatter(),
+                sequence_config=steps_definition.config,
+            )
+            if profile_interval is not None:
+                profiler = attach_profiler(sequence, run_name, profile_interval)
+            sequence.run(retest=previous, run_name=run_name)
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            subscriber.stop(grace_period=0.2)
+            shutdown_event_server()
+            if profiler:
+                display.profile_finished(profiler)
+            if isinstance(display, JsonLinesWriter):
+                display.run_finished(run_summary(args.sequence, sequence, started, run_name, error))
 
 
 if __name__ == "__main__":
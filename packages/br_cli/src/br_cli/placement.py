@@ -0,0 +1,44 @@
+import json
+import os
+import sys
+
+
+def apply_placement(settings: dict) -> list[str]:
+    # CPU set and scheduling chosen by the agent (br_agent.placement.Placement.settings), applied
+    # to this process before the sequence starts any thread, so all of its threads inherit them
+    errors = []
+    if settings.get("cpus"):
+        cpus = settings["cpus"]
+        errors += _try(lambda: os.sched_setaffinity(0, cpus), f"pin to CPUs {cpus}")
+    if settings.get("policy"):
+        def set_policy():
+            os.sched_setscheduler(0, getattr(os, settings["policy"]), os.sched_param(settings.get("priority", 0)))
+
+        errors += _try(set_policy, f"set scheduling policy {settings['policy']}")
+    if settings.get("nice") is not None:
+        nice = settings["nice"]
+        errors += _try(lambda: os.setpriority(os.PRIO_PROCESS, 0, nice), f"set nice {nice}")
+    return errors
+
+
+def _try(action, description: str) -> list[str]:
+    try:
+        action()
+    except (OSError, AttributeError) as exc:
+        return [f"Could not {description}: {exc}"]
+    return []
+
+
+def main():
+    # python -m br_cli.placement <settings json> <program> [args...]: applies the settings, then
+    # execs the program in this process. The agent starts sequences through this instead of a
+    # preexec_fn, which is not safe in its threaded process.
+    if len(sys.argv) < 3:
+        sys.exit("usage: python -m br_cli.placement <settings json> <program> [args...]")
+    for error in apply_placement(json.loads(sys.argv[1])):
+        print(error, file=sys.stderr, flush=True)
+    os.execv(sys.argv[2], sys.argv[2:])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import marshal
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import count
+from pathlib import Path
+from types import FrameType
+from typing import Optional
+
+from rich.table import Table
+
+DEFAULT_INTERVAL = 0.005
+
+# (filename, first line, name), the function key used by pstats
+Function = tuple[str, int, str]
+
+
+class StackSampler:
+    # Samples the wall-clock call stack of one thread from a helper thread. The sequence only pays
+    # for a frame walk per interval, and waiting on instruments or sleeping shows up as well.
+    # cProfile is not used: since Python 3.12 it records every thread, so the event subscriber
+    # and the dashboard would be charged to the step.
+
+    def __init__(self, thread_id: int, interval: float = DEFAULT_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter[tuple[Function, ...]] = Counter()
+        self.seconds: Counter[tuple[Function, ...]] = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def collapsed(self) -> str:
+        # the folded format of flamegraph.pl, speedscope and inferno: "outer;inner count"
+        return "".join(
+            ";".join(_function_name(function) for function in stack) + f" {samples}\n"
+            for stack, samples in self.samples.most_common()
+        )
+
+    def stats(self) -> dict:
+        # pstats layout: function -> (primitive calls, calls, own time, cumulative time, callers).
+        # Calls are sample counts; a recursive function counts once per sample.
+        calls: Counter[Function] = Counter()
+        own: Counter[Function] = Counter()
+        cumulative: Counter[Function] = Counter()
+        callers: dict[Function, dict[Function, list]] = defaultdict(dict)
+        for stack, samples in self.samples.items():
+            seconds = self.seconds[stack]
+            own[stack[-1]] += seconds
+            for function in set(stack):
+                calls[function] += samples
+                cumulative[function] += seconds
+            for caller, callee in set(zip(stack, stack[1:])):
+                edge = callers[callee].setdefault(caller, [0, 0, 0.0, 0.0])
+                edge[0] += samples
+                edge[1] += samples
+                if callee == stack[-1]:
+                    edge[2] += seconds
+                edge[3] += seconds
+        return {
+            function: (
+                calls[function],
+                calls[function],
+                own[function],
+                cumulative[function],
+                {caller: tuple(edge) for caller, edge in callers[function].items()},
+            )
+            for function in calls
+        }
+
+    def _sample(self):
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is not None:
+                stack = _stack(frame)
+                self.samples[stack] += 1
+                self.seconds[stack] += now - last
+            last = now
+
+
+def _stack(frame: Optional[FrameType]) -> tuple[Function, ...]:
+    functions = []
+    while frame is not None:
+        code = frame.f_code
+        functions.append((code.co_filename, code.co_firstlineno, code.co_qualname))
+        frame = frame.f_back
+    return tuple(reversed(functions))
+
+
+@dataclass
+class PhaseProfile:
+    name: str
+    path: Path
+    seconds: float
+    samples: int
+    stats: dict
+
+
+class StepProfiler:
+    # Sequence.phase_hook that profiles setup, every step and cleanup separately. Each phase is
+    # written as <n>_<name>.prof (loadable with pstats) and <n>_<name>.collapsed (for flame graphs).
+
+    def __init__(self, output_dir: Path, interval: float = DEFAULT_INTERVAL):
+        self.output_dir = output_dir
+        self.interval = interval
+        self.phases: list[PhaseProfile] = []
+        self._index = count()
+
+    @contextmanager
+    def phase(self, name: str):
+        path = self.output_dir / f"{next(self._index):02d}_{safe_name(name, 'phase')}"
+        sampler = StackSampler(threading.get_ident(), self.interval)
+        sampler.start()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            sampler.stop()
+            stats = sampler.stats()
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            Path(f"{path}.prof").write_bytes(marshal.dumps(stats))
+            Path(f"{path}.collapsed").write_text(sampler.collapsed(), encoding="utf-8")
+            self.phases.append(PhaseProfile(name, path, seconds, sum(sampler.samples.values()), stats))
+
+    def load(self, phase: PhaseProfile) -> pstats.Stats:
+        return pstats.Stats(f"{phase.path}.prof")
+
+    def top_functions(self, limit: int = 10) -> list[dict]:
+        totals: dict[Function, list] = {}
+        for phase in self.phases:
+            for function, (_, samples, own, cumulative, _) in phase.stats.items():
+                entry = totals.setdefault(function, [0, 0.0, 0.0])
+                entry[0] += samples
+                entry[1] += own
+                entry[2] += cumulative
+        ranked = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)[:limit]
+        return [
+            {"function": _function_name(function), "samples": samples, "own_s": own, "cumulative_s": cumulative}
+            for function, (samples, own, cumulative) in ranked
+        ]
+
+    def summary(self, limit: int = 10) -> list[Table]:
+        phases = Table(title=f"Profile ({self.output_dir})")
+        for column in ("Phase", "Wall", "Samples", "Hottest function (own time)"):
+            phases.add_column(column)
+        for phase in self.phases:
+            hottest = max(phase.stats.items(), key=lambda item: item[1][2], default=None)
+            name = f"{_function_name(hottest[0])} {hottest[1][2]:.3f}s" if hottest else ""
+            phases.add_row(phase.name, f"{phase.seconds:.3f}s", str(phase.samples), name)
+
+        functions = Table(title=f"Top {limit} functions by own time")
+        for column in ("Function", "Samples", "Own", "Cumulative"):
+            functions.add_column(column)
+        for row in self.top_functions(limit):
+            own, cumulative = f"{row['own_s']:.3f}s", f"{row['cumulative_s']:.3f}s"
+            functions.add_row(row["function"], str(row["samples"]), own, cumulative)
+        return [phases, functions]
+
+
+def _function_name(function: Function) -> str:
+    filename, line, name = function
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def safe_name(value: str, fallback: str) -> str:
+    # file name part for step names and DUT serials
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in value).strip("_")[:60] or fallback
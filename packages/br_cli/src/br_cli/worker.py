@@ -0,0 +1,205 @@
+import argparse
+import atexit
+import json
+import os
+import runpy
+import selectors
+import signal
+import socket
+import sys
+import traceback
+from importlib import import_module
+
+from br_cli.placement import apply_placement
+
+READY = "READY"
+# reported with the exit code, the agent cannot read /proc of a reaped child
+RUSAGE_FIELDS = ("ru_utime", "ru_stime", "ru_maxrss", "ru_inblock", "ru_oublock")
+
+PRELOAD_MODULES = [
+    # listed although br_sdk pulls them in, so a lazy import there cannot move their cost into the run
+    "grpc",
+    "yaml",
+    "br_sdk._grpc.events_pb2",
+    "br_sdk._grpc.events_pb2_grpc",
+    "br_sdk.br_logging",
+    "br_sdk.events",
+    "br_sdk.parse_steps",
+    "br_sdk.registry",
+    "br_sdk.report_json",
+    "br_sdk.sequence",
+    # what br_cli.main imports. The entry point itself is not preloaded: runpy executes it again
+    # as __main__, with a warning and a second copy of its module state.
+    "rich.console",
+    "rich.live",
+    "rich.table",
+    "br_cli.dashboard",
+    "br_cli.jsonl",
+    "br_cli.profiling",
+]
+
+
+def preload(modules: list[str], sequences: bool):
+    names = list(modules)
+    if sequences:
+        from br_sdk.registry import sequence_registry
+
+        names += sequence_registry().modules()
+    for name in dict.fromkeys(names):
+        try:
+            import_module(name)
+        except Exception as exc:
+            print(f"Could not preload {name}: {exc}", file=sys.stderr)
+
+
+def serve(socket_path: str):
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+
+    sel = selectors.DefaultSelector()
+    sel.register(server, selectors.EVENT_READ, "accept")
+    # the agent holds our stdin, EOF means it is gone and we should not outlive it
+    sel.register(sys.stdin, selectors.EVENT_READ, "parent")
+    children: dict[int, tuple[socket.socket, int | None]] = {}
+
+    print(READY, flush=True)
+    try:
+        while True:
+            for key, _ in sel.select(timeout=0.2):
+                if key.data == "accept":
+                    conn, _ = server.accept()
+                    _start_child(conn, server, sel, children)
+                elif key.data == "parent":
+                    if not sys.stdin.buffer.read1(1024):
+                        return
+            _reap(sel, children)
+    finally:
+        sel.close()
+        server.close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+def _start_child(conn: socket.socket, server: socket.socket, sel: selectors.BaseSelector, children: dict):
+    try:
+        request, fds = _receive_request(conn)
+    except (OSError, ValueError) as exc:
+        print(f"Invalid worker request: {exc}", file=sys.stderr)
+        conn.close()
+        return
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            sel.close()
+            server.close()
+            for other, pidfd in children.values():
+                other.close()
+                if pidfd is not None:
+                    os.close(pidfd)
+            conn.close()
+            # stdin is the agent's liveness pipe, the sequence must not read from or hold it
+            devnull = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(devnull, 0)
+            os.close(devnull)
+            os.dup2(fds[0], 1)
+            os.dup2(fds[1], 2)
+            for fd in fds:
+                os.close(fd)
+            # set before the sequence starts any thread, see br_agent.placement
+            for error in apply_placement(request.get("placement") or {}):
+                print(error, file=sys.stderr)
+            _run(request)
+        finally:
+            os._exit(1)
+
+    for fd in fds:
+        os.close(fd)
+    pidfd = None
+    if hasattr(os, "pidfd_open"):
+        pidfd = os.pidfd_open(pid)
+        sel.register(pidfd, selectors.EVENT_READ, "child")
+    children[pid] = (conn, pidfd)
+    conn.sendall(json.dumps({"pid": pid}).encode() + b"\n")
+
+
+def _receive_request(conn: socket.socket) -> tuple[dict, list[int]]:
+    data, fds, _, _ = socket.recv_fds(conn, 65536, 2)
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    if len(fds) != 2:
+        for fd in fds:
+            os.close(fd)
+        raise ValueError("expected stdout and stderr file descriptors")
+    return json.loads(data), fds
+
+
+def _reap(sel: selectors.BaseSelector, children: dict):
+    for pid in list(children):
+        try:
+            done, status, rusage = os.wait4(pid, os.WNOHANG)
+        except ChildProcessError:
+            done, status, rusage = pid, 1 << 8, None
+        if done == 0:
+            continue
+        message = {"returncode": os.waitstatus_to_exitcode(status)}
+        if rusage is not None:
+            message["rusage"] = {name: getattr(rusage, name) for name in RUSAGE_FIELDS}
+        conn, pidfd = children.pop(pid)
+        if pidfd is not None:
+            sel.unregister(pidfd)
+            os.close(pidfd)
+        try:
+            conn.sendall(json.dumps(message).encode() + b"\n")
+        except OSError:
+            pass
+        conn.close()
+
+
+def _run(request: dict):
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    os.chdir(request.get("cwd") or os.getcwd())
+    os.environ.clear()
+    os.environ.update(request.get("env", {}))
+    sys.argv = [request["module"], *request.get("argv", [])]
+    code = 0
+    try:
+        runpy.run_module(request["module"], run_name="__main__", alter_sys=True)
+    except SystemExit as exc:
+        if isinstance(exc.code, int):
+            code = exc.code
+        elif exc.code is not None:
+            print(exc.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    try:
+        atexit._run_exitfuncs()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm worker that forks pre-initialized sequence runs.")
+    parser.add_argument("--socket", required=True, help="Unix socket path to listen on")
+    parser.add_argument("--preload", action="append", default=[], help="Additional module to import up front")
+    parser.add_argument("--no-preload-sequences", action="store_true", help="Do not import sequence entry points")
+    args = parser.parse_args()
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    preload(PRELOAD_MODULES + args.preload, sequences=not args.no_preload_sequences)
+    serve(args.socket)
+
+
+if __name__ == "__main__":
+    main()
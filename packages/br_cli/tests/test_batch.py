@@ -0,0 +1,137 @@
+import io
+import json
+import queue
+import threading
+from pathlib import Path
+
+import pytest
+from br_cli import main
+from br_cli.main import BatchEntry, BatchRunner, read_manifest
+from br_sdk.br_types import Step, Verdict
+from br_sdk.config import AppConfig
+from br_sdk.events import (
+    AGENT_CLIENT,
+    EVENT_SOCKET_ENV,
+    EventSubscriber,
+    publish_step_started,
+    shutdown_event_server,
+    start_run_event_server,
+)
+from br_sdk.sequence import Sequence
+
+
+class BatchSequence(Sequence):
+    __test__ = False
+    serials: list[str] = []
+
+    @Sequence.step("Check")
+    def test_check(self):
+        BatchSequence.serials.append(self._sequence_config["dut_serial"])
+        return self._sequence_config["dut_serial"] != "BAD"
+
+
+@pytest.fixture
+def batch_config(tmp_path, monkeypatch):
+    monkeypatch.setattr(AppConfig, "_config", {"report_enabled": True, "output_dir": str(tmp_path / "out")})
+    monkeypatch.setattr(AppConfig, "_loaded", True)
+    (tmp_path / "out").mkdir()
+    config = tmp_path / "steps.json"
+    specs = [{"type": "boolean", "name": "ok", "pass_if_true": True}]
+    config.write_text(json.dumps([{"id": 1, "name": "Check", "specs": specs}]))
+    BatchSequence.serials = []
+    return config
+
+
+def test_read_manifest_defaults_and_serial_lines():
+    lines = [
+        "# station 3",
+        '{"sequence": "demo", "config": "a.json", "dut": "SN1"}',
+        "",
+        "SN2",
+        '{"dut": "SN3", "retest": "r.json"}',
+    ]
+    entries = list(read_manifest(lines, sequence="default", config=Path("b.json")))
+    assert entries == [
+        BatchEntry("demo", Path("a.json"), "SN1"),
+        BatchEntry("default", Path("b.json"), "SN2"),
+        BatchEntry("default", Path("b.json"), "SN3", Path("r.json")),
+    ]
+    [entry] = read_manifest(["SN1"])
+    assert entry.dut == "SN1" and "line 1 needs a sequence" in entry.error
+
+
+def test_batch_records_bad_manifest_line_and_continues(batch_config, monkeypatch):
+    monkeypatch.setattr(main, "get_sequence", lambda name: BatchSequence)
+    lines = ["SN1", '{"dut": "SN2", ', "SN3"]
+    runner = BatchRunner()
+    verdicts = [runner.run(entry) for entry in read_manifest(lines, sequence="batch", config=batch_config)]
+
+    assert verdicts == [Verdict.PASSED, Verdict.ABORTED, Verdict.PASSED]
+    assert BatchSequence.serials == ["SN1", "SN3"]
+    assert "line 2 is not valid JSON" in runner.results[1]["error"]
+
+
+def test_batch_reuses_steps_and_classes(batch_config, tmp_path, monkeypatch):
+    loads, parses = [], []
+    monkeypatch.setattr(main, "get_sequence", lambda name: loads.append(name) or BatchSequence)
+    parse = main.steps_from_file
+    monkeypatch.setattr(main, "steps_from_file", lambda path: parses.append(path) or parse(path))
+
+    runner = BatchRunner()
+    verdicts = [runner.run(BatchEntry("batch", batch_config, serial)) for serial in ("SN1", "BAD", "SN/3")]
+
+    assert verdicts == [Verdict.PASSED, Verdict.FAILED, Verdict.PASSED]
+    assert BatchSequence.serials == ["SN1", "BAD", "SN/3"]
+    assert len(loads) == 1 and len(parses) == 1
+    # one report per DUT, the serial is made safe for a file name
+    reports = sorted(path.name for path in (tmp_path / "out").glob("*_report.json"))
+    assert [name[:4] for name in reports] == ["BAD_", "SN1_", "SN_3"]
+
+
+def test_batch_continues_after_broken_entry(batch_config, monkeypatch):
+    monkeypatch.setattr(main, "get_sequence", lambda name: BatchSequence)
+    runner = BatchRunner()
+    assert runner.run(BatchEntry("batch", batch_config.with_name("missing.json"), "SN1")) == Verdict.ABORTED
+    assert runner.run(BatchEntry("batch", batch_config, "SN2")) == Verdict.PASSED
+    assert "FileNotFoundError" in runner.results[0]["error"]
+
+
+def test_subscriber_timeout_is_logged(monkeypatch, caplog):
+    class FakeServer:
+        def wait_for_subscriber(self, timeout, client=None):
+            return False
+
+    monkeypatch.setattr(main, "EventSubscriber", lambda **callbacks: type("Sub", (), {"start": lambda self: None})())
+    monkeypatch.setattr(main, "ensure_event_server", FakeServer)
+    with caplog.at_level("WARNING", logger="br_cli.main"):
+        main.start_subscriber(main.JsonLinesWriter(io.StringIO()))
+    assert "not subscribed" in caplog.text
+
+
+def test_run_waits_for_the_agent_although_the_display_subscribed(tmp_path, monkeypatch):
+    socket_path = tmp_path / "events.sock"
+    monkeypatch.setenv(EVENT_SOCKET_ENV, str(socket_path))
+    monkeypatch.setattr(AppConfig, "_config", {"event_subscriber_timeout": 5.0})
+    monkeypatch.setattr(AppConfig, "_loaded", True)
+    shutdown_event_server()
+    received = queue.Queue()
+    # br_cli as launched by the agent: the display subscribes first, the agent's channel is still backing off
+    display = main.start_subscriber(main.JsonLinesWriter(io.StringIO()))
+    agent = EventSubscriber(
+        on_step_started=lambda step: received.put(step.name),
+        on_step_ended=lambda result: None,
+        on_log=lambda message, level: None,
+        address=f"unix://{socket_path}",
+        client=AGENT_CLIENT,
+    )
+    connect = threading.Timer(0.3, agent.start)
+    connect.start()
+    try:
+        start_run_event_server()
+        publish_step_started(Step(1, "Step 1"))
+        assert received.get(timeout=2.0) == "Step 1"
+    finally:
+        connect.join()
+        agent.stop()
+        display.stop()
+        shutdown_event_server()
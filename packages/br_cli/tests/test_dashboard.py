@@ -0,0 +1,40 @@
+import io
+
+from br_cli.dashboard import PAGE_SIZE, Dashboard
+from br_sdk.br_types import BooleanSpec, Measurement, Step, StepProgress, StepResult, Verdict
+from br_sdk.events import StepResultView, _to_proto_step_result
+from rich.console import Console
+
+
+def measurement(index: int, passed: bool = True) -> Measurement:
+    return Measurement(passed, passed, BooleanSpec(name=f"m{index}", pass_if_true=True))
+
+
+def test_dashboard_state_is_bounded_and_counts_streamed_once():
+    console = Console(file=io.StringIO(), width=120)
+    dashboard = Dashboard(console)
+    dashboard.begin("demo")
+
+    step = Step(1, "Big step")
+    dashboard.on_step_started(step)
+    streamed = [measurement(0, passed=False)]
+    dashboard.on_step_progress(StepProgress(1, "Big step", measurements=streamed, progress=0.5))
+    results = streamed + [measurement(i) for i in range(1, 500)]
+    result = StepResult(1, "Big step", verdict=Verdict.FAILED, results=results)
+    # like the subscriber, the view repeats the measurements streamed during the step
+    already_streamed = list(_to_proto_step_result(result).measurements[:1])
+    dashboard.on_step_ended(StepResultView(_to_proto_step_result(result, first_measurement=1), already_streamed))
+
+    state = dashboard.state
+    assert state.measurements == 500
+    assert state.failed == 1
+    assert state.steps == {"failed": 1}
+    assert len(state.recent) == PAGE_SIZE
+    assert [m.spec.name for _, m in state.failures] == ["m0"]
+
+    console.print(dashboard.render())
+    output = console.file.getvalue()
+    assert "Big step failed" in output
+    assert "500 measurements, 1 failed" in output
+    assert f"Last {PAGE_SIZE} measurements" in output
+    assert "m499" in output and "m100" not in output
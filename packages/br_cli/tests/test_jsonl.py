@@ -0,0 +1,82 @@
+import io
+import json
+
+from br_cli.jsonl import JsonLinesWriter, measurement_to_dict, view_to_dict
+from br_sdk.br_types import (
+    BooleanSpec,
+    Measurement,
+    NoSpec,
+    NoSpecAction,
+    NumericComparator,
+    NumericSpec,
+    Step,
+    StepProgress,
+    StepResult,
+    StringSpec,
+    Verdict,
+)
+from br_sdk.events import (
+    MeasurementView,
+    StepResultView,
+    _to_proto_measurement,
+    _to_proto_step_result,
+)
+
+MEASUREMENTS = [
+    Measurement(True, True, BooleanSpec(name="flag", pass_if_true=True)),
+    Measurement(1.5, False, NumericSpec(name="volts", comparator=NumericComparator.GT, lower=2.0, units="V")),
+    Measurement("ok", True, StringSpec(name="status", expected="ok")),
+    Measurement("raw", True, NoSpec(name="note", action=NoSpecAction.LOG)),
+]
+
+
+def test_view_and_measurement_encode_the_same_fields():
+    for measurement in MEASUREMENTS:
+        view = MeasurementView(_to_proto_measurement(measurement))
+        assert view_to_dict(view) == measurement_to_dict(measurement)
+
+
+def test_writer_emits_one_object_per_event():
+    stream = io.StringIO()
+    with JsonLinesWriter(stream) as writer:
+        writer.begin("demo", "SN1_run")
+        writer.on_step_started(Step(1, "Step 1"))
+        writer.on_step_progress(StepProgress(1, "Step 1", measurements=MEASUREMENTS[:1], progress=0.5))
+        writer.on_log("Halfway", "INFO")
+        result = StepResult(1, "Step 1", verdict=Verdict.FAILED, results=MEASUREMENTS)
+        writer.on_step_ended(StepResultView(_to_proto_step_result(result)))
+        writer.run_finished({"dut": "SN1", "sequence": "demo", "verdict": "failed", "run": "SN1_run", "error": ""})
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [r["type"] for r in records] == ["run_started", "step_started", "step_progress", "log", "step_ended", "run"]
+    assert all(r["run"] == "SN1_run" for r in records)
+    assert records[2]["progress"] == 0.5
+    ended = records[4]
+    assert ended["verdict"] == "failed"
+    assert ended["measurements"][1] == {
+        "name": "volts",
+        "type": "numeric",
+        "value": 1.5,
+        "passed": False,
+        "comparator": "GT",
+        "lower": 2.0,
+        "upper": None,
+        "units": "V",
+    }
+
+
+def test_non_finite_measurements_are_written_as_null():
+    def reject(constant):
+        raise ValueError(f"not JSON: {constant}")
+
+    spec = NumericSpec(name="volts", comparator=NumericComparator.GT, lower=2.0, units="V")
+    measurements = [Measurement(float("nan"), False, spec), Measurement(float("-inf"), False, spec)]
+    stream = io.StringIO()
+    with JsonLinesWriter(stream) as writer:
+        writer.on_step_progress(StepProgress(1, "Step 1", measurements=measurements, progress=0.5))
+        result = StepResult(1, "Step 1", verdict=Verdict.FAILED, results=measurements)
+        writer.on_step_ended(StepResultView(_to_proto_step_result(result)))
+
+    records = [json.loads(line, parse_constant=reject) for line in stream.getvalue().splitlines()]
+    assert [[m["value"] for m in r["measurements"]] for r in records] == [[None, None], [None, None]]
+    assert records[0]["progress"] == 0.5
@@ -0,0 +1,48 @@
+import threading
+import time
+
+from br_cli.profiling import StepProfiler, safe_name
+
+
+def busy(seconds: float):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_each_phase_is_written_as_pstats_and_collapsed_stacks(tmp_path):
+    profiler = StepProfiler(tmp_path, interval=0.001)
+    with profiler.phase("setup"):
+        pass
+    with profiler.phase("Step 1. Busy"):
+        busy(0.1)
+
+    assert [p.name for p in profiler.phases] == ["setup", "Step 1. Busy"]
+    step = profiler.phases[1]
+    assert step.path == tmp_path / "01_Step_1__Busy"
+    assert step.samples > 0
+    assert ";busy (test_profiling.py:" in (tmp_path / "01_Step_1__Busy.collapsed").read_text()
+
+    stats = profiler.load(step)
+    functions = {name: stat for (_, _, name), stat in stats.stats.items()}
+    assert functions["busy"][2] > 0.05
+    # the caller is recorded, so pstats can walk the call graph
+    callers = [name for _, _, name in functions["busy"][4]]
+    assert callers == ["test_each_phase_is_written_as_pstats_and_collapsed_stacks"]
+
+
+def test_only_the_profiled_thread_is_sampled(tmp_path):
+    other = threading.Thread(target=busy, args=(0.3,))
+    other.start()
+    profiler = StepProfiler(tmp_path, interval=0.001)
+    with profiler.phase("step"):
+        time.sleep(0.1)
+    other.join()
+
+    assert not any("busy" in row["function"] for row in profiler.top_functions(limit=100))
+    assert profiler.top_functions(limit=1)[0]["function"].startswith("test_only_the_profiled_thread_is_sampled")
+
+
+def test_safe_name():
+    assert safe_name("Step 2. Read v1.2/firmware", "phase") == "Step_2__Read_v1_2_firmware"
+    assert safe_name("...", "phase") == "phase"
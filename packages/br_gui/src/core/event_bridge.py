@@ -13,7 +13,7 @@ class EventBridge(QObject):
         server = ensure_event_server()
         self._subscriber = EventSubscriber(
             on_step_started=self.qt_step_started.emit,
-            on_step_ended=self.qt_step_ended.emit,
+            on_step_ended=lambda result: self.qt_step_ended.emit(result.materialize()),
             on_log=lambda msg, level: self.qt_log_msg.emit(msg),
             address=server.address,
         )
@@ -1,15 +1,10 @@
-from importlib.metadata import entry_points
-
 from br_sdk.parse_steps import StepsDefinition
+from br_sdk.registry import load_sequence
 from PySide6.QtCore import QObject, Slot
 
 
 def get_sequence(name: str):
-    eps = entry_points(group="sequences")
-    matches = {ep.name: ep.load() for ep in eps}
-    if name not in matches:
-        raise ValueError(f"Sequence '{name}' not found. Available: {list(matches)}")
-    return matches[name]
+    return load_sequence(name)
 
 
 class Worker(QObject):
@@ -1,7 +1,7 @@
 
-from importlib.metadata import entry_points
 from pathlib import Path
 
+from br_sdk.registry import sequence_registry
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QBoxLayout,
@@ -64,8 +64,8 @@ class LoadManualSeqWidget(QWidget):
         seq_dropdown = QComboBox()
         seq_dropdown.setMaximumWidth(150)
         seq_dropdown.addItem(self.DISPLAY_TEXT)
-        for ep in entry_points(group="sequences"):
-            seq_dropdown.addItem(ep.name)
+        for name in sequence_registry().names():
+            seq_dropdown.addItem(name)
         seq_dropdown.currentTextChanged.connect(self._update_sequence_name_selected)
         layout.addWidget(seq_dropdown)
 
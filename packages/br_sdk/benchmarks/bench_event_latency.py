@@ -0,0 +1,53 @@
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from br_sdk.br_types import Step
+from br_sdk.events import EventServer, EventSubscriber
+from br_sdk.metrics import format_latency
+
+
+def run(events: int, interval: float):
+    socket_path = Path(tempfile.mkdtemp()) / "bench_events.sock"
+    server = EventServer(str(socket_path))
+    received = threading.Semaphore(0)
+
+    subscriber = EventSubscriber(
+        on_step_started=lambda step: received.release(),
+        on_step_ended=lambda result: None,
+        on_log=lambda message, level: None,
+        address=server.address,
+    )
+    subscriber.start()
+    subscriber.wait_until_ready(timeout=5.0)
+    time.sleep(0.2)
+
+    for i in range(events):
+        server.publish_step_started(Step(i, f"Step {i}"))
+        if interval:
+            time.sleep(interval)
+    for _ in range(events):
+        received.acquire(timeout=5.0)
+
+    subscriber.stop()
+    print(f"{events} events, {interval * 1000:.1f} ms interval")
+    for name, snapshot in subscriber.latency_stats().items():
+        print(format_latency(name, snapshot))
+    for entry in server.stats():
+        print(format_latency("publish->send", entry["publish_to_send"]))
+        print(f"max queue depth: {entry['max_queue_depth']}")
+    server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure publish-to-callback latency of the event stream")
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--interval", type=float, default=0.0005, help="Seconds between published events")
+    args = parser.parse_args()
+    run(args.events, args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+DEFAULT_FORBIDDEN = ["grpc", "br_sdk._grpc", "yaml"]
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    # "import time: self [us] | cumulative | imported package" as written by -X importtime
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        times[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return times
+
+
+def measure(module: str) -> dict[str, tuple[int, int]]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def run(module: str, runs: int, top: int, forbidden: list[str], max_ms: float | None) -> int:
+    samples = [measure(module) for _ in range(runs)]
+    totals = [sample[module][1] / 1000 for sample in samples]
+    median = statistics.median(totals)
+    print(f"import {module}: median {median:.1f} ms, min {min(totals):.1f} ms over {runs} runs")
+
+    last = samples[-1]
+    print("slowest imports (self time, last run):")
+    for name, (own, _) in sorted(last.items(), key=lambda item: item[1][0], reverse=True)[:top]:
+        print(f"  {own / 1000:8.1f} ms  {name}")
+
+    failures = []
+    loaded = [f for f in forbidden if any(name == f or name.startswith(f"{f}.") for name in last)]
+    if loaded:
+        failures.append(f"deferred modules were imported: {', '.join(loaded)}")
+    if max_ms is not None and median > max_ms:
+        failures.append(f"median {median:.1f} ms is over the budget of {max_ms:.1f} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cold import time of a module with -X importtime")
+    parser.add_argument("--module", default="br_sdk.sequence")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list")
+    parser.add_argument(
+        "--forbid",
+        action="append",
+        help=f"Module that must not be imported (repeatable, default: {', '.join(DEFAULT_FORBIDDEN)})",
+    )
+    parser.add_argument("--max-ms", type=float, help="Fail if the median import time is above this budget")
+    args = parser.parse_args()
+    sys.exit(run(args.module, args.runs, args.top, args.forbid or DEFAULT_FORBIDDEN, args.max_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: br_sdk/_grpc/control.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'br_sdk/_grpc/control.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1a\x62r_sdk/_grpc/control.proto\x12\rbrsdk.control\"\xd4\x01\n\nTestStatus\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08sequence\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x0b\n\x03pid\x18\x04 \x01(\t\x12\x12\n\nstarted_at\x18\x05 \x01(\t\x12\x10\n\x08\x65nded_at\x18\x06 \x01(\t\x12\x12\n\nlease_wait\x18\x07 \x01(\t\x12\x12\n\nblocked_on\x18\x08 \x01(\t\x12\r\n\x05\x63pu_s\x18\t \x01(\t\x12\x0f\n\x07\x63pu_pct\x18\n \x01(\t\x12\x0e\n\x06rss_mb\x18\x0b \x01(\t\x12\r\n\x05io_mb\x18\x0c \x01(\t\"\x12\n\x10ListTestsRequest\"O\n\x11ListTestsResponse\x12(\n\x05tests\x18\x01 \x03(\x0b\x32\x19.brsdk.control.TestStatus\x12\x10\n\x08revision\x18\x02 \x01(\x04\"\x19\n\x0bTestRequest\x12\n\n\x02id\x18\x01 \x01(\t\"Q\n\tTestReply\x12\n\n\x02ok\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\'\n\x04test\x18\x03 \x01(\x0b\x32\x19.brsdk.control.TestStatus\"\x0e\n\x0cWatchRequest\"\\\n\x0cStatusUpdate\x12\x10\n\x08snapshot\x18\x01 \x01(\x08\x12\x10\n\x08revision\x18\x02 \x01(\x04\x12(\n\x05tests\x18\x03 \x03(\x0b\x32\x19.brsdk.control.TestStatus2\xb0\x02\n\x0c\x41gentControl\x12N\n\tListTests\x12\x1f.brsdk.control.ListTestsRequest\x1a .brsdk.control.ListTestsResponse\x12\x41\n\tStartTest\x12\x1a.brsdk.control.TestRequest\x1a\x18.brsdk.control.TestReply\x12\x42\n\nCancelTest\x12\x1a.brsdk.control.TestRequest\x1a\x18.brsdk.control.TestReply\x12I\n\x0bWatchStatus\x12\x1b.brsdk.control.WatchRequest\x1a\x1b.brsdk.control.StatusUpdate0\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'br_sdk._grpc.control_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_TESTSTATUS']._serialized_start=46
+  _globals['_TESTSTATUS']._serialized_end=258
+  _globals['_LISTTESTSREQUEST']._serialized_start=260
+  _globals['_LISTTESTSREQUEST']._serialized_end=278
+  _globals['_LISTTESTSRESPONSE']._serialized_start=280
+  _globals['_LISTTESTSRESPONSE']._serialized_end=359
+  _globals['_TESTREQUEST']._serialized_start=361
+  _globals['_TESTREQUEST']._serialized_end=386
+  _globals['_TESTREPLY']._serialized_start=388
+  _globals['_TESTREPLY']._serialized_end=469
+  _globals['_WATCHREQUEST']._serialized_start=471
+  _globals['_WATCHREQUEST']._serialized_end=485
+  _globals['_STATUSUPDATE']._serialized_start=487
+  _globals['_STATUSUPDATE']._serialized_end=579
+  _globals['_AGENTCONTROL']._serialized_start=582
+  _globals['_AGENTCONTROL']._serialized_end=886
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,226 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from br_sdk._grpc import control_pb2 as br__sdk_dot___grpc_dot_control__pb2
+
+GRPC_GENERATED_VERSION = '1.75.1'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + f' but the generated code in br_sdk/_grpc/control_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class AgentControlStub(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.ListTests = channel.unary_unary(
+                '/brsdk.control.AgentControl/ListTests',
+                request_serializer=br__sdk_dot___grpc_dot_control__pb2.ListTestsRequest.SerializeToString,
+                response_deserializer=br__sdk_dot___grpc_dot_control__pb2.ListTestsResponse.FromString,
+                _registered_method=True)
+        self.StartTest = channel.unary_unary(
+                '/brsdk.control.AgentControl/StartTest',
+                request_serializer=br__sdk_dot___grpc_dot_control__pb2.TestRequest.SerializeToString,
+                response_deserializer=br__sdk_dot___grpc_dot_control__pb2.TestReply.FromString,
+                _registered_method=True)
+        self.CancelTest = channel.unary_unary(
+                '/brsdk.control.AgentControl/CancelTest',
+                request_serializer=br__sdk_dot___grpc_dot_control__pb2.TestRequest.SerializeToString,
+                response_deserializer=br__sdk_dot___grpc_dot_control__pb2.TestReply.FromString,
+                _registered_method=True)
+        self.WatchStatus = channel.unary_stream(
+                '/brsdk.control.AgentControl/WatchStatus',
+                request_serializer=br__sdk_dot___grpc_dot_control__pb2.WatchRequest.SerializeToString,
+                response_deserializer=br__sdk_dot___grpc_dot_control__pb2.StatusUpdate.FromString,
+                _registered_method=True)
+
+
+class AgentControlServicer(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def ListTests(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StartTest(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CancelTest(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchStatus(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_AgentControlServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'ListTests': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListTests,
+                    request_deserializer=br__sdk_dot___grpc_dot_control__pb2.ListTestsRequest.FromString,
+                    response_serializer=br__sdk_dot___grpc_dot_control__pb2.ListTestsResponse.SerializeToString,
+            ),
+            'StartTest': grpc.unary_unary_rpc_method_handler(
+                    servicer.StartTest,
+                    request_deserializer=br__sdk_dot___grpc_dot_control__pb2.TestRequest.FromString,
+                    response_serializer=br__sdk_dot___grpc_dot_control__pb2.TestReply.SerializeToString,
+            ),
+            'CancelTest': grpc.unary_unary_rpc_method_handler(
+                    servicer.CancelTest,
+                    request_deserializer=br__sdk_dot___grpc_dot_control__pb2.TestRequest.FromString,
+                    response_serializer=br__sdk_dot___grpc_dot_control__pb2.TestReply.SerializeToString,
+            ),
+            'WatchStatus': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchStatus,
+                    request_deserializer=br__sdk_dot___grpc_dot_control__pb2.WatchRequest.FromString,
+                    response_serializer=br__sdk_dot___grpc_dot_control__pb2.StatusUpdate.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'brsdk.control.AgentControl', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('brsdk.control.AgentControl', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class AgentControl(object):
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def ListTests(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/brsdk.control.AgentControl/ListTests',
+            br__sdk_dot___grpc_dot_control__pb2.ListTestsRequest.SerializeToString,
+            br__sdk_dot___grpc_dot_control__pb2.ListTestsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StartTest(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/brsdk.control.AgentControl/StartTest',
+            br__sdk_dot___grpc_dot_control__pb2.TestRequest.SerializeToString,
+            br__sdk_dot___grpc_dot_control__pb2.TestReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CancelTest(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/brsdk.control.AgentControl/CancelTest',
+            br__sdk_dot___grpc_dot_control__pb2.TestRequest.SerializeToString,
+            br__sdk_dot___grpc_dot_control__pb2.TestReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WatchStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/brsdk.control.AgentControl/WatchStatus',
+            br__sdk_dot___grpc_dot_control__pb2.WatchRequest.SerializeToString,
+            br__sdk_dot___grpc_dot_control__pb2.StatusUpdate.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
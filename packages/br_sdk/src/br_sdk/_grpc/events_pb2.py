@@ -24,33 +24,37 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19\x62r_sdk/_grpc/events.proto\x12\x0c\x62rsdk.events\"\x12\n\x10SubscribeRequest\" \n\x04Step\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"\xdf\x01\n\x04Spec\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0cpass_if_true\x18\x03 \x01(\x08\x12\x12\n\ncomparator\x18\x04 \x01(\t\x12\r\n\x05lower\x18\x05 \x01(\x01\x12\r\n\x05upper\x18\x06 \x01(\x01\x12\r\n\x05units\x18\x07 \x01(\t\x12\x10\n\x08\x65xpected\x18\x08 \x01(\t\x12\x16\n\x0e\x63\x61se_sensitive\x18\t \x01(\x08\x12\x11\n\thas_lower\x18\n \x01(\x08\x12\x11\n\thas_upper\x18\x0b \x01(\x08\x12\x14\n\x0chas_expected\x18\x0c \x01(\x08\"N\n\x0bMeasurement\x12 \n\x04spec\x18\x01 \x01(\x0b\x32\x12.brsdk.events.Spec\x12\r\n\x05value\x18\x02 \x01(\t\x12\x0e\n\x06passed\x18\x03 \x01(\x08\"\xb3\x01\n\nStepResult\x12 \n\x04step\x18\x01 \x01(\x0b\x32\x12.brsdk.events.Step\x12&\n\x07verdict\x18\x02 \x01(\x0e\x32\x15.brsdk.events.Verdict\x12/\n\x0cmeasurements\x18\x03 \x03(\x0b\x32\x19.brsdk.events.Measurement\x12\x15\n\rstart_time_ms\x18\x04 \x01(\x03\x12\x13\n\x0b\x65nd_time_ms\x18\x05 \x01(\x03\"4\n\x10StepStartedEvent\x12 \n\x04step\x18\x01 \x01(\x0b\x32\x12.brsdk.events.Step\":\n\x0eStepEndedEvent\x12(\n\x06result\x18\x01 \x01(\x0b\x32\x18.brsdk.events.StepResult\"*\n\x08LogEvent\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\r\n\x05level\x18\x02 \x01(\t\"\xa5\x01\n\x05\x45vent\x12\x36\n\x0cstep_started\x18\x01 \x01(\x0b\x32\x1e.brsdk.events.StepStartedEventH\x00\x12\x32\n\nstep_ended\x18\x02 \x01(\x0b\x32\x1c.brsdk.events.StepEndedEventH\x00\x12%\n\x03log\x18\x03 \x01(\x0b\x32\x16.brsdk.events.LogEventH\x00\x42\t\n\x07payload*_\n\x07Verdict\x12\x17\n\x13VERDICT_UNSPECIFIED\x10\x00\x12\x12\n\x0eVERDICT_PASSED\x10\x01\x12\x12\n\x0eVERDICT_FAILED\x10\x02\x12\x13\n\x0fVERDICT_ABORTED\x10\x03\x32Q\n\x0b\x45ventStream\x12\x42\n\tSubscribe\x12\x1e.brsdk.events.SubscribeRequest\x1a\x13.brsdk.events.Event0\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19\x62r_sdk/_grpc/events.proto\x12\x0c\x62rsdk.events\"\"\n\x10SubscribeRequest\x12\x0e\n\x06\x63lient\x18\x01 \x01(\t\" \n\x04Step\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"\xdf\x01\n\x04Spec\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0cpass_if_true\x18\x03 \x01(\x08\x12\x12\n\ncomparator\x18\x04 \x01(\t\x12\r\n\x05lower\x18\x05 \x01(\x01\x12\r\n\x05upper\x18\x06 \x01(\x01\x12\r\n\x05units\x18\x07 \x01(\t\x12\x10\n\x08\x65xpected\x18\x08 \x01(\t\x12\x16\n\x0e\x63\x61se_sensitive\x18\t \x01(\x08\x12\x11\n\thas_lower\x18\n \x01(\x08\x12\x11\n\thas_upper\x18\x0b \x01(\x08\x12\x14\n\x0chas_expected\x18\x0c \x01(\x08\"N\n\x0bMeasurement\x12 \n\x04spec\x18\x01 \x01(\x0b\x32\x12.brsdk.events.Spec\x12\r\n\x05value\x18\x02 \x01(\t\x12\x0e\n\x06passed\x18\x03 \x01(\x08\"\xb3\x01\n\nStepResult\x12 \n\x04step\x18\x01 \x01(\x0b\x32\x12.brsdk.events.Step\x12&\n\x07verdict\x18\x02 \x01(\x0e\x32\x15.brsdk.events.Verdict\x12/\n\x0cmeasurements\x18\x03 \x03(\x0b\x32\x19.brsdk.events.Measurement\x12\x15\n\rstart_time_ms\x18\x04 \x01(\x03\x12\x13\n\x0b\x65nd_time_ms\x18\x05 \x01(\x03\"4\n\x10StepStartedEvent\x12 \n\x04step\x18\x01 \x01(\x0b\x32\x12.brsdk.events.Step\":\n\x0eStepEndedEvent\x12(\n\x06result\x18\x01 \x01(\x0b\x32\x18.brsdk.events.StepResult\"\x9f\x01\n\x11StepProgressEvent\x12 \n\x04step\x18\x01 \x01(\x0b\x32\x12.brsdk.events.Step\x12/\n\x0cmeasurements\x18\x02 \x03(\x0b\x32\x19.brsdk.events.Measurement\x12\x10\n\x08progress\x18\x03 \x01(\x01\x12\x14\n\x0chas_progress\x18\x04 \x01(\x08\x12\x0f\n\x07message\x18\x05 \x01(\t\"*\n\x08LogEvent\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\r\n\x05level\x18\x02 \x01(\t\"F\n\x0b\x45ventTiming\x12\x12\n\npublish_ns\x18\x01 \x01(\x03\x12\x12\n\nenqueue_ns\x18\x02 \x01(\x03\x12\x0f\n\x07send_ns\x18\x03 \x01(\x03\"\x8a\x02\n\x05\x45vent\x12\x36\n\x0cstep_started\x18\x01 \x01(\x0b\x32\x1e.brsdk.events.StepStartedEventH\x00\x12\x32\n\nstep_ended\x18\x02 \x01(\x0b\x32\x1c.brsdk.events.StepEndedEventH\x00\x12%\n\x03log\x18\x03 \x01(\x0b\x32\x16.brsdk.events.LogEventH\x00\x12\x38\n\rstep_progress\x18\x04 \x01(\x0b\x32\x1f.brsdk.events.StepProgressEventH\x00\x12)\n\x06timing\x18\x0f \x01(\x0b\x32\x19.brsdk.events.EventTimingB\t\n\x07payload*_\n\x07Verdict\x12\x17\n\x13VERDICT_UNSPECIFIED\x10\x00\x12\x12\n\x0eVERDICT_PASSED\x10\x01\x12\x12\n\x0eVERDICT_FAILED\x10\x02\x12\x13\n\x0fVERDICT_ABORTED\x10\x03\x32Q\n\x0b\x45ventStream\x12\x42\n\tSubscribe\x12\x1e.brsdk.events.SubscribeRequest\x1a\x13.brsdk.events.Event0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'br_sdk._grpc.events_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_VERDICT']._serialized_start=911
-  _globals['_VERDICT']._serialized_end=1006
+  _globals['_VERDICT']._serialized_start=1262
+  _globals['_VERDICT']._serialized_end=1357
   _globals['_SUBSCRIBEREQUEST']._serialized_start=43
-  _globals['_SUBSCRIBEREQUEST']._serialized_end=61
-  _globals['_STEP']._serialized_start=63
-  _globals['_STEP']._serialized_end=95
-  _globals['_SPEC']._serialized_start=98
-  _globals['_SPEC']._serialized_end=321
-  _globals['_MEASUREMENT']._serialized_start=323
-  _globals['_MEASUREMENT']._serialized_end=401
-  _globals['_STEPRESULT']._serialized_start=404
-  _globals['_STEPRESULT']._serialized_end=583
-  _globals['_STEPSTARTEDEVENT']._serialized_start=585
-  _globals['_STEPSTARTEDEVENT']._serialized_end=637
-  _globals['_STEPENDEDEVENT']._serialized_start=639
-  _globals['_STEPENDEDEVENT']._serialized_end=697
-  _globals['_LOGEVENT']._serialized_start=699
-  _globals['_LOGEVENT']._serialized_end=741
-  _globals['_EVENT']._serialized_start=744
-  _globals['_EVENT']._serialized_end=909
-  _globals['_EVENTSTREAM']._serialized_start=1008
-  _globals['_EVENTSTREAM']._serialized_end=1089
+  _globals['_SUBSCRIBEREQUEST']._serialized_end=77
+  _globals['_STEP']._serialized_start=79
+  _globals['_STEP']._serialized_end=111
+  _globals['_SPEC']._serialized_start=114
+  _globals['_SPEC']._serialized_end=337
+  _globals['_MEASUREMENT']._serialized_start=339
+  _globals['_MEASUREMENT']._serialized_end=417
+  _globals['_STEPRESULT']._serialized_start=420
+  _globals['_STEPRESULT']._serialized_end=599
+  _globals['_STEPSTARTEDEVENT']._serialized_start=601
+  _globals['_STEPSTARTEDEVENT']._serialized_end=653
+  _globals['_STEPENDEDEVENT']._serialized_start=655
+  _globals['_STEPENDEDEVENT']._serialized_end=713
+  _globals['_STEPPROGRESSEVENT']._serialized_start=716
+  _globals['_STEPPROGRESSEVENT']._serialized_end=875
+  _globals['_LOGEVENT']._serialized_start=877
+  _globals['_LOGEVENT']._serialized_end=919
+  _globals['_EVENTTIMING']._serialized_start=921
+  _globals['_EVENTTIMING']._serialized_end=991
+  _globals['_EVENT']._serialized_start=994
+  _globals['_EVENT']._serialized_end=1260
+  _globals['_EVENTSTREAM']._serialized_start=1359
+  _globals['_EVENTSTREAM']._serialized_end=1440
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,21 @@
+from importlib import import_module
+from types import ModuleType
+
+
+class LazyModule:
+    # Stands in for a module until one of its attributes is used. Resolved attributes are kept
+    # on the instance, so repeated access costs the same as on the real module.
+
+    def __init__(self, name: str):
+        self._lazy_name = name
+
+    def __getattr__(self, attr: str):
+        value = getattr(self._load(), attr)
+        setattr(self, attr, value)
+        return value
+
+    def _load(self) -> ModuleType:
+        return import_module(self._lazy_name)
+
+    def __repr__(self):
+        return f"<lazy module {self._lazy_name!r}>"
@@ -2,7 +2,7 @@ import logging
 from datetime import datetime
 
 from br_sdk.config import AppConfig
-from br_sdk.events import publish_log
+from br_sdk.events import has_event_subscribers, publish_log
 
 
 def setup_logger():
@@ -48,5 +48,7 @@ def reset_log_file():
 
 class SignalEmitterHandler(logging.Handler):
     def emit(self, record):
+        if not has_event_subscribers():
+            return
         msg = self.format(record)
         publish_log(msg, record.levelname)
@@ -117,6 +117,7 @@ class Step:
     name: str
     specs: list[Spec] = field(default_factory=list)
     ignore_fail: bool = False
+    requires: list[int] = field(default_factory=list)
 
 
 @dataclass
@@ -129,6 +130,15 @@ class StepResult:
     results: list[Measurement] = field(default_factory=list)
 
 
+@dataclass
+class StepProgress:
+    id: int
+    name: str
+    measurements: list[Measurement] = field(default_factory=list)
+    progress: float | None = None
+    message: str = ""
+
+
 @dataclass
 class SequenceResult:
     start_time: datetime | None = None
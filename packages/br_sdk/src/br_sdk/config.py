@@ -1,6 +1,9 @@
 from pathlib import Path
 
-import yaml
+from br_sdk._lazy import LazyModule
+
+# only needed when a config file exists
+yaml = LazyModule("yaml")
 
 
 class AppConfig:
@@ -1,16 +1,20 @@
+from __future__ import annotations
+
 import atexit
 import logging
 import os
 import queue
 import threading
 import time
+from collections import deque
 from concurrent import futures
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import count
 from typing import Callable, Optional
+from typing import Sequence as TypingSequence
 
-import grpc
-
-from br_sdk._grpc import events_pb2, events_pb2_grpc
+from br_sdk._lazy import LazyModule
 from br_sdk.br_types import (
     BooleanSpec,
     Measurement,
@@ -19,19 +23,36 @@ from br_sdk.br_types import (
     NumericComparator,
     NumericSpec,
     Step,
+    StepProgress,
     StepResult,
     StringSpec,
     Verdict,
 )
 from br_sdk.config import AppConfig
+from br_sdk.metrics import LatencyHistogram, format_latency
+
+# grpc and the generated modules cost more to import than the rest of br_sdk.sequence,
+# they are loaded when the first event is published or subscribed to
+grpc = LazyModule("grpc")
+events_pb2 = LazyModule("br_sdk._grpc.events_pb2")
+events_pb2_grpc = LazyModule("br_sdk._grpc.events_pb2_grpc")
 
 LOGGER = logging.getLogger(__name__)
 
 DEFAULT_EVENT_SOCKET = "/tmp/benderr_events.sock"
+EVENT_SOCKET_ENV = "BENDERR_EVENT_SOCKET"
+EVENT_SERVER_MODES = ("auto", "on", "off")
+# how long a run waits for the agent that passed EVENT_SOCKET_ENV to subscribe
+DEFAULT_SUBSCRIBER_TIMEOUT = 10.0
+# SubscribeRequest.client of the agent's subscriber, the one a run started by the agent waits for
+AGENT_CLIENT = "agent"
+SUBSCRIBE_RETRY_INTERVAL = 0.1
+# disconnected subscribers whose stats are still reported, older ones are dropped
+MAX_CLOSED_SUBSCRIBERS = 16
 
 
 def _get_socket_path() -> str:
-    return AppConfig.get("event_socket_path", DEFAULT_EVENT_SOCKET)
+    return os.environ.get(EVENT_SOCKET_ENV) or AppConfig.get("event_socket_path", DEFAULT_EVENT_SOCKET)
 
 
 def get_event_address(start_server: bool = False) -> str:
@@ -40,40 +61,102 @@ def get_event_address(start_server: bool = False) -> str:
     return f"unix://{_get_socket_path()}"
 
 
-class _EventStream(events_pb2_grpc.EventStreamServicer):
+@dataclass
+class _Subscriber:
+    id: int
+    client: str = ""
+    # serialized event, publish and enqueue timestamps
+    pending: queue.Queue[Optional[tuple[bytes, int, int]]] = field(default_factory=queue.Queue)
+    publish_to_send: LatencyHistogram = field(default_factory=LatencyHistogram)
+    enqueue_to_send: LatencyHistogram = field(default_factory=LatencyHistogram)
+    max_queue_depth: int = 0
+    connected: bool = True
+
+    def stats(self) -> dict:
+        return {
+            "subscriber": self.id,
+            "client": self.client,
+            "connected": self.connected,
+            "queue_depth": self.pending.qsize(),
+            "max_queue_depth": self.max_queue_depth,
+            "publish_to_send": self.publish_to_send.snapshot(),
+            "enqueue_to_send": self.enqueue_to_send.snapshot(),
+        }
+
+
+class _EventStream:
+    # implements events_pb2_grpc.EventStreamServicer, which cannot be a base class without importing grpc
     def __init__(self):
-        self._subscribers: list[queue.Queue[Optional[events_pb2.Event]]] = []
+        self._subscribers: list[_Subscriber] = []
+        self._closed: deque[_Subscriber] = deque(maxlen=MAX_CLOSED_SUBSCRIBERS)
+        self._ids = count(1)
         self._lock = threading.Lock()
+        # clients that subscribed at least once, see wait_for_subscriber
+        self._clients: set[str] = set()
+        self._subscribed = threading.Condition(self._lock)
 
     def Subscribe(self, request, context):
-        q: queue.Queue[Optional[events_pb2.Event]] = queue.Queue()
+        subscriber = _Subscriber(next(self._ids), request.client)
         with self._lock:
-            self._subscribers.append(q)
+            self._subscribers.append(subscriber)
+            self._clients.add(subscriber.client)
+            self._subscribed.notify_all()
         try:
             while True:
-                event = q.get()
-                if event is None:
+                item = subscriber.pending.get()
+                if item is None:
                     break
-                yield event
+                payload, publish_ns, enqueue_ns = item
+                send_ns = time.time_ns()
+                subscriber.enqueue_to_send.record(send_ns - enqueue_ns)
+                subscriber.publish_to_send.record(send_ns - publish_ns)
+                # the event is serialized once for all subscribers. Parsing merges repeated message
+                # fields, so appending a timing-only event stamps this subscriber's send time.
+                timing = events_pb2.EventTiming(enqueue_ns=enqueue_ns, send_ns=send_ns)
+                yield payload + events_pb2.Event(timing=timing).SerializeToString()
         except Exception:  # pragma: no cover - defensive
             LOGGER.exception("Event subscriber crashed")
         finally:
+            subscriber.connected = False
             with self._lock:
-                if q in self._subscribers:
-                    self._subscribers.remove(q)
+                if subscriber in self._subscribers:
+                    self._subscribers.remove(subscriber)
+                self._closed.append(subscriber)
+
+    def wait_for_subscriber(self, timeout: Optional[float], client: Optional[str]) -> bool:
+        def subscribed() -> bool:
+            return client in self._clients if client is not None else bool(self._clients)
+
+        with self._subscribed:
+            return self._subscribed.wait_for(subscribed, timeout)
+
+    @property
+    def has_subscribers(self) -> bool:
+        # read without the lock: a subscriber connecting concurrently would miss this event either way
+        return bool(self._subscribers)
 
     def broadcast(self, event: events_pb2.Event):
         with self._lock:
             subscribers = list(self._subscribers)
-        for q in subscribers:
-            q.put(event)
+        payload = event.SerializeToString()
+        enqueue_ns = time.time_ns()
+        for subscriber in subscribers:
+            subscriber.pending.put((payload, event.timing.publish_ns, enqueue_ns))
+            depth = subscriber.pending.qsize()
+            if depth > subscriber.max_queue_depth:
+                subscriber.max_queue_depth = depth
+
+    def stats(self) -> list[dict]:
+        with self._lock:
+            subscribers = sorted([*self._closed, *self._subscribers], key=lambda subscriber: subscriber.id)
+        return [subscriber.stats() for subscriber in subscribers]
 
     def shutdown(self):
         with self._lock:
             subscribers = list(self._subscribers)
             self._subscribers.clear()
-        for q in subscribers:
-            q.put(None)
+        for subscriber in subscribers:
+            subscriber.pending.put(None)
 
 
 class EventServer:
@@ -82,7 +165,7 @@ class EventServer:
         self._address = f"unix://{socket_path}"
         self._servicer = _EventStream()
         self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
-        events_pb2_grpc.add_EventStreamServicer_to_server(self._servicer, self._server)
+        _add_event_stream(self._servicer, self._server)
         self._started = False
         self._lock = threading.Lock()
 
@@ -115,28 +198,76 @@ class EventServer:
             ):
                 os.remove(self._socket_path)
 
+    @property
+    def has_subscribers(self) -> bool:
+        return self._servicer.has_subscribers
+
+    def wait_for_subscriber(self, timeout: Optional[float] = None, client: Optional[str] = None) -> bool:
+        # events published before the first subscription are dropped, see publish_*. Another
+        # subscriber (an in-process display) does not count when waiting for a given client.
+        return self._servicer.wait_for_subscriber(timeout, client)
+
+    def stats(self) -> list[dict]:
+        return self._servicer.stats()
+
     def publish_step_started(self, step: Step):
-        self.ensure_started()
+        # nobody would receive the event, skip building it
+        if not self._servicer.has_subscribers:
+            return
+        publish_ns = time.time_ns()
         event = events_pb2.Event(
             step_started=events_pb2.StepStartedEvent(step=_to_proto_step(step)),
+            timing=events_pb2.EventTiming(publish_ns=publish_ns),
         )
         self._servicer.broadcast(event)
 
-    def publish_step_ended(self, result: StepResult):
-        self.ensure_started()
+    def publish_step_ended(self, result: StepResult, streamed_measurements: int = 0):
+        if not self._servicer.has_subscribers:
+            return
+        publish_ns = time.time_ns()
+        event = events_pb2.Event(
+            step_ended=events_pb2.StepEndedEvent(
+                result=_to_proto_step_result(result, first_measurement=streamed_measurements)
+            ),
+            timing=events_pb2.EventTiming(publish_ns=publish_ns),
+        )
+        self._servicer.broadcast(event)
+
+    def publish_step_progress(self, progress: StepProgress):
+        if not self._servicer.has_subscribers:
+            return
+        publish_ns = time.time_ns()
         event = events_pb2.Event(
-            step_ended=events_pb2.StepEndedEvent(result=_to_proto_step_result(result)),
+            step_progress=_to_proto_step_progress(progress),
+            timing=events_pb2.EventTiming(publish_ns=publish_ns),
         )
         self._servicer.broadcast(event)
 
     def publish_log(self, message: str, level: str):
-        self.ensure_started()
+        if not self._servicer.has_subscribers:
+            return
+        publish_ns = time.time_ns()
         event = events_pb2.Event(
             log=events_pb2.LogEvent(message=message, level=level),
+            timing=events_pb2.EventTiming(publish_ns=publish_ns),
         )
         self._servicer.broadcast(event)
 
 
+def _add_event_stream(servicer: _EventStream, server):
+    # events_pb2_grpc.add_EventStreamServicer_to_server, except that Subscribe yields events
+    # that are already serialized
+    handlers = {
+        "Subscribe": grpc.unary_stream_rpc_method_handler(
+            servicer.Subscribe,
+            request_deserializer=events_pb2.SubscribeRequest.FromString,
+            response_serializer=bytes,
+        ),
+    }
+    server.add_generic_rpc_handlers((grpc.method_handlers_generic_handler("brsdk.events.EventStream", handlers),))
+    server.add_registered_method_handlers("brsdk.events.EventStream", handlers)
+
+
 _SERVER_LOCK = threading.Lock()
 _SERVER: Optional[EventServer] = None
 
@@ -150,50 +281,118 @@ def ensure_event_server() -> EventServer:
         return _SERVER
 
 
+def start_run_event_server() -> Optional[EventServer]:
+    # "on" serves events during every run and "off" never starts the server for a run.
+    # "auto" starts it when an agent passed a socket to subscribe on; otherwise it is left to
+    # an in-process subscriber (br_cli, GUI) to start it, and publishing stays a no-op.
+    mode = AppConfig.get("event_server", "auto")
+    if mode not in EVENT_SERVER_MODES:
+        raise ValueError(f"Unknown event_server mode '{mode}'. Use one of {', '.join(EVENT_SERVER_MODES)}")
+    if os.environ.get(EVENT_SOCKET_ENV) and mode != "off":
+        # the agent subscribes once the socket exists and nothing is replayed, so the run
+        # waits for it instead of dropping its first events
+        server = ensure_event_server()
+        timeout = float(AppConfig.get("event_subscriber_timeout", DEFAULT_SUBSCRIBER_TIMEOUT))
+        if not server.wait_for_subscriber(timeout, client=AGENT_CLIENT):
+            LOGGER.warning("The agent did not subscribe within %.1fs, it misses events until it does", timeout)
+        return server
+    if mode == "on":
+        return ensure_event_server()
+    return _SERVER
+
+
+def has_event_subscribers() -> bool:
+    server = _SERVER
+    return server is not None and server.has_subscribers
+
+
 def shutdown_event_server():
     global _SERVER
     with _SERVER_LOCK:
         if _SERVER is None:
             return
+        _log_server_stats(_SERVER.stats())
         _SERVER.stop()
         _SERVER = None
 
 
+def event_server_stats() -> list[dict]:
+    with _SERVER_LOCK:
+        return _SERVER.stats() if _SERVER is not None else []
+
+
+def _log_server_stats(stats: list[dict]):
+    for entry in stats:
+        LOGGER.info(
+            "Event subscriber %d: queue depth %d (max %d)",
+            entry["subscriber"],
+            entry["queue_depth"],
+            entry["max_queue_depth"],
+        )
+        LOGGER.info("  %s", format_latency("publish->send", entry["publish_to_send"]))
+        LOGGER.info("  %s", format_latency("enqueue->send", entry["enqueue_to_send"]))
+
+
 def publish_step_started(step: Step):
-    ensure_event_server().publish_step_started(step)
+    server = _SERVER
+    if server is not None:
+        server.publish_step_started(step)
 
 
-def publish_step_ended(result: StepResult):
-    ensure_event_server().publish_step_ended(result)
+def publish_step_ended(result: StepResult, streamed_measurements: int = 0):
+    server = _SERVER
+    if server is not None:
+        server.publish_step_ended(result, streamed_measurements)
+
+
+def publish_step_progress(progress: StepProgress):
+    server = _SERVER
+    if server is not None:
+        server.publish_step_progress(progress)
 
 
 def publish_log(message: str, level: str):
-    ensure_event_server().publish_log(message, level)
+    server = _SERVER
+    if server is not None:
+        server.publish_log(message, level)
 
 
 class EventSubscriber:
     def __init__(
         self,
         on_step_started: Callable[[Step], None],
-        on_step_ended: Callable[[StepResult], None],
+        on_step_ended: Callable[["StepResultView"], None],
         on_log: Callable[[str, str], None],
         *,
+        on_step_progress: Optional[Callable[[StepProgress], None]] = None,
         start_server: bool = False,
         address: Optional[str] = None,
+        client: str = "",
     ):
         self._on_step_started = on_step_started
         self._on_step_ended = on_step_ended
         self._on_log = on_log
+        self._on_step_progress = on_step_progress
+        # measurements streamed during a step are not repeated in step_ended
+        self._streamed: dict[int, list[events_pb2.Measurement]] = {}
+        self._latency = {
+            "send_to_receive": LatencyHistogram(),
+            "publish_to_callback": LatencyHistogram(),
+            "callback": LatencyHistogram(),
+        }
         self._stop = threading.Event()
         self._channel: Optional[grpc.Channel] = None
         self._thread: Optional[threading.Thread] = None
         self._start_server = start_server
         self._address = address
+        self._client = client
         self._ready = threading.Event()
 
     def start(self):
         address = self._address or get_event_address(start_server=self._start_server)
-        self._channel = grpc.insecure_channel(address)
+        # the socket usually appears shortly after subscribing, do not back off for seconds
+        options = [("grpc.initial_reconnect_backoff_ms", 50), ("grpc.max_reconnect_backoff_ms", 1000)]
+        self._channel = grpc.insecure_channel(address, options=options)
         grpc.channel_ready_future(self._channel).add_done_callback(lambda _: self._ready.set())
         stub = events_pb2_grpc.EventStreamStub(self._channel)
         self._thread = threading.Thread(target=self._consume, args=(stub,), daemon=True)
@@ -202,6 +401,9 @@ class EventSubscriber:
     def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
         return self._ready.wait(timeout)
 
+    def latency_stats(self) -> dict[str, dict[str, float]]:
+        return {name: histogram.snapshot() for name, histogram in self._latency.items()}
+
     def stop(self, grace_period: float = 0.0):
         if grace_period:
             time.sleep(grace_period)
@@ -211,26 +413,125 @@ class EventSubscriber:
         if self._thread:
             self._thread.join(timeout=1)
         self._ready.clear()
+        for name, snapshot in self.latency_stats().items():
+            if snapshot["count"]:
+                LOGGER.debug("Event subscriber %s", format_latency(name, snapshot))
 
     def _consume(self, stub: events_pb2_grpc.EventStreamStub):
         while not self._stop.is_set():
             try:
-                for event in stub.Subscribe(events_pb2.SubscribeRequest()):
+                for event in stub.Subscribe(events_pb2.SubscribeRequest(client=self._client)):
+                    receive_ns = time.time_ns()
                     if self._stop.is_set():
                         break
-                    if event.HasField("step_started"):
-                        self._on_step_started(_from_proto_step(event.step_started.step))
-                    elif event.HasField("step_ended"):
-                        self._on_step_ended(_from_proto_step_result(event.step_ended.result))
-                    elif event.HasField("log"):
-                        self._on_log(event.log.message, event.log.level)
+                    if event.timing.send_ns:
+                        self._latency["send_to_receive"].record(receive_ns - event.timing.send_ns)
+                    self._dispatch(event)
             except grpc.RpcError as exc:
                 if self._stop.is_set():
                     break
                 if exc.code() == grpc.StatusCode.CANCELLED:
                     break
                 LOGGER.debug("Event subscription retry after error: %s", exc)
-                time.sleep(0.5)
+                time.sleep(SUBSCRIBE_RETRY_INTERVAL)
+
+    def _dispatch(self, event: events_pb2.Event):
+        match event.WhichOneof("payload"):
+            case "step_started":
+                self._streamed.pop(event.step_started.step.id, None)
+                self._invoke(event, self._on_step_started, _from_proto_step(event.step_started.step))
+            case "step_progress":
+                step_id = event.step_progress.step.id
+                self._streamed.setdefault(step_id, []).extend(event.step_progress.measurements)
+                if self._on_step_progress:
+                    self._invoke(event, self._on_step_progress, _from_proto_step_progress(event.step_progress))
+            case "step_ended":
+                step_id = event.step_ended.result.step.id
+                result = StepResultView(event.step_ended.result, self._streamed.pop(step_id, []))
+                self._invoke(event, self._on_step_ended, result)
+            case "log":
+                self._invoke(event, self._on_log, event.log.message, event.log.level)
+
+    def _invoke(self, event: events_pb2.Event, callback: Callable, *args):
+        start_ns = time.time_ns()
+        if event.timing.publish_ns:
+            self._latency["publish_to_callback"].record(start_ns - event.timing.publish_ns)
+        callback(*args)
+        self._latency["callback"].record(time.time_ns() - start_ns)
+
+
+class MeasurementView:
+    __slots__ = ("_msg", "_spec")
+
+    def __init__(self, msg: events_pb2.Measurement):
+        self._msg = msg
+        self._spec = None
+
+    @property
+    def spec(self):
+        if self._spec is None:
+            self._spec = _from_proto_spec(self._msg.spec)
+        return self._spec
+
+    @property
+    def value(self):
+        return _decode_measurement_value(self._msg.spec.type, self._msg.value)
+
+    @property
+    def passed(self) -> bool:
+        return self._msg.passed
+
+    @property
+    def message(self) -> events_pb2.Measurement:
+        return self._msg
+
+    def materialize(self) -> Measurement:
+        return Measurement(value=self.value, passed=self.passed, spec=self.spec)
+
+    def __repr__(self):
+        return f"MeasurementView(spec={self._msg.spec.name!r}, value={self._msg.value!r}, passed={self.passed})"
+
+
+class StepResultView:
+    __slots__ = ("_msg", "_streamed", "_results")
+
+    def __init__(self, msg: events_pb2.StepResult, streamed: list[events_pb2.Measurement] | None = None):
+        self._msg = msg
+        self._streamed = streamed or []
+        self._results: list[MeasurementView] | None = None
+
+    @property
+    def id(self) -> int:
+        return self._msg.step.id
+
+    @property
+    def name(self) -> str:
+        return self._msg.step.name
+
+    @property
+    def verdict(self) -> Verdict:
+        return _from_proto_verdict(self._msg.verdict)
+
+    @property
+    def start_time(self) -> datetime | None:
+        return _from_proto_time(self._msg.start_time_ms)
+
+    @property
+    def end_time(self) -> datetime | None:
+        return _from_proto_time(self._msg.end_time_ms)
+
+    @property
+    def results(self) -> list[MeasurementView]:
+        if self._results is None:
+            self._results = [MeasurementView(m) for m in self._streamed]
+            self._results.extend(MeasurementView(m) for m in self._msg.measurements)
+        return self._results
+
+    def materialize(self) -> StepResult:
+        return _from_proto_step_result(self._msg, self._streamed)
+
+    def __repr__(self):
+        return f"StepResultView(id={self.id}, name={self.name!r}, verdict={self.verdict.value})"
 
 
 atexit.register(shutdown_event_server)
@@ -240,8 +541,8 @@ def _to_proto_step(step: Step) -> events_pb2.Step:
     return events_pb2.Step(id=step.id, name=step.name)
 
 
-def _to_proto_step_result(result: StepResult) -> events_pb2.StepResult:
-    measurements = [_to_proto_measurement(m) for m in result.results]
+def _to_proto_step_result(result: StepResult, first_measurement: int = 0) -> events_pb2.StepResult:
+    measurements = [_to_proto_measurement(m) for m in result.results[first_measurement:]]
     start_ms = int(result.start_time.timestamp() * 1000) if result.start_time else 0
     end_ms = int(result.end_time.timestamp() * 1000) if result.end_time else 0
     return events_pb2.StepResult(
@@ -253,6 +554,17 @@ def _to_proto_step_result(result: StepResult) -> events_pb2.StepResult:
     )
 
 
+def _to_proto_step_progress(progress: StepProgress) -> events_pb2.StepProgressEvent:
+    has_progress = progress.progress is not None
+    return events_pb2.StepProgressEvent(
+        step=_to_proto_step(Step(progress.id, progress.name)),
+        measurements=[_to_proto_measurement(m) for m in progress.measurements],
+        progress=progress.progress if has_progress else 0.0,
+        has_progress=has_progress,
+        message=progress.message,
+    )
+
+
 def _to_proto_measurement(measurement: Measurement) -> events_pb2.Measurement:
     spec_msg = _to_proto_spec(measurement.spec)
     return events_pb2.Measurement(
@@ -312,15 +624,14 @@ def _from_proto_step(step: events_pb2.Step) -> Step:
     return Step(step.id, step.name, [])
 
 
-def _from_proto_step_result(result: events_pb2.StepResult) -> StepResult:
+def _from_proto_step_result(
+    result: events_pb2.StepResult, streamed: TypingSequence[events_pb2.Measurement] = ()
+) -> StepResult:
     step = _from_proto_step(result.step)
-    measurements = [_from_proto_measurement(m) for m in result.measurements]
-    start_time = (
-        datetime.fromtimestamp(result.start_time_ms / 1000) if result.start_time_ms else None
-    )
-    end_time = (
-        datetime.fromtimestamp(result.end_time_ms / 1000) if result.end_time_ms else None
-    )
+    measurements = [_from_proto_measurement(m) for m in streamed]
+    measurements.extend(_from_proto_measurement(m) for m in result.measurements)
+    start_time = _from_proto_time(result.start_time_ms)
+    end_time = _from_proto_time(result.end_time_ms)
     verdict = _from_proto_verdict(result.verdict)
     return StepResult(
         step.id,
@@ -332,17 +643,36 @@ def _from_proto_step_result(result: events_pb2.StepResult) -> StepResult:
     )
 
 
+def _from_proto_step_progress(progress: events_pb2.StepProgressEvent) -> StepProgress:
+    step = _from_proto_step(progress.step)
+    return StepProgress(
+        step.id,
+        step.name,
+        measurements=[_from_proto_measurement(m) for m in progress.measurements],
+        progress=progress.progress if progress.has_progress else None,
+        message=progress.message,
+    )
+
+
+def _from_proto_time(time_ms: int) -> datetime | None:
+    return datetime.fromtimestamp(time_ms / 1000) if time_ms else None
+
+
 def _from_proto_measurement(measurement: events_pb2.Measurement) -> Measurement:
     spec = _from_proto_spec(measurement.spec)
-    value: object = measurement.value
-    if spec.type == "boolean":
-        value = measurement.value.lower() == "true"
-    elif spec.type == "numeric":
+    value = _decode_measurement_value(spec.type, measurement.value)
+    return Measurement(value=value, passed=measurement.passed, spec=spec)
+
+
+def _decode_measurement_value(spec_type: str, raw: str):
+    if spec_type == "boolean":
+        return raw.lower() == "true"
+    if spec_type == "numeric":
         try:
-            value = float(measurement.value)
+            return float(raw)
         except ValueError:
-            value = measurement.value
-    return Measurement(value=value, passed=measurement.passed, spec=spec)
+            return raw
+    return raw
 
 
 def _from_proto_spec(spec: events_pb2.Spec):
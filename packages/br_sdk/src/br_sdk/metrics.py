@@ -0,0 +1,54 @@
+from bisect import bisect_left
+
+# Geometric bucket bounds (ratio 2**0.25) from 1 us to ~68 s, in nanoseconds
+_BUCKET_BOUNDS_NS = [int(1000 * 2 ** (i / 4)) for i in range(105)]
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self._counts = [0] * (len(_BUCKET_BOUNDS_NS) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns: int | None = None
+        self.max_ns = 0
+
+    def record(self, latency_ns: int):
+        latency_ns = max(latency_ns, 0)
+        self._counts[bisect_left(_BUCKET_BOUNDS_NS, latency_ns)] += 1
+        self.count += 1
+        self.total_ns += latency_ns
+        if self.min_ns is None or latency_ns < self.min_ns:
+            self.min_ns = latency_ns
+        if latency_ns > self.max_ns:
+            self.max_ns = latency_ns
+
+    def percentile(self, q: float) -> float:
+        if not 0 <= q <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {q}")
+        if self.count == 0:
+            return 0.0
+        rank = max(1, round(q / 100 * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                bound = _BUCKET_BOUNDS_NS[index] if index < len(_BUCKET_BOUNDS_NS) else self.max_ns
+                return min(bound, self.max_ns) / 1000
+        return self.max_ns / 1000
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_us": self.total_ns / self.count / 1000 if self.count else 0.0,
+            "min_us": (self.min_ns or 0) / 1000,
+            "p50_us": self.percentile(50),
+            "p99_us": self.percentile(99),
+            "max_us": self.max_ns / 1000,
+        }
+
+
+def format_latency(name: str, snapshot: dict[str, float]) -> str:
+    return (
+        f"{name}: n={snapshot['count']} mean={snapshot['mean_us']:.1f}us "
+        f"p50={snapshot['p50_us']:.1f}us p99={snapshot['p99_us']:.1f}us max={snapshot['max_us']:.1f}us"
+    )
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import sys
+from importlib.metadata import EntryPoint, entry_points
+from pathlib import Path
+from typing import Optional
+
+SEQUENCE_GROUP = "sequences"
+
+
+def default_cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "benderr"
+
+
+def installed_fingerprint() -> str:
+    # Installing, upgrading or removing a distribution adds or replaces its *.dist-info directory,
+    # which changes the mtime of the containing sys.path entry. One stat per entry, no metadata reads.
+    digest = hashlib.sha256()
+    for entry in sys.path:
+        try:
+            mtime = os.stat(entry or ".").st_mtime_ns
+        except OSError:
+            mtime = None
+        digest.update(f"{entry}\0{mtime}\n".encode())
+    return digest.hexdigest()
+
+
+class EntryPointRegistry:
+    # Name -> "module:attr" index of one entry point group, cached on disk per interpreter.
+    # Only the requested entry point is imported; scanning every distribution happens only
+    # when the installed distributions changed since the index was written.
+
+    def __init__(self, group: str, cache_dir: Optional[Path] = None):
+        self.group = group
+        key = hashlib.sha256(f"{sys.prefix}\0{group}".encode()).hexdigest()[:16]
+        self.cache_path = (cache_dir or default_cache_dir()) / f"entry_points_{key}.json"
+        self._index: Optional[dict[str, str]] = None
+
+    def names(self) -> list[str]:
+        return list(self._get_index())
+
+    def modules(self) -> list[str]:
+        index = self._get_index()
+        return list(dict.fromkeys(self._entry_point(name, value).module for name, value in index.items()))
+
+    def load(self, name: str):
+        value = self._get_index().get(name)
+        if value is None:
+            # a distribution may have been installed without touching a sys.path entry (e.g. a .pth change)
+            value = self.refresh().get(name)
+        if value is None:
+            raise ValueError(f"'{name}' not found in entry point group '{self.group}'. Available: {self.names()}")
+        try:
+            return self._entry_point(name, value).load()
+        except ImportError:
+            # the index may be stale if the module moved within an installed distribution
+            fresh = self.refresh().get(name)
+            if fresh == value:
+                raise
+        if fresh is None:
+            raise ValueError(f"'{name}' not found in entry point group '{self.group}'. Available: {self.names()}")
+        return self._entry_point(name, fresh).load()
+
+    def refresh(self) -> dict[str, str]:
+        return self._scan(installed_fingerprint())
+
+    def _get_index(self) -> dict[str, str]:
+        if self._index is None:
+            fingerprint = installed_fingerprint()
+            cached = self._read()
+            if cached and cached.get("fingerprint") == fingerprint:
+                self._index = cached["entry_points"]
+            else:
+                self._scan(fingerprint)
+        return self._index
+
+    def _scan(self, fingerprint: str) -> dict[str, str]:
+        self._index = {ep.name: ep.value for ep in entry_points(group=self.group)}
+        self._write(fingerprint, self._index)
+        return self._index
+
+    def _entry_point(self, name: str, value: str) -> EntryPoint:
+        return EntryPoint(name=name, value=value, group=self.group)
+
+    def _read(self) -> Optional[dict]:
+        try:
+            with self.cache_path.open(encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return cached if isinstance(cached, dict) and isinstance(cached.get("entry_points"), dict) else None
+
+    def _write(self, fingerprint: str, index: dict[str, str]):
+        # the cache is an optimization, a read-only home directory must not break a run
+        tmp = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps({"fingerprint": fingerprint, "entry_points": index}), encoding="utf-8")
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+
+_sequences: Optional[EntryPointRegistry] = None
+
+
+def sequence_registry() -> EntryPointRegistry:
+    global _sequences
+    if _sequences is None:
+        _sequences = EntryPointRegistry(SEQUENCE_GROUP)
+    return _sequences
+
+
+def load_sequence(name: str):
+    return sequence_registry().load(name)
@@ -11,3 +11,8 @@ class JsonReportFormatter(ReportFormatter):
     
     def format(self, data: SequenceResult):
         return TypeAdapter(SequenceResult).dump_json(data, indent=2).decode("utf-8")
+
+
+def load_report(file_path) -> SequenceResult:
+    with open(file_path) as f:
+        return TypeAdapter(SequenceResult).validate_json(f.read())
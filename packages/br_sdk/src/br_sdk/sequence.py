@@ -2,10 +2,12 @@ import logging
 import numbers
 import tempfile
 from abc import ABC
+from contextlib import nullcontext
 from datetime import datetime
 from functools import wraps
 from itertools import count
 from pathlib import Path
+from typing import Callable, ContextManager
 
 from br_sdk.br_types import (
     BooleanSpec,
@@ -19,13 +21,20 @@ from br_sdk.br_types import (
     Step,
     StepCountError,
     StepFailure,
+    StepProgress,
     StepResult,
     StepsConfigError,
     StringSpec,
     Verdict,
 )
 from br_sdk.config import AppConfig
-from br_sdk.events import ensure_event_server, publish_step_ended, publish_step_started
+from br_sdk.events import (
+    has_event_subscribers,
+    publish_step_ended,
+    publish_step_progress,
+    publish_step_started,
+    start_run_event_server,
+)
 from br_sdk.report import ReportFormatter
 
 
@@ -47,23 +56,36 @@ class Sequence(ABC):
         self._sequence_config = sequence_config or {}
         self._stop_at_step_fail = self._sequence_config.get("stop_at_step_fail", True)
         self._registered_steps = self._collect_step_methods()
+        self._active_step: tuple[Step, StepResult] | None = None
+        self._streamed_count = 0
+        # called with "setup", each step name and "cleanup"; the returned context manager wraps that phase
+        self.phase_hook: Callable[[str], ContextManager] | None = None
         if not self._configless:
             self._validate_steps(self._steps)
 
-    def run(self):
-        ensure_event_server()
-        self._init_run()
+    def run(self, retest: SequenceResult | None = None, run_name: str | None = None):
+        selected = self._retest_indices(retest) if retest else None
+        start_run_event_server()
+        self._init_run(run_name)
         run_exception: Exception | None = None
         try:
-            self.setup()
-            for step in self._registered_steps:
+            with self._phase("setup"):
+                self.setup()
+            for index, step in enumerate(self._registered_steps):
+                if selected is not None:
+                    if index not in selected:
+                        continue
+                    self._config_index = index
                 try:
                     step["method"]()
                 except Exception as exc:
                     run_exception = exc
                     break
         finally:
-            self.cleanup()
+            with self._phase("cleanup"):
+                self.cleanup()
+            if retest:
+                self._step_results = self._merge_results(retest.step_results)
             if self._should_write_report():
                 self._write_report()
         if run_exception:
@@ -96,6 +118,71 @@ class Sequence(ABC):
     def step_results(self):
         return self._step_results    
 
+    def verdict(self) -> Verdict:
+        for step in self._step_results:
+            if step.verdict != Verdict.PASSED:
+                return step.verdict
+        return Verdict.PASSED
+
+    def measure(self, spec_name: str, value) -> Measurement | None:
+        config_step, step_result = self._require_active_step("measure")
+        if self._configless:
+            spec = NoSpec(spec_name, NoSpecAction.LOG)
+        else:
+            spec = next((s for s in config_step.specs if s.name == spec_name), None)
+            if spec is None:
+                raise SpecMismatch(f"Step '{config_step.name}' has no spec named '{spec_name}'")
+        if isinstance(spec, NoSpec) and spec.action == NoSpecAction.IGNORE:
+            return None
+        if isinstance(spec, NoSpec):
+            measurement = Measurement(self._normalize_measurement_value(value), True, spec)
+        else:
+            measurement = Measurement(value, Sequence._measurement_passes(value, spec), spec)
+        step_result.results.append(measurement)
+        self._streamed_count = len(step_result.results)
+        if not measurement.passed:
+            self.logger.warning("Measurement '%s' failed in step '%s': %s", spec_name, config_step.name, value)
+        if has_event_subscribers():
+            publish_step_progress(StepProgress(config_step.id, config_step.name, measurements=[measurement]))
+        return measurement
+
+    def report_progress(self, progress: float | None = None, message: str = ""):
+        config_step, _ = self._require_active_step("report_progress")
+        if has_event_subscribers():
+            publish_step_progress(StepProgress(config_step.id, config_step.name, progress=progress, message=message))
+
+    def _retest_indices(self, previous: SequenceResult) -> set[int]:
+        if self._configless:
+            raise ValueError("Retest needs a steps config")
+        # a report of another sequence or config revision must not be merged into this one
+        steps = {(step.id, step.name) for step in self._steps}
+        unknown = [f"{r.id} '{r.name}'" for r in previous.step_results if (r.id, r.name) not in steps]
+        if unknown:
+            raise ValueError(f"Retest report does not match the steps config, unknown steps: {', '.join(unknown)}")
+        # failed, aborted and never executed steps run again, together with their prerequisites
+        done = {r.id for r in previous.step_results if r.verdict not in (Verdict.FAILED, Verdict.ABORTED)}
+        index_by_id = {step.id: index for index, step in enumerate(self._steps)}
+        pending = [step.id for step in self._steps if step.id not in done]
+        selected: set[int] = set()
+        while pending:
+            step_id = pending.pop()
+            index = index_by_id[step_id]
+            if index not in selected:
+                selected.add(index)
+                pending.extend(self._steps[index].requires)
+        return selected
+
+    def _merge_results(self, previous: list[StepResult]) -> list[StepResult]:
+        merged = {r.id: r for r in previous}
+        merged.update({r.id: r for r in self._step_results})
+        order = {step.id: index for index, step in enumerate(self._steps)}
+        return sorted(merged.values(), key=lambda r: order.get(r.id, len(order)))
+
+    def _require_active_step(self, caller: str) -> tuple[Step, StepResult]:
+        if self._active_step is None:
+            raise RuntimeError(f"{caller}() can only be called while a step is running")
+        return self._active_step
+
     @staticmethod
     def _assert_step_definition(fn):
         if not callable(fn):
@@ -106,8 +193,10 @@ class Sequence(ABC):
     def _should_write_report(self):
         return not self._configless and AppConfig.get("report_enabled", False) and self._report_formatter
 
-    def _init_run(self):
+    def _init_run(self, run_name: str | None = None):
         self.start_time = datetime.now()
+        # names the log and report files, runs within the same second need distinct names
+        self._run_name = run_name or self.start_time.strftime("%Y%m%d_%H%M%S")
         self._config_index = 0
         self._log_path = self._reset_log_file() if AppConfig.get("log_to_file", False) else None
 
@@ -118,10 +207,9 @@ class Sequence(ABC):
                 logger.removeHandler(h)
                 h.close()
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_dir = Path(AppConfig.get("output_dir", tempfile.gettempdir()))
         log_dir.mkdir(parents=True, exist_ok=True)
-        log_path = log_dir / f"{timestamp}_run.log"
+        log_path = log_dir / f"{self._run_name}_run.log"
 
         fh = logging.FileHandler(log_path)
         fh.setLevel(AppConfig.get("log_level_file", logging.DEBUG))
@@ -131,15 +219,10 @@ class Sequence(ABC):
         return log_path
 
     def _write_report(self):
-        verdict = Verdict.PASSED
-        for step in self._step_results:
-            if step.verdict != Verdict.PASSED:
-                verdict = step.verdict
-                break
+        verdict = self.verdict()
         log_file = str(self._log_path) if self._log_path else ""
         now = datetime.now()
-        timestamp = now.strftime("%Y%m%d_%H%M%S")
-        filename = timestamp + "_report" + self._report_formatter.ext
+        filename = self._run_name + "_report" + self._report_formatter.ext
         report_path = Path(AppConfig.get("output_dir")) / filename
         report = SequenceResult(self.start_time, now, log_file, verdict, self._step_results)
         with open(report_path, "w") as f:
@@ -288,49 +371,49 @@ class Sequence(ABC):
             )
         verdict = Verdict.PASSED
         for value, spec in zip(result_list, specs, strict=True):
-            if isinstance(value, bool):
-                if not isinstance(spec, BooleanSpec):
-                    raise SpecMismatch(
-                        f"Boolean result encountered but spec does not define a boolean check: {spec}"
-                    )
-                passed = Sequence._boolean_spec_passes(value, spec)
-            elif isinstance(value, numbers.Number):
-                if not isinstance(spec, NumericSpec):
-                    raise SpecMismatch(
-                        f"Numeric result encountered but spec does not define a numeric test: {spec}"
-                    )
-                passed = Sequence._numeric_test_passes(value, spec)
-            elif isinstance(value, str):
-                if not isinstance(spec, StringSpec):
-                    raise SpecMismatch(
-                        f"String result encountered but spec does not define a string check: {spec}"
-                    )
-                if spec.case_sensitive:
-                    passed = value == spec.expected
-                else:
-                    passed = value.lower() == spec.expected.lower()
-            else:
-                raise SpecMismatch(
-                    f"Unsupported result type '{type(value).__name__}' in sequence; "
-                    "only bool, numeric, and string supported"
-                )
+            passed = Sequence._measurement_passes(value, spec)
             step_result.results.append(Measurement(value, passed, spec))
             if not passed:
                 verdict = Verdict.FAILED
         step_result.verdict = verdict
         return step_result
 
+    @staticmethod
+    def _measurement_passes(value, spec) -> bool:
+        if isinstance(value, bool):
+            if not isinstance(spec, BooleanSpec):
+                raise SpecMismatch(f"Boolean result encountered but spec does not define a boolean check: {spec}")
+            return Sequence._boolean_spec_passes(value, spec)
+        if isinstance(value, numbers.Number):
+            if not isinstance(spec, NumericSpec):
+                raise SpecMismatch(f"Numeric result encountered but spec does not define a numeric test: {spec}")
+            return Sequence._numeric_test_passes(value, spec)
+        if isinstance(value, str):
+            if not isinstance(spec, StringSpec):
+                raise SpecMismatch(f"String result encountered but spec does not define a string check: {spec}")
+            if spec.case_sensitive:
+                return value == spec.expected
+            return value.lower() == spec.expected.lower()
+        raise SpecMismatch(
+            f"Unsupported result type '{type(value).__name__}' in sequence; "
+            "only bool, numeric, and string supported"
+        )
+
     def _validate_steps(self, config_steps: list[Step]):
         registered = self._registered_steps
         if len(registered) != len(config_steps):
             raise StepCountError(
                 f"Executable steps count ({len(registered)}) do not match configured steps count({len(config_steps)}!)"
             )
+        ids = {step.id for step in config_steps}
         for index, step in enumerate(config_steps):
             if registered[index]["config_name"] != step.name:
                 raise StepsConfigError(
                     f"Declared step with name {registered[index]['config_name']} differs from config {step.name}"
                 )
+            unknown = [step_id for step_id in step.requires if step_id not in ids]
+            if unknown:
+                raise StepsConfigError(f"Step {step.name} requires unknown step ids {unknown}")
 
     def _collect_step_methods(self):
         steps = []
@@ -381,7 +464,8 @@ class Sequence(ABC):
         config_step, step_result = self._init_run_configured_step(expected_step_name)
         result = None
         try:
-            result = Sequence._execute(func, self, *args, **kwargs)
+            with self._phase(config_step.name):
+                result = Sequence._execute(func, self, *args, **kwargs)
             step_result = self._evaluate_result(result, step_result, config_step)
         except Exception as exc:
             self.logger.exception("Unexpected error during sequence execution")
@@ -392,25 +476,52 @@ class Sequence(ABC):
         self._check_skip_fail(step_result, config_step)
         return result
 
+    def _phase(self, name: str) -> ContextManager:
+        return self.phase_hook(name) if self.phase_hook else nullcontext()
+
     def _init_run_configured_step(self, expected_step_name) -> tuple[Step, StepResult]:
         config_step = self._next_config_step(expected_step_name)
         publish_step_started(config_step)
         self.logger.info(f"Start step: {config_step.name}")
-        return config_step, StepResult(config_step.id, config_step.name, datetime.now())
+        step_result = StepResult(config_step.id, config_step.name, datetime.now())
+        self._active_step = (config_step, step_result)
+        self._streamed_count = 0
+        return config_step, step_result
 
     def _evaluate_result(self, result, step_result: StepResult, config_step: Step):
         if self._configless:
             step_result.verdict = Verdict.SKIPPED
+        elif self._streamed_count:
+            step_result = self._test_streamed(result, step_result, config_step.specs)
         else:
             step_result = self._test(result, step_result, config_step.specs)
         return step_result
 
+    def _test_streamed(self, result, step_result: StepResult, specs) -> StepResult:
+        streamed_names = {m.spec.name for m in step_result.results}
+        remaining = [spec for spec in specs if spec.name not in streamed_names]
+        step_result.verdict = Verdict.PASSED
+        if result is not None and remaining:
+            step_result = self._test(result, step_result, remaining)
+        measured = {m.spec.name for m in step_result.results}
+        missing = [
+            spec.name
+            for spec in specs
+            if spec.name not in measured and not (isinstance(spec, NoSpec) and spec.action == NoSpecAction.IGNORE)
+        ]
+        if missing:
+            raise SpecMismatch(f"Step '{step_result.name}' has no measurement for specs: {missing}")
+        if any(not m.passed for m in step_result.results):
+            step_result.verdict = Verdict.FAILED
+        return step_result
+
     def _finalize_run_configured_step(self, step_result: StepResult, config_step: Step):
         step_result.end_time = datetime.now()
         self.logger.info(f"Result from step {config_step.name}: {step_result}")
         self.logger.info(f"End step: {config_step.name}")
         self._step_results.append(step_result)
-        publish_step_ended(step_result)
+        self._active_step = None
+        publish_step_ended(step_result, self._streamed_count)
         return step_result
 
     def _check_skip_fail(self, step_result: StepResult, config_step: Step):
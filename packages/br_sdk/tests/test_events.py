@@ -1,26 +1,40 @@
 import copy
 import queue
+import threading
 import time
 from datetime import datetime
 
 import pytest
+from br_sdk import events
 from br_sdk.br_types import (
     BooleanSpec,
     Measurement,
     NoSpec,
     NoSpecAction,
+    NumericComparator,
+    NumericSpec,
     Step,
+    StepProgress,
     StepResult,
     Verdict,
 )
 from br_sdk.config import AppConfig
 from br_sdk.events import (
+    AGENT_CLIENT,
+    EVENT_SOCKET_ENV,
+    MAX_CLOSED_SUBSCRIBERS,
     EventSubscriber,
+    StepResultView,
+    _EventStream,
+    _to_proto_step_result,
     ensure_event_server,
+    event_server_stats,
     publish_log,
     publish_step_ended,
+    publish_step_progress,
     publish_step_started,
     shutdown_event_server,
+    start_run_event_server,
 )
 
 
@@ -96,9 +110,88 @@ def test_event_roundtrip(event_config):
     assert payload[0] == "Hello"
     assert payload[1] == "INFO"
 
+    latency = subscriber.latency_stats()
+    assert latency["publish_to_callback"]["count"] == 3
+    assert latency["send_to_receive"]["count"] == 3
+    server_stats = event_server_stats()
+    assert len(server_stats) == 1
+    assert server_stats[0]["publish_to_send"]["count"] == 3
+    assert server_stats[0]["max_queue_depth"] >= 1
+
+    subscriber.stop(grace_period=0.1)
+
+
+def test_streamed_measurements_merged_into_step_ended(event_config):
+    received = queue.Queue()
+
+    server = ensure_event_server()
+    subscriber = EventSubscriber(
+        on_step_started=lambda step: received.put(("started", step)),
+        on_step_ended=lambda result: received.put(("ended", result)),
+        on_log=lambda message, level: None,
+        on_step_progress=lambda progress: received.put(("progress", progress)),
+        address=server.address,
+    )
+    subscriber.start()
+    assert subscriber.wait_until_ready(timeout=2.0)
+    time.sleep(0.1)
+
+    step = Step(7, "Burn-in", [])
+    spec = BooleanSpec("stable", True)
+    streamed = Measurement(False, False, spec)
+    publish_step_started(step)
+    assert received.get(timeout=2.0)[0] == "started"
+
+    publish_step_progress(StepProgress(step.id, step.name, progress=0.5, message="halfway"))
+    event_type, payload = received.get(timeout=2.0)
+    assert event_type == "progress"
+    assert payload.progress == 0.5
+    assert payload.message == "halfway"
+    assert payload.measurements == []
+
+    publish_step_progress(StepProgress(step.id, step.name, measurements=[streamed]))
+    event_type, payload = received.get(timeout=2.0)
+    assert event_type == "progress"
+    assert payload.progress is None
+    assert payload.measurements[0].spec.name == "stable"
+    assert not payload.measurements[0].passed
+
+    final = Measurement(True, True, BooleanSpec("final", True))
+    result = StepResult(step.id, step.name, verdict=Verdict.FAILED, results=[streamed, final])
+    publish_step_ended(result, streamed_measurements=1)
+    event_type, payload = received.get(timeout=2.0)
+    assert event_type == "ended"
+    assert [m.spec.name for m in payload.results] == ["stable", "final"]
+
     subscriber.stop(grace_period=0.1)
 
 
+def test_step_result_view_decodes_lazily():
+    spec = NumericSpec("voltage", NumericComparator.GTLT, 0, 10, "V")
+    result = StepResult(
+        3,
+        "Measure",
+        start_time=datetime(2025, 1, 1, 12, 0, 0),
+        end_time=datetime(2025, 1, 1, 12, 0, 1),
+        verdict=Verdict.FAILED,
+        results=[Measurement(12.5, False, spec)],
+    )
+    view = StepResultView(_to_proto_step_result(result))
+    assert view.verdict == Verdict.FAILED
+    assert view._results is None
+
+    measurement = view.results[0]
+    assert measurement.passed is False
+    assert measurement._spec is None
+    assert measurement.value == 12.5
+    assert measurement.spec.upper == 10
+    assert view.end_time == datetime(2025, 1, 1, 12, 0, 1)
+
+    materialized = view.materialize()
+    assert isinstance(materialized, StepResult)
+    assert materialized == result
+
+
 def test_shutdown_removes_socket(event_config):
     ensure_event_server()
     socket_path = event_config
@@ -112,3 +205,105 @@ def test_shutdown_removes_socket(event_config):
 
     shutdown_event_server()
     assert not socket_path.exists()
+
+
+def test_publish_without_subscribers_skips_proto_construction(event_config, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("event was built without subscribers")
+
+    monkeypatch.setattr(events, "_to_proto_step", fail)
+    # no server at all, then a server nobody is connected to
+    publish_step_started(Step(1, "Step 1"))
+    server = ensure_event_server()
+    assert not server.has_subscribers
+    publish_step_started(Step(1, "Step 1"))
+    server.publish_step_started(Step(1, "Step 1"))
+
+
+def test_run_event_server_modes(event_config, monkeypatch):
+    monkeypatch.delenv(EVENT_SOCKET_ENV, raising=False)
+    assert start_run_event_server() is None
+
+    AppConfig._config["event_subscriber_timeout"] = 0.01
+    monkeypatch.setenv(EVENT_SOCKET_ENV, str(event_config))
+    assert start_run_event_server() is not None
+    shutdown_event_server()
+
+    AppConfig._config["event_server"] = "off"
+    assert start_run_event_server() is None
+
+    AppConfig._config["event_server"] = "on"
+    monkeypatch.delenv(EVENT_SOCKET_ENV)
+    assert start_run_event_server() is not None
+
+    AppConfig._config["event_server"] = "sometimes"
+    with pytest.raises(ValueError):
+        start_run_event_server()
+
+
+def test_run_waits_for_the_agent_to_subscribe(event_config, monkeypatch):
+    monkeypatch.setenv(EVENT_SOCKET_ENV, str(event_config))
+    received = queue.Queue()
+    # the agent connects before the socket exists and keeps retrying
+    subscriber = EventSubscriber(
+        on_step_started=lambda step: received.put(step.name),
+        on_step_ended=lambda result: None,
+        on_log=lambda message, level: None,
+        address=f"unix://{event_config}",
+        client=AGENT_CLIENT,
+    )
+    subscriber.start()
+    time.sleep(0.2)
+    try:
+        start_run_event_server()
+        publish_step_started(Step(1, "Step 1"))
+        assert received.get(timeout=2.0) == "Step 1"
+    finally:
+        subscriber.stop()
+
+
+def _subscribe(stream: _EventStream, received: list):
+    request = events.events_pb2.SubscribeRequest()
+    thread = threading.Thread(target=lambda: received.extend(stream.Subscribe(request, None)))
+    thread.start()
+    while not stream.has_subscribers:
+        time.sleep(0.001)
+    return thread
+
+
+def test_stream_serializes_once_and_stamps_each_send():
+    stream = _EventStream()
+    first, second = [], []
+    threads = [_subscribe(stream, first), _subscribe(stream, second)]
+    while len(stream._subscribers) < 2:
+        time.sleep(0.001)
+
+    event = events.events_pb2.Event(
+        log=events.events_pb2.LogEvent(message="hello", level="INFO"),
+        timing=events.events_pb2.EventTiming(publish_ns=1),
+    )
+    stream.broadcast(event)
+    stream.shutdown()
+    for thread in threads:
+        thread.join(timeout=2.0)
+
+    for received in (first, second):
+        sent = events.events_pb2.Event.FromString(received[0])
+        assert sent.log.message == "hello"
+        assert sent.timing.publish_ns == 1
+        assert sent.timing.send_ns >= sent.timing.enqueue_ns > 0
+    # the published event is shared and left untouched
+    assert not event.timing.send_ns
+
+
+def test_stream_keeps_stats_of_recent_subscribers_only():
+    stream = _EventStream()
+    for _ in range(MAX_CLOSED_SUBSCRIBERS + 4):
+        thread = _subscribe(stream, [])
+        stream.shutdown()
+        thread.join(timeout=2.0)
+
+    stats = stream.stats()
+    assert len(stats) == MAX_CLOSED_SUBSCRIBERS
+    assert stats[-1]["subscriber"] == MAX_CLOSED_SUBSCRIBERS + 4
+    assert not any(entry["connected"] for entry in stats)
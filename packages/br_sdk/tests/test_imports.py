@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+
+
+def imported_modules(code: str) -> set[str]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_sequence_import_defers_grpc_and_yaml():
+    modules = imported_modules("import br_sdk.sequence")
+    assert "br_sdk.sequence" in modules
+    assert not {name for name in modules if name.split(".")[0] in ("grpc", "yaml")}
+    assert "br_sdk._grpc.events_pb2" not in modules
+
+
+def test_first_publish_loads_grpc(tmp_path):
+    code = (
+        "from br_sdk.events import EventServer\n"
+        "from br_sdk.br_types import Step\n"
+        f"server = EventServer({str(tmp_path / 'events.sock')!r})\n"
+        "server.publish_step_started(Step(1, 'step'))\n"
+        "server.stop()"
+    )
+    modules = imported_modules(code)
+    assert {"grpc", "br_sdk._grpc.events_pb2"} <= modules
@@ -0,0 +1,34 @@
+import pytest
+from br_sdk.metrics import LatencyHistogram
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0.0
+    assert histogram.snapshot()["count"] == 0
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for _ in range(99):
+        histogram.record(10_000)
+    histogram.record(5_000_000)
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 100
+    assert snapshot["min_us"] == 10.0
+    assert snapshot["max_us"] == 5000.0
+    # buckets are ~19% wide
+    assert 10.0 <= snapshot["p50_us"] <= 12.0
+    assert 10.0 <= snapshot["p99_us"] <= 12.0
+    assert histogram.percentile(100) == 5000.0
+
+
+def test_histogram_clamps_negative_latency():
+    histogram = LatencyHistogram()
+    histogram.record(-5)
+    assert histogram.snapshot()["min_us"] == 0.0
+
+
+def test_histogram_rejects_invalid_percentile():
+    with pytest.raises(ValueError):
+        LatencyHistogram().percentile(101)
@@ -0,0 +1,59 @@
+import sys
+
+import pytest
+from br_sdk import registry
+from br_sdk.registry import EntryPointRegistry
+
+
+def install(site, module: str, names: list[str]):
+    (site / f"{module}.py").write_text("class Sequence:\n    pass\n")
+    dist_info = site / f"{module}-0.1.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {module}\nVersion: 0.1\n")
+    lines = "".join(f"{name} = {module}:Sequence\n" for name in names)
+    (dist_info / "entry_points.txt").write_text(f"[test_sequences]\n{lines}")
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    site = tmp_path / "site"
+    site.mkdir()
+    monkeypatch.syspath_prepend(str(site))
+    yield site
+    for name in list(sys.modules):
+        if name.startswith("reg_"):
+            del sys.modules[name]
+
+
+def test_load_imports_only_the_requested_entry_point(tmp_path, site):
+    install(site, "reg_first", ["first"])
+    install(site, "reg_second", ["second"])
+    sequences = EntryPointRegistry("test_sequences", cache_dir=tmp_path / "cache")
+
+    assert sorted(sequences.names()) == ["first", "second"]
+    assert sequences.load("second").__module__ == "reg_second"
+    assert "reg_first" not in sys.modules
+    with pytest.raises(ValueError, match="not found"):
+        sequences.load("missing")
+
+
+def test_cached_index_skips_metadata_scan(tmp_path, site, monkeypatch):
+    install(site, "reg_cached", ["cached"])
+    EntryPointRegistry("test_sequences", cache_dir=tmp_path / "cache").names()
+
+    def fail(**kwargs):
+        raise AssertionError("entry points were scanned")
+
+    monkeypatch.setattr(registry, "entry_points", fail)
+    sequences = EntryPointRegistry("test_sequences", cache_dir=tmp_path / "cache")
+    assert sequences.load("cached").__module__ == "reg_cached"
+
+
+def test_index_is_rebuilt_when_distributions_change(tmp_path, site):
+    install(site, "reg_old", ["old"])
+    assert EntryPointRegistry("test_sequences", cache_dir=tmp_path / "cache").names() == ["old"]
+
+    install(site, "reg_new", ["new"])
+    sequences = EntryPointRegistry("test_sequences", cache_dir=tmp_path / "cache")
+    assert sorted(sequences.names()) == ["new", "old"]
+    assert sequences.load("new").__module__ == "reg_new"
@@ -9,11 +9,13 @@ from br_sdk.br_types import (
     NoSpecAction,
     NumericComparator,
     NumericSpec,
+    SequenceResult,
     SpecMismatch,
     Step,
     StepCountError,
     StepFailure,
     StepResult,
+    StepsConfigError,
     StringSpec,
     Verdict,
 )
@@ -987,5 +989,166 @@ def test_sequence_cleanup_runs_on_setup_error():
     assert hook_log == ["setup", "cleanup"]
 
 
+class TestSequenceStreamed(Sequence):
+    __test__ = False
+
+    def __init__(self, steps=None, readings=(1.0, 2.0), result=True):
+        self.readings = readings
+        self.result = result
+        super().__init__(steps, sequence_config={"stop_at_step_fail": False})
+
+    @Sequence.step("Burn-in")
+    def test_burn_in(self):
+        for i, reading in enumerate(self.readings):
+            self.report_progress(i / len(self.readings))
+            self.measure("Temperature", reading)
+        return self.result
+
+
+def test_streamed_measurements_evaluated_incrementally():
+    steps = [
+        Step(
+            1,
+            "Burn-in",
+            [NumericSpec("Temperature", NumericComparator.LT, None, 5.0), BooleanSpec("Done", pass_if_true=True)],
+        )
+    ]
+    sequence = TestSequenceStreamed(steps)
+    sequence.run()
+    result = sequence.step_results()[0]
+    assert result.verdict == Verdict.PASSED
+    assert [m.spec.name for m in result.results] == ["Temperature", "Temperature", "Done"]
+    assert all(m.passed for m in result.results)
+
+
+def test_streamed_measurement_failure_fails_step():
+    steps = [Step(1, "Burn-in", [NumericSpec("Temperature", NumericComparator.LT, None, 5.0)])]
+    sequence = TestSequenceStreamed(steps, readings=(1.0, 9.0, 2.0))
+    sequence.run()
+    result = sequence.step_results()[0]
+    assert result.verdict == Verdict.FAILED
+    assert [m.passed for m in result.results] == [True, False, True]
+
+
+def test_streamed_measurement_unknown_spec():
+    steps = [Step(1, "Burn-in", [NumericSpec("Voltage", NumericComparator.LT, None, 5.0)])]
+    sequence = TestSequenceStreamed(steps)
+    with pytest.raises(SpecMismatch):
+        sequence.run()
+    assert sequence.step_results()[0].verdict == Verdict.ABORTED
+
+
+def test_streamed_measurement_missing_spec_aborts_step():
+    steps = [
+        Step(
+            1,
+            "Burn-in",
+            [NumericSpec("Temperature", NumericComparator.LT, None, 5.0), BooleanSpec("Done", pass_if_true=True)],
+        )
+    ]
+    sequence = TestSequenceStreamed(steps, result=None)
+    with pytest.raises(SpecMismatch, match="Done"):
+        sequence.run()
+    assert sequence.step_results()[0].verdict == Verdict.ABORTED
+
+
+def test_streamed_measurement_configless():
+    sequence = TestSequenceStreamed()
+    sequence.run()
+    result = sequence.step_results()[0]
+    assert result.verdict == Verdict.SKIPPED
+    assert [m.value for m in result.results] == [1.0, 2.0]
+    assert all(isinstance(m.spec, NoSpec) for m in result.results)
+
+
+def test_measure_outside_step_raises():
+    sequence = TestSequenceStreamed([Step(1, "Burn-in", [])])
+    with pytest.raises(RuntimeError):
+        sequence.measure("Temperature", 1.0)
+
+
+class TestSequenceRetest(Sequence):
+    __test__ = False
+
+    def __init__(self, steps, values):
+        super().__init__(steps, sequence_config={"stop_at_step_fail": False})
+        self.values = values
+        self.setups = 0
+        self.executed = []
+
+    def setup(self):
+        self.setups += 1
+
+    def _value(self, name):
+        self.executed.append(name)
+        return self.values[name]
+
+    @Sequence.step("Calibrate")
+    def test_calibrate(self):
+        return self._value("Calibrate")
+
+    @Sequence.step("Supply")
+    def test_supply(self):
+        return self._value("Supply")
+
+    @Sequence.step("Current")
+    def test_current(self):
+        return self._value("Current")
+
+    @Sequence.step("Firmware")
+    def test_firmware(self):
+        return self._value("Firmware")
+
+
+def retest_steps():
+    return [
+        Step(1, "Calibrate", [BooleanSpec("Calibrated", pass_if_true=True)]),
+        Step(2, "Supply", [NumericSpec("Voltage", NumericComparator.GT, 4.5, None)]),
+        Step(3, "Current", [NumericSpec("Current", NumericComparator.LT, None, 1.0)], requires=[1]),
+        Step(4, "Firmware", [StringSpec("Version", "1.2")]),
+    ]
+
+
+def test_retest_runs_only_failed_steps_and_prerequisites():
+    values = {"Calibrate": True, "Supply": 5.0, "Current": 2.0, "Firmware": "1.1"}
+    first = TestSequenceRetest(retest_steps(), values)
+    first.run()
+    previous = SequenceResult(verdict=Verdict.FAILED, step_results=first.step_results())
+
+    second = TestSequenceRetest(retest_steps(), dict(values, Current=0.5, Firmware="1.2"))
+    second.run(retest=previous)
+    assert second.setups == 1
+    assert second.executed == ["Calibrate", "Current", "Firmware"]
+    results = second.step_results()
+    assert [r.name for r in results] == ["Calibrate", "Supply", "Current", "Firmware"]
+    assert all(r.verdict == Verdict.PASSED for r in results)
+    assert results[1] is previous.step_results[1]
+
+
+def test_retest_reruns_steps_missing_from_report():
+    values = {"Calibrate": True, "Supply": 5.0, "Current": 0.5, "Firmware": "1.2"}
+    previous = SequenceResult(step_results=[StepResult(1, "Calibrate", verdict=Verdict.PASSED)])
+    sequence = TestSequenceRetest(retest_steps(), values)
+    sequence.run(retest=previous)
+    # Calibrate passed before but is a prerequisite of Current
+    assert sequence.executed == ["Calibrate", "Supply", "Current", "Firmware"]
+
+
+def test_retest_rejects_report_of_other_steps_config():
+    values = {"Calibrate": True, "Supply": 5.0, "Current": 0.5, "Firmware": "1.2"}
+    previous = SequenceResult(step_results=[StepResult(2, "Voltage check", verdict=Verdict.PASSED)])
+    sequence = TestSequenceRetest(retest_steps(), values)
+    with pytest.raises(ValueError, match="2 'Voltage check'"):
+        sequence.run(retest=previous)
+    assert sequence.executed == []
+
+
+def test_unknown_prerequisite_rejected():
+    steps = retest_steps()
+    steps[2].requires = [9]
+    with pytest.raises(StepsConfigError):
+        TestSequenceRetest(steps, {})
+
+
 if __name__ == "__main__":
     pytest.main(args=["-v"])